@@ -11,11 +11,45 @@ from __future__ import annotations
 
 from importlib import metadata as _md
 
-from .api import get_all_player_stats, get_all_team_stats
+from .api import get_all_player_stats, get_all_stats, get_all_team_stats, retry_failed
+from .compact import compact, memory_report
+from .failures import FailureManifest
+from .identity import PlayerIndex, attach_player_ids
+from .latency import HostLatency
+from .planner import Plan, plan
+from .query import query
+from .scoring import Ruleset, score
+from .stats_index import StatsIndex
+from .store import ChangeSet, Dataset, upsert
+from .trends import Trends, add_trends, update_trends
 
 try:  # Resolve version from the distribution metadata
     __version__ = _md.version('nfl-webscraper')
 except _md.PackageNotFoundError:  # pragma: no cover - dev editable fallback
     __version__ = '0.1.2'
 
-__all__ = ['get_all_player_stats', 'get_all_team_stats', '__version__']
+__all__ = [
+    'ChangeSet',
+    'Dataset',
+    'FailureManifest',
+    'HostLatency',
+    'Plan',
+    'PlayerIndex',
+    'Ruleset',
+    'StatsIndex',
+    'Trends',
+    'add_trends',
+    'attach_player_ids',
+    'compact',
+    'get_all_player_stats',
+    'get_all_stats',
+    'get_all_team_stats',
+    'memory_report',
+    'plan',
+    'query',
+    'retry_failed',
+    'score',
+    'update_trends',
+    'upsert',
+    '__version__',
+]
@@ -0,0 +1,214 @@
+"""Materialized aggregate views over the weekly rows of a stored dataset.
+
+Season and team totals used to be recomputed from weekly rows with a
+``group_by`` on every query. The views below are built from the weekly player
+rows already stored (ESPN.com weekly leaders), written as one Parquet file
+each under ``<root>/_aggregates/`` and kept current incrementally: after an
+upsert only the (source, year, category) partitions that changed are
+re-aggregated and their rows replaced in each view.
+
+Views
+-----
+player_season:
+    One row per player per (source, year, season type, category) with summed
+    counting stats, the longest play, games played and the last team seen.
+    Players are keyed by ``player_id`` when the rows have one, else by name
+    and team, so same-named players get separate rows.
+team_week:
+    One row per team per week and category with summed counting stats and,
+    where the rows carry ESPN's ``result`` cell (``'W 27-20'``), the game's
+    outcome and score (``result``, ``points_for``, ``points_against``).
+team_season:
+    One row per team per (source, year, season type, category) with summed
+    counting stats and games played, plus wins, losses, ties and points when
+    results are known.
+
+Rate columns (rank, rating, average) cannot be summed and are left out.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from .schema import _ESPN_COUNTS
+
+if TYPE_CHECKING:
+	from .store import ChangeSet, Dataset
+
+AGGREGATES_DIR = '_aggregates'
+PARTITION_KEYS = ('source', 'year', 'category')
+
+# Counting stats that add up across weeks (the registry's, offense and
+# defense alike); `longest` takes the maximum.
+MAX_COLUMNS = ('longest',)
+SUM_COLUMNS = tuple(c for c in _ESPN_COUNTS if c not in MAX_COLUMNS)
+
+
+def _totals(names: list[str]) -> list[pl.Expr]:
+	return [pl.col(c).sum() for c in SUM_COLUMNS if c in names] + [
+		pl.col(c).max() for c in MAX_COLUMNS if c in names
+	]
+
+
+def player_season(weekly: pl.DataFrame) -> pl.DataFrame:
+	names = weekly.columns
+	keys = ['source', 'year', 'season_type', 'category', 'player']
+	# Same-named players are told apart by their id, or failing that their team
+	if 'player_id' in names:
+		keys.append('player_id')
+	elif 'team' in names:
+		keys.append('team')
+	extra = [pl.col('week').n_unique().alias('games')]
+	if 'team' in names and 'team' not in keys:
+		extra.append(pl.col('team').sort_by('week').last())
+	if 'position' in names:
+		extra.append(pl.col('position').drop_nulls().last())
+	return weekly.group_by(keys, maintain_order=True).agg(*extra, *_totals(names))
+
+
+def _score(result: str) -> list[pl.Expr]:
+	# 'W 27-20' (optionally followed by 'OT') -> outcome, points for, points against
+	parts = pl.col(result).str.extract_groups(r'^\s*([WLT])\s+(\d+)-(\d+)')
+	return [
+		parts.struct.field('1').alias('result'),
+		parts.struct.field('2').cast(pl.Int16).alias('points_for'),
+		parts.struct.field('3').cast(pl.Int16).alias('points_against'),
+	]
+
+
+def team_week(weekly: pl.DataFrame) -> pl.DataFrame:
+	keys = ['source', 'year', 'season_type', 'week', 'category', 'team']
+	extra = []
+	if 'result' in weekly.columns:
+		extra.append(pl.col('result').cast(pl.Utf8).drop_nulls().first())
+	totals = weekly.group_by(keys, maintain_order=True).agg(
+		pl.len().alias('players'), *extra, *_totals(weekly.columns)
+	)
+	return totals.with_columns(_score('result')) if extra else totals
+
+
+def team_season(weekly: pl.DataFrame) -> pl.DataFrame:
+	keys = ['source', 'year', 'season_type', 'category', 'team']
+	weeks = team_week(weekly)
+	extra = []
+	if 'result' in weeks.columns:
+		extra = [
+			*((pl.col('result') == outcome).sum().alias(name)
+				for outcome, name in (('W', 'wins'), ('L', 'losses'), ('T', 'ties'))),
+			pl.col('points_for').sum(),
+			pl.col('points_against').sum(),
+		]
+	return weeks.group_by(keys, maintain_order=True).agg(
+		pl.len().alias('games'), *extra, *_totals(weeks.columns)
+	)
+
+
+VIEWS: dict[str, Callable[[pl.DataFrame], pl.DataFrame]] = {
+	'player_season': player_season,
+	'team_week': team_week,
+	'team_season': team_season,
+}
+
+# Columns a view needs in the weekly rows before it can be built.
+REQUIRED = {
+	'player_season': ('week', 'season_type', 'player'),
+	'team_week': ('week', 'season_type', 'team'),
+	'team_season': ('week', 'season_type', 'team'),
+}
+
+
+class Aggregates:
+	"""The materialized views stored alongside `dataset`."""
+
+	def __init__(self, dataset: Dataset) -> None:
+		self.dataset = dataset
+		self.directory = Path(dataset.root) / AGGREGATES_DIR
+
+	def path(self, name: str) -> Path:
+		if name not in VIEWS:
+			raise KeyError(f'unknown aggregate view {name!r}; choose from {sorted(VIEWS)}')
+		return self.directory / f'{name}.parquet'
+
+	def names(self) -> list[str]:
+		"""Views that have been materialized."""
+		return [name for name in VIEWS if self.path(name).exists()]
+
+	def read(self, name: str) -> pl.DataFrame:
+		path = self.path(name)
+		return pl.read_parquet(path) if path.exists() else pl.DataFrame([])
+
+	def scan(self, name: str) -> pl.LazyFrame:
+		path = self.path(name)
+		return pl.scan_parquet(path) if path.exists() else pl.LazyFrame()
+
+	def refresh(self, changes: ChangeSet | None = None) -> list[str]:
+		"""Bring the views up to date, returning the names of views rewritten.
+
+		With a change set only the partitions it touched are re-aggregated;
+		without one every view is rebuilt from the whole dataset.
+		"""
+		if changes is None:
+			touched = None
+			paths = self.dataset.partitions()
+		else:
+			changed = changes.changed
+			if changed.shape[0] == 0:
+				return []
+			touched = changed.select(PARTITION_KEYS).unique()
+			paths = [
+				self.dataset.partition_path(str(s), int(y), str(c))
+				for s, y, c in touched.iter_rows()
+			]
+		weekly = self._weekly_rows(paths)
+
+		written = []
+		for name, build in VIEWS.items():
+			fresh = None
+			if weekly is not None and all(c in weekly.columns for c in REQUIRED[name]):
+				fresh = build(weekly)
+			path = self.path(name)
+			if touched is not None and path.exists():
+				stored = pl.read_parquet(path)
+				kept = stored.join(
+					touched.cast({k: stored.schema[k] for k in PARTITION_KEYS}),
+					on=list(PARTITION_KEYS),
+					how='anti',
+				)
+				fresh = kept if fresh is None else pl.concat([kept, fresh], how='diagonal_relaxed')
+			if fresh is None:
+				continue
+			self.directory.mkdir(parents=True, exist_ok=True)
+			tmp = path.with_suffix('.tmp')
+			fresh.sort(_sort_keys(fresh)).write_parquet(tmp)
+			os.replace(tmp, path)
+			written.append(name)
+		return written
+
+	def _weekly_rows(self, paths: Iterable[Path]) -> pl.DataFrame | None:
+		frames = []
+		for path in paths:
+			if not path.exists():
+				continue
+			frame = self.dataset.read_partition(path)
+			if 'week' in frame.columns:
+				weekly = pl.col('week').is_not_null()
+				if 'player' in frame.columns:
+					weekly &= pl.col('player').is_not_null()  # not team rows stored alongside
+				frames.append(frame.filter(weekly))
+		frames = [f for f in frames if f.shape[0] > 0]
+		if not frames:
+			return None
+		return pl.concat(frames, how='diagonal_relaxed')
+
+
+def _sort_keys(frame: pl.DataFrame) -> list[str]:
+	order = ('source', 'year', 'season_type', 'week', 'category', 'team', 'player')
+	return [c for c in order if c in frame.columns]
+
+
+__all__ = ['VIEWS', 'Aggregates', 'player_season', 'team_season', 'team_week']
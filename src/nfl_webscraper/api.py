@@ -13,6 +13,8 @@ Architecture:
 Public entry points (synchronous for convenience):
 - `get_all_player_stats(..., sites=...)`
 - `get_all_team_stats(..., sites=...)`
+- `get_all_stats(..., sites=...)` (players and teams from one run)
+- `retry_failed(manifest, frame)`
 
 Async internal orchestrator: `_gather_multi_site_stats` coordinates across scrapers.
 """
@@ -20,13 +22,23 @@ Async internal orchestrator: `_gather_multi_site_stats` coordinates across scrap
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import os
+from collections.abc import Iterator
 from typing import Literal
 
 import httpx
 import polars as pl
 
+from .checkpoint import Checkpoint
+from .compact import compact as compact_frame
+from .failures import Failure, FailureManifest
+from .fingerprint import FingerprintIndex
+from .latency import Deadline, HostLatency, hedging
+from .reshape import CategoryFrames
 from .schema import unify_frames
 from .sites import ESPNScraper, NFLComScraper
+from .spill import DEFAULT_BUDGET, Spill
 
 # Site registry
 SCRAPERS = {
@@ -35,6 +47,26 @@ SCRAPERS = {
 }
 
 SiteName = Literal['nfl.com', 'espn.com']
+Layout = Literal['wide', 'categories', 'long']
+Frames = pl.DataFrame | pl.LazyFrame | dict[str, pl.DataFrame]
+Result = Frames | tuple[Frames, FailureManifest]
+
+
+def _site_scraper(
+    site: SiteName,
+    *,
+    fingerprints: FingerprintIndex | None = None,
+    strategy: str | None = None,
+):
+    """Registered scraper for `site`, or a fresh instance when options are given."""
+    scraper = SCRAPERS[site]
+    if fingerprints is None and strategy is None:
+        return scraper
+    if strategy is None:
+        return type(scraper)(fingerprints=fingerprints)
+    if not hasattr(scraper, 'STRATEGIES'):
+        raise ValueError(f'{site} has no alternative fetch strategies')
+    return type(scraper)(fingerprints=fingerprints, strategy=strategy)
 
 
 async def _gather_multi_site_stats(
@@ -42,9 +74,24 @@ async def _gather_multi_site_stats(
     sites: list[SiteName] | SiteName,
     *,
     player: bool,
+    categories: list[str] | None = None,
+    weeks: list[int] | None = None,
+    season_types: list[str] | None = None,
+    columns: list[str] | None = None,
+    concurrency: int | None = None,
+    checkpoint: str | os.PathLike[str] | None = None,
+    fingerprints: str | os.PathLike[str] | None = None,
+    compact: bool = False,
+    return_failures: bool = False,
+    deadline: float | None = None,
+    hedge: bool | HostLatency = False,
+    spill: bool | str | os.PathLike[str] = False,
+    memory_budget: int = DEFAULT_BUDGET,
+    strategies: dict[SiteName, str] | None = None,
+    layout: Layout = 'wide',
     export: str | None = None,
     filename: str | None = None,
-) -> pl.DataFrame:
+) -> Result:
     """Gather stats from one or multiple sites.
 
     Parameters
@@ -56,6 +103,64 @@ async def _gather_multi_site_stats(
         Site(s) to scrape from. Can be a single site name or list of site names.
     player:
         If True scrape player statistics; otherwise team statistics.
+    categories:
+        Optional subset of stat categories to scrape. Categories a site does not
+        offer are ignored for that site. If None every category is scraped.
+    weeks:
+        Optional week numbers to restrict weekly sources (ESPN.com) to. Sites
+        that only publish season totals (NFL.com) plan nothing when set.
+    season_types:
+        Optional season types to restrict to: 'regular' and/or 'postseason'.
+    columns:
+        Optional stat columns to keep, projected while parsing. Context columns
+        (year, category, source, week, season_type) are always kept.
+    concurrency:
+        Optional per-site limit on concurrent fetches (each scraper has a default).
+    checkpoint:
+        Optional directory for a checkpoint journal. Each completed unit is saved
+        there as it finishes; rerunning with the same directory only fetches the
+        units that are not recorded yet.
+    fingerprints:
+        Optional directory for a page fingerprint index. Pages whose table is
+        unchanged since they were last parsed reuse the stored frame.
+    compact:
+        If True downcast numeric columns to the smallest types holding their
+        observed values (see `compact.compact`) before returning/exporting.
+    return_failures:
+        If True units that fail to fetch are collected instead of raising or
+        being dropped silently, and a ``(frame, FailureManifest)`` tuple is
+        returned; pass the manifest to `retry_failed` to re-fetch just those.
+    deadline:
+        Optional overall budget in seconds. Units still running when it expires
+        are cancelled and the rows fetched so far are returned; with
+        `return_failures` the cut-off units are listed as ``DeadlineExceededError``.
+    hedge:
+        If True (or a `HostLatency` tracker to keep observations across calls)
+        a request still pending after its host's observed p95 response time is
+        duplicated and the first response is used.
+    spill:
+        If True (or a directory) bound memory: completed units are written to
+        Arrow IPC files in a temporary (or the given) directory once
+        `memory_budget` bytes are buffered, and a `pl.LazyFrame` is returned
+        instead of a DataFrame. With `export` the file is streamed from those
+        spill files (``sink_parquet``/``sink_csv``), a temporary spill
+        directory is removed, and the LazyFrame scans the exported file.
+        ``spill=True`` therefore needs `export`; to scan the spilled files
+        themselves pass a directory, which is left for the caller to remove.
+        Cannot be combined with `compact`.
+    memory_budget:
+        Bytes of completed frames held in memory before spilling (with `spill`).
+    strategies:
+        Optional fetch strategy per site, e.g. ``{'espn.com': 'json'}`` to read
+        ESPN's JSON stats API instead of its HTML weekly-leaders pages. The
+        output schema is the same for every strategy.
+    layout:
+        'wide' (default) unifies every category into one frame with the union
+        of their columns. 'categories' returns ``{category: frame}`` with only
+        each category's columns; 'long' returns one
+        ``(source, year, season_type, week, category, entity, team, stat,
+        value)`` row per stat value (see `reshape`). Unit frames are grouped
+        as they complete, so the sparse wide table is never built.
     export:
         Optional string specifying an on-disk export format: 'csv' or 'parquet'.
     filename:
@@ -66,47 +171,291 @@ async def _gather_multi_site_stats(
     pl.DataFrame
         Unified table containing all rows from every (site, year, category) combo.
         Always includes the columns: ['year', 'category', 'source'] when data
-        exists; may be empty if no rows were fetched.
+        exists; may be empty if no rows were fetched. A `pl.LazyFrame` over the
+        spilled (or exported) rows with `spill`.
     """
     if isinstance(sites, str):
         sites = [sites]
+    journal = Checkpoint(checkpoint) if checkpoint is not None else None
+    index = FingerprintIndex(fingerprints) if fingerprints is not None else None
+    manifest = FailureManifest() if return_failures else None
+    limit = Deadline(deadline) if deadline is not None else None
+    _check_output_options(
+        compact=compact, spill=spill, layout=layout, export=export, filename=filename
+    )
+    spilled = None
+    if spill is not False:
+        spilled = Spill(None if spill is True else spill, budget=memory_budget)
+    collected = CategoryFrames() if layout != 'wide' else None
+    if hedge is False:
+        hedged = contextlib.nullcontext()
+    else:
+        hedged = hedging(hedge if isinstance(hedge, HostLatency) else None)
 
-    async with httpx.AsyncClient() as client:
-        tasks = []
-        for site in sites:
-            if site not in SCRAPERS:
-                continue
-            scraper = SCRAPERS[site]
-            if player:
-                tasks.append(scraper.get_player_stats(client, years))
-            else:
-                tasks.append(scraper.get_team_stats(client, years))
-
-        results = await asyncio.gather(*tasks)
+    with hedged, _removing_on_error(spilled):
+        async with httpx.AsyncClient() as client:
+            tasks = []
+            for site in sites:
+                if site not in SCRAPERS:
+                    continue
+                scraper = _site_scraper(
+                    site, fingerprints=index, strategy=(strategies or {}).get(site)
+                )
+                fetch = scraper.get_player_stats if player else scraper.get_team_stats
+                tasks.append(fetch(
+                    client,
+                    years,
+                    categories=categories,
+                    weeks=weeks,
+                    season_types=season_types,
+                    columns=columns,
+                    concurrency=concurrency,
+                    checkpoint=journal,
+                    failures=manifest,
+                    deadline=limit,
+                    sink=spilled or collected,
+                ))
+
+            results = await asyncio.gather(*tasks)
+
+    if spilled is not None:
+        unified = _spilled_result(spilled, export, filename)
+        return (unified, manifest) if manifest is not None else unified
+
+    if collected is not None:
+        reshaped = _reshaped_result(collected, layout, compact, export, filename)
+        return (reshaped, manifest) if manifest is not None else reshaped
 
     # Unify all results from different sites
     unified = unify_frames([df for df in results if df.shape[0] > 0])
+    if compact:
+        unified = compact_frame(unified)
 
     # Optional export to disk
     if export and filename:
-        fmt = export.lower()
-        if fmt == 'csv':
-            unified.write_csv(filename)
-        elif fmt in {'parquet', 'pq'}:
-            unified.write_parquet(filename)
-        else:
-            raise ValueError("export must be 'csv' or 'parquet'")
+        write_export(unified, export, filename)
 
+    if manifest is not None:
+        return unified, manifest
     return unified
 
 
+def _check_output_options(
+    *,
+    compact: bool,
+    spill: bool | str | os.PathLike[str],
+    layout: str,
+    export: str | None,
+    filename: str | None,
+) -> None:
+    """Reject output options that cannot be combined."""
+    if spill is True and not (export and filename):
+        # A lazy scan over a temporary directory would leave that directory behind
+        raise ValueError(
+            'spill=True needs export and filename; pass a spill directory to scan it lazily'
+        )
+    spill = spill is not False
+    if spill and compact:
+        raise ValueError('compact cannot be combined with spill')
+    if layout not in {'wide', 'categories', 'long'}:
+        raise ValueError("layout must be 'wide', 'categories' or 'long'")
+    if layout != 'wide' and spill:
+        raise ValueError('spill needs the wide layout')
+    if layout == 'categories' and export:
+        raise ValueError("export needs the 'wide' or 'long' layout")
+
+
+def _reshaped_result(
+    collected: CategoryFrames,
+    layout: Layout,
+    compact: bool,
+    export: str | None,
+    filename: str | None,
+) -> pl.DataFrame | dict[str, pl.DataFrame]:
+    """Per-category frames or the long frame of a scrape, compacted/exported as requested."""
+    if layout == 'categories':
+        frames = collected.frames
+        return {c: compact_frame(f) for c, f in frames.items()} if compact else frames
+    long = collected.long()
+    if compact:
+        long = compact_frame(long)
+    if export and filename:
+        write_export(long, export, filename)
+    return long
+
+
+@contextlib.contextmanager
+def _removing_on_error(spill: Spill | None) -> Iterator[None]:
+    """Remove a temporary spill directory when the scrape fails."""
+    try:
+        yield
+    except BaseException:
+        if spill is not None:
+            spill.cleanup()
+        raise
+
+
+def _spilled_result(spill: Spill, export: str | None, filename: str | None) -> pl.LazyFrame:
+    """Stream a spilled scrape into its export (if any) and scan the result lazily.
+
+    Without an export the spill directory is the caller's and the scan reads
+    it; a temporary one is removed once the export is written.
+    """
+    if not (export and filename):
+        return spill.scan()
+    try:
+        spill.sink(export, filename)
+    finally:
+        spill.cleanup()
+    return pl.scan_csv(filename) if export.lower() == 'csv' else pl.scan_parquet(filename)
+
+
+async def _gather_player_and_team_stats(
+    years: list[int] | None,
+    sites: list[SiteName] | SiteName,
+    *,
+    compact: bool = False,
+    **options,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Player and team stats of one run; see `get_all_stats`."""
+    if isinstance(sites, str):
+        sites = [sites]
+    derived = [s for s in sites if s in SCRAPERS and SCRAPERS[s].teams_from_players]
+    fetched = [s for s in sites if s not in derived]
+    scrapes = [_gather_multi_site_stats(years, sites, player=True, **options)]
+    if fetched:
+        scrapes.append(_gather_multi_site_stats(years, fetched, player=False, **options))
+    players, *teams = await asyncio.gather(*scrapes)
+    # Derived team rows are group-bys of the player rows already fetched
+    teams = [SCRAPERS[s].team_stats_from(players) for s in derived] + teams
+    unified = unify_frames([df for df in teams if df.shape[0] > 0])
+    if compact:
+        return compact_frame(players), compact_frame(unified)
+    return players, unified
+
+
+async def _retry_failed(
+    manifest: FailureManifest,
+    *,
+    concurrency: int | None = None,
+    checkpoint: str | os.PathLike[str] | None = None,
+    fingerprints: str | os.PathLike[str] | None = None,
+) -> tuple[pl.DataFrame, FailureManifest]:
+    journal = Checkpoint(checkpoint) if checkpoint is not None else None
+    index = FingerprintIndex(fingerprints) if fingerprints is not None else None
+    remaining = FailureManifest()
+    # Units are re-fetched by a scraper of the strategy their URL was planned for
+    by_scraper: dict[tuple[str, str | None], list[Failure]] = {}
+    for failure in manifest:
+        by_scraper.setdefault((failure.site.lower(), failure.strategy), []).append(failure)
+
+    async def retry(scraper, failed: list[Failure]) -> pl.DataFrame:
+        units = [f.unit for f in failed if f.stage != 'discovery']
+        # Units whose discovery failed are planned again, per year page
+        rediscover: dict[tuple[int, bool, tuple[str, ...] | None], list[str]] = {}
+        for f in failed:
+            if f.stage == 'discovery':
+                rediscover.setdefault((f.year, f.player, f.columns), []).append(f.category)
+        for (year, player, columns), categories in rediscover.items():
+            units += await scraper.plan_units(
+                client,
+                [year],
+                player=player,
+                categories=categories,
+                columns=list(columns) if columns else None,
+                failures=remaining,
+            )
+        return await scraper.fetch_units(
+            client,
+            units,
+            concurrency=concurrency,
+            checkpoint=journal,
+            failures=remaining,
+            require_rows=True,
+        )
+
+    async with httpx.AsyncClient() as client:
+        results = await asyncio.gather(*(
+            retry(_site_scraper(site, fingerprints=index, strategy=strategy), failed)
+            for (site, strategy), failed in by_scraper.items()
+        ))
+    return unify_frames([df for df in results if df.shape[0] > 0]), remaining
+
+
+def retry_failed(
+    manifest: FailureManifest,
+    frame: pl.DataFrame | None = None,
+    *,
+    concurrency: int | None = None,
+    checkpoint: str | os.PathLike[str] | None = None,
+    fingerprints: str | os.PathLike[str] | None = None,
+) -> tuple[pl.DataFrame, FailureManifest]:
+    """Re-fetch only the units listed in `manifest` and merge them into `frame`.
+
+    Each unit is fetched with the strategy it failed with (e.g. ESPN's JSON
+    endpoint); units whose discovery failed are planned again first. A unit
+    that is fetched but parses to no rows is not counted as recovered; it
+    stays in the returned manifest as `EmptyUnitError`.
+
+    Parameters
+    ----------
+    manifest:
+        Failures returned by a scrape called with ``return_failures=True`` (or
+        loaded with `FailureManifest.load`).
+    frame:
+        Optional result of the original scrape to merge the recovered rows into.
+    concurrency:
+        Optional per-site limit on concurrent fetches.
+    checkpoint:
+        Optional checkpoint directory to record the recovered units in.
+    fingerprints:
+        Optional directory of page fingerprints, as passed to the original scrape.
+
+    Returns
+    -------
+    tuple[pl.DataFrame, FailureManifest]
+        The merged frame and a manifest of the units that failed again.
+    """
+    recovered, remaining = asyncio.run(_retry_failed(
+        manifest, concurrency=concurrency, checkpoint=checkpoint, fingerprints=fingerprints
+    ))
+    frames = [df for df in (frame, recovered) if df is not None and df.shape[0] > 0]
+    return unify_frames(frames), remaining
+
+
+def write_export(frame: pl.DataFrame, export: str, filename: str) -> None:
+    """Write `frame` to `filename` in the given export format ('csv' or 'parquet')."""
+    fmt = export.lower()
+    if fmt == 'csv':
+        frame.write_csv(filename)
+    elif fmt in {'parquet', 'pq'}:
+        frame.write_parquet(filename)
+    else:
+        raise ValueError("export must be 'csv' or 'parquet'")
+
+
 def get_all_player_stats(
     years: list[int] | None = None,
     *,
     sites: list[SiteName] | SiteName = 'nfl.com',
+    categories: list[str] | None = None,
+    weeks: list[int] | None = None,
+    season_types: list[str] | None = None,
+    columns: list[str] | None = None,
+    concurrency: int | None = None,
+    checkpoint: str | os.PathLike[str] | None = None,
+    fingerprints: str | os.PathLike[str] | None = None,
+    compact: bool = False,
+    return_failures: bool = False,
+    deadline: float | None = None,
+    hedge: bool | HostLatency = False,
+    spill: bool | str | os.PathLike[str] = False,
+    memory_budget: int = DEFAULT_BUDGET,
+    strategies: dict[SiteName, str] | None = None,
+    layout: Layout = 'wide',
     export: str | None = None,
     filename: str | None = None,
-) -> pl.DataFrame:
+) -> Result:
     """Scrape player stats from one or multiple sites.
 
     Parameters
@@ -115,6 +464,43 @@ def get_all_player_stats(
         Optional list of season years to scrape. If None, all available years.
     sites:
         Site(s) to scrape from. Defaults to 'nfl.com' for backward compatibility.
+    categories:
+        Optional subset of stat categories to scrape (e.g. ['passing']).
+    weeks:
+        Optional week numbers (weekly sources only, e.g. ESPN.com).
+    season_types:
+        Optional season types: 'regular' and/or 'postseason'.
+    columns:
+        Optional stat columns to keep (projected while parsing).
+    concurrency:
+        Optional per-site limit on concurrent fetches.
+    checkpoint:
+        Optional directory used to journal completed units so an interrupted
+        run can be resumed by calling again with the same directory.
+    fingerprints:
+        Optional directory of page fingerprints; unchanged pages skip parsing.
+    compact:
+        If True downcast numeric columns to the smallest types that hold them.
+    return_failures:
+        If True return ``(frame, FailureManifest)`` listing the units that
+        failed instead of raising; see `retry_failed`.
+    deadline:
+        Optional overall budget in seconds; stragglers are cancelled and the
+        partial result is returned.
+    hedge:
+        If True (or a `HostLatency`) duplicate requests slower than their
+        host's observed p95 and use the first response.
+    spill:
+        If True (with `export`) or a directory, spill completed units to disk
+        and return a `pl.LazyFrame`; with `export` the file is streamed from
+        the spill.
+    memory_budget:
+        Bytes buffered in memory before spilling (with `spill`).
+    strategies:
+        Optional fetch strategy per site, e.g. ``{'espn.com': 'json'}``.
+    layout:
+        'wide' (default), 'categories' (``{category: frame}``) or 'long'
+        (one row per stat value); see `reshape`.
     export:
         Optional export format: 'csv' or 'parquet'.
     filename:
@@ -126,7 +512,26 @@ def get_all_player_stats(
         Unified player statistics with columns including ['year', 'category', 'source'].
     """
     return asyncio.run(_gather_multi_site_stats(
-        years, sites, player=True, export=export, filename=filename
+        years,
+        sites,
+        player=True,
+        categories=categories,
+        weeks=weeks,
+        season_types=season_types,
+        columns=columns,
+        concurrency=concurrency,
+        checkpoint=checkpoint,
+        fingerprints=fingerprints,
+        compact=compact,
+        return_failures=return_failures,
+        deadline=deadline,
+        hedge=hedge,
+        spill=spill,
+        memory_budget=memory_budget,
+        strategies=strategies,
+        layout=layout,
+        export=export,
+        filename=filename,
     ))
 
 
@@ -134,9 +539,24 @@ def get_all_team_stats(
     years: list[int] | None = None,
     *,
     sites: list[SiteName] | SiteName = 'nfl.com',
+    categories: list[str] | None = None,
+    weeks: list[int] | None = None,
+    season_types: list[str] | None = None,
+    columns: list[str] | None = None,
+    concurrency: int | None = None,
+    checkpoint: str | os.PathLike[str] | None = None,
+    fingerprints: str | os.PathLike[str] | None = None,
+    compact: bool = False,
+    return_failures: bool = False,
+    deadline: float | None = None,
+    hedge: bool | HostLatency = False,
+    spill: bool | str | os.PathLike[str] = False,
+    memory_budget: int = DEFAULT_BUDGET,
+    strategies: dict[SiteName, str] | None = None,
+    layout: Layout = 'wide',
     export: str | None = None,
     filename: str | None = None,
-) -> pl.DataFrame:
+) -> Result:
     """Scrape team stats from one or multiple sites.
 
     Parameters
@@ -145,6 +565,43 @@ def get_all_team_stats(
         Optional list of season years to scrape. If None, all available years.
     sites:
         Site(s) to scrape from. Defaults to 'nfl.com' for backward compatibility.
+    categories:
+        Optional subset of stat categories to scrape (e.g. ['passing']).
+    weeks:
+        Optional week numbers (weekly sources only, e.g. ESPN.com).
+    season_types:
+        Optional season types: 'regular' and/or 'postseason'.
+    columns:
+        Optional stat columns to keep (projected while parsing).
+    concurrency:
+        Optional per-site limit on concurrent fetches.
+    checkpoint:
+        Optional directory used to journal completed units so an interrupted
+        run can be resumed by calling again with the same directory.
+    fingerprints:
+        Optional directory of page fingerprints; unchanged pages skip parsing.
+    compact:
+        If True downcast numeric columns to the smallest types that hold them.
+    return_failures:
+        If True return ``(frame, FailureManifest)`` listing the units that
+        failed instead of raising; see `retry_failed`.
+    deadline:
+        Optional overall budget in seconds; stragglers are cancelled and the
+        partial result is returned.
+    hedge:
+        If True (or a `HostLatency`) duplicate requests slower than their
+        host's observed p95 and use the first response.
+    spill:
+        If True (with `export`) or a directory, spill completed units to disk
+        and return a `pl.LazyFrame`; with `export` the file is streamed from
+        the spill.
+    memory_budget:
+        Bytes buffered in memory before spilling (with `spill`).
+    strategies:
+        Optional fetch strategy per site, e.g. ``{'espn.com': 'json'}``.
+    layout:
+        'wide' (default), 'categories' (``{category: frame}``) or 'long'
+        (one row per stat value); see `reshape`.
     export:
         Optional export format: 'csv' or 'parquet'.
     filename:
@@ -156,7 +613,72 @@ def get_all_team_stats(
         Unified team statistics with columns including ['year', 'category', 'source'].
     """
     return asyncio.run(_gather_multi_site_stats(
-        years, sites, player=False, export=export, filename=filename
+        years,
+        sites,
+        player=False,
+        categories=categories,
+        weeks=weeks,
+        season_types=season_types,
+        columns=columns,
+        concurrency=concurrency,
+        checkpoint=checkpoint,
+        fingerprints=fingerprints,
+        compact=compact,
+        return_failures=return_failures,
+        deadline=deadline,
+        hedge=hedge,
+        spill=spill,
+        memory_budget=memory_budget,
+        strategies=strategies,
+        layout=layout,
+        export=export,
+        filename=filename,
+    ))
+
+
+def get_all_stats(
+    years: list[int] | None = None,
+    *,
+    sites: list[SiteName] | SiteName = 'nfl.com',
+    categories: list[str] | None = None,
+    weeks: list[int] | None = None,
+    season_types: list[str] | None = None,
+    concurrency: int | None = None,
+    checkpoint: str | os.PathLike[str] | None = None,
+    fingerprints: str | os.PathLike[str] | None = None,
+    compact: bool = False,
+    deadline: float | None = None,
+    hedge: bool | HostLatency = False,
+    strategies: dict[SiteName, str] | None = None,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Scrape player and team stats together.
+
+    Sites whose team stats are aggregates of their player pages (ESPN.com:
+    one team-week row per team per weekly leaders page) derive the team rows
+    from the player rows of this run, so they cost no requests beyond the
+    player scrape. Other sites scrape their team pages concurrently. Pass the
+    ESPN player rows to `aggregates.team_season` for team-season totals.
+
+    Parameters are as for `get_all_player_stats`.
+
+    Returns
+    -------
+    tuple[pl.DataFrame, pl.DataFrame]
+        The unified player statistics and the unified team statistics.
+    """
+    return asyncio.run(_gather_player_and_team_stats(
+        years,
+        sites,
+        categories=categories,
+        weeks=weeks,
+        season_types=season_types,
+        concurrency=concurrency,
+        checkpoint=checkpoint,
+        fingerprints=fingerprints,
+        compact=compact,
+        deadline=deadline,
+        hedge=hedge,
+        strategies=strategies,
     ))
 
 
@@ -168,4 +690,4 @@ async def async_main():  # pragma: no cover
     print(teams.head(5))
 
 
-__all__ = ['get_all_player_stats', 'get_all_team_stats', 'async_main']
+__all__ = ['get_all_player_stats', 'get_all_stats', 'get_all_team_stats', 'async_main']
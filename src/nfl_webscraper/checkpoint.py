@@ -0,0 +1,75 @@
+"""On-disk checkpoint journal so interrupted scrapes can resume.
+
+Every completed work unit is written to the checkpoint directory as soon as
+it finishes: its frame goes to an Arrow IPC file and a line is appended to
+``journal.jsonl``. A rerun pointed at the same directory loads the recorded
+units from disk and only fetches the remainder. Units are identified by
+`WorkUnit.key`, so reruns with different years or categories still reuse
+whatever overlaps.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import polars as pl
+
+from .sites.base import WorkUnit
+
+JOURNAL_NAME = 'journal.jsonl'
+
+
+class Checkpoint:
+	"""Journal of completed units stored under `directory`."""
+
+	def __init__(self, directory: str | os.PathLike[str]) -> None:
+		self.directory = Path(directory)
+		self.directory.mkdir(parents=True, exist_ok=True)
+		self._journal = self.directory / JOURNAL_NAME
+		self._entries: dict[str, str | None] = {}
+		if self._journal.exists():
+			for line in self._journal.read_text().splitlines():
+				try:
+					entry = json.loads(line)
+				except json.JSONDecodeError:  # torn final line from a crash mid-write
+					continue
+				self._entries[entry['key']] = entry.get('file')
+
+	def __contains__(self, unit: WorkUnit) -> bool:
+		return unit.key in self._entries
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def load(self, unit: WorkUnit) -> pl.DataFrame:
+		"""Return the recorded frame of a completed unit."""
+		filename = self._entries[unit.key]
+		if filename is None:
+			return pl.DataFrame([])
+		return pl.read_ipc(self.directory / filename, memory_map=False)
+
+	def record(self, unit: WorkUnit, frame: pl.DataFrame) -> None:
+		"""Persist a unit's frame, then mark it complete in the journal.
+
+		The frame is written to a temporary file and renamed into place before
+		the journal line is appended, so a crash never leaves a journal entry
+		pointing at a partial file.
+		"""
+		filename: str | None = None
+		if frame.shape[0] > 0:
+			filename = hashlib.sha1(unit.key.encode()).hexdigest() + '.arrow'
+			tmp = self.directory / (filename + '.tmp')
+			frame.write_ipc(tmp)
+			os.replace(tmp, self.directory / filename)
+		line = json.dumps({'key': unit.key, 'file': filename, 'rows': frame.shape[0]})
+		with self._journal.open('a') as fh:
+			fh.write(line + '\n')
+			fh.flush()
+			os.fsync(fh.fileno())
+		self._entries[unit.key] = filename
+
+
+__all__ = ['Checkpoint']
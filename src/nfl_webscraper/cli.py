@@ -0,0 +1,448 @@
+"""Command-line entry point (`nfl-webscraper`).
+
+The (site, year, category) work space is split into shards which are spread
+round-robin over N worker processes. Without ``--years`` the parent discovers
+each site's seasons once, so shards carry concrete years. Every worker runs
+its own event loop and HTTP client, scrapes its shards concurrently under one
+concurrency limit per site and sends back one frame; the parent process
+unifies the frames and writes a single export.
+
+Example::
+
+	nfl-webscraper --years 2020-2024 --sites nfl.com espn.com --workers 8 -o stats.parquet
+
+`nfl-webscraper-serve` keeps the current week hot in memory and serves it::
+
+	nfl-webscraper-serve --sites espn.com --interval 120 --port 8765
+
+`nfl-webscraper-queue` drives the multi-node mode backed by `workqueue`::
+
+	nfl-webscraper-queue backfill.db enqueue --years 2010-2024 --sites nfl.com espn.com
+	nfl-webscraper-queue backfill.db work          # on every node
+	nfl-webscraper-queue backfill.db collect -o stats.parquet
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import httpx
+import polars as pl
+
+from .api import SCRAPERS, write_export
+from .checkpoint import Checkpoint
+from .compact import compact
+from .extract import page_cache
+from .fingerprint import FingerprintIndex
+from .schema import unify_frames
+from .serve import watch
+from .store import Dataset
+from .workqueue import WorkQueue, enqueue_scrape, run_worker
+
+Shard = tuple[str, int | None, str]
+
+
+def parse_years(values: list[str]) -> list[int]:
+	"""Expand year (or week) arguments such as ``2021`` or ``2019-2023`` into a sorted list."""
+	years: set[int] = set()
+	for value in values:
+		for raw in value.split(','):
+			part = raw.strip()
+			if not part:
+				continue
+			if '-' in part:
+				lo, hi = (int(p) for p in part.split('-', 1))
+				years.update(range(min(lo, hi), max(lo, hi) + 1))
+			else:
+				years.add(int(part))
+	return sorted(years)
+
+
+async def discover_years(sites: list[str], *, player: bool) -> dict[str, list[int]]:
+	"""Seasons each site publishes, discovered once for the whole run."""
+	async with httpx.AsyncClient() as client:
+		found = await asyncio.gather(*(
+			SCRAPERS[site].discover_years(client, player=player) for site in sites
+		))
+	return dict(zip(sites, found, strict=True))
+
+
+def build_shards(
+	sites: list[str],
+	years: list[int] | Mapping[str, list[int]] | None,
+	categories: list[str] | None,
+	*,
+	player: bool,
+) -> list[Shard]:
+	"""Enumerate the (site, year, category) shards for a scrape.
+
+	`years` is one list for every site or the years of each site (see
+	`discover_years`). A year of None means "every year the site discovers"
+	and is used when no years are given.
+	"""
+	wanted = {c.lower() for c in categories} if categories else None
+	shards: list[Shard] = []
+	for site in sites:
+		scraper = SCRAPERS[site]
+		site_categories = scraper.available_categories(player=player)
+		if wanted is not None:
+			site_categories = [c for c in site_categories if c in wanted]
+		site_years = years.get(site) if isinstance(years, Mapping) else years
+		for year in site_years or [None]:
+			shards.extend((site, year, cat) for cat in site_categories)
+	return shards
+
+
+def split_shards(shards: list[Shard], workers: int) -> list[list[Shard]]:
+	"""Distribute shards round-robin over at most `workers` non-empty groups."""
+	groups: list[list[Shard]] = [[] for _ in range(max(1, workers))]
+	for i, shard in enumerate(shards):
+		groups[i % len(groups)].append(shard)
+	return [g for g in groups if g]
+
+
+async def _scrape_shards(shards: list[Shard], options: dict) -> pl.DataFrame:
+	options = dict(options)
+	player = options.pop('player')
+	checkpoint = options.pop('checkpoint', None)
+	fingerprints = options.pop('fingerprints', None)
+	concurrency = options.pop('concurrency', None)
+	journal = Checkpoint(checkpoint) if checkpoint else None
+	index = FingerprintIndex(fingerprints) if fingerprints else None
+	# One scraper per site, so all of its shards share one concurrency limit
+	scrapers = {}
+	for site in dict.fromkeys(site for site, _, _ in shards):
+		scraper = type(SCRAPERS[site])(fingerprints=index)
+		scraper.limiter = asyncio.Semaphore(concurrency or scraper.concurrency)
+		scrapers[site] = scraper
+	# The worker's shards are one scrape: discovery pages are fetched once
+	with page_cache():
+		async with httpx.AsyncClient() as client:
+			tasks = []
+			for site, year, category in shards:
+				scraper = scrapers[site]
+				fetch = scraper.get_player_stats if player else scraper.get_team_stats
+				years = [year] if year is not None else None
+				tasks.append(
+					fetch(client, years, categories=[category], checkpoint=journal, **options)
+				)
+			results = await asyncio.gather(*tasks)
+	return unify_frames([df for df in results if df.shape[0] > 0])
+
+
+def run_shard_group(shards: list[Shard], options: dict) -> pl.DataFrame:
+	"""Worker process body: scrape a group of shards on a fresh event loop."""
+	return asyncio.run(_scrape_shards(shards, options))
+
+
+def run_sharded(
+	shards: list[Shard],
+	*,
+	player: bool,
+	workers: int,
+	concurrency: int | None = None,
+	checkpoint: str | None = None,
+	fingerprints: str | None = None,
+	filters: dict | None = None,
+) -> pl.DataFrame:
+	"""Scrape `shards` across `workers` processes and merge the results.
+
+	`concurrency` limits the concurrent fetches of each site within a worker
+	process, across all of its shards. With a `checkpoint` directory every
+	worker journals its completed units there, so rerunning the same command
+	resumes an interrupted backfill.
+	`filters` holds the weeks/season_types/columns pushdown options.
+	"""
+	groups = split_shards(shards, workers)
+	options = {
+		'player': player,
+		'concurrency': concurrency,
+		'checkpoint': checkpoint,
+		'fingerprints': fingerprints,
+		**(filters or {}),
+	}
+	if len(groups) <= 1:
+		frames = [run_shard_group(g, options) for g in groups]
+	else:
+		with ProcessPoolExecutor(max_workers=len(groups)) as pool:
+			futures = [pool.submit(run_shard_group, g, options) for g in groups]
+			frames = [f.result() for f in futures]
+	return unify_frames([df for df in frames if df.shape[0] > 0])
+
+
+def _add_selection_args(parser: argparse.ArgumentParser) -> None:
+	parser.add_argument(
+		'--years',
+		nargs='+',
+		metavar='YEAR',
+		help='Seasons to scrape, e.g. 2023 or 2019-2023 (default: every discovered year).',
+	)
+	parser.add_argument(
+		'--sites',
+		nargs='+',
+		choices=sorted(SCRAPERS),
+		default=['nfl.com'],
+		help='Sites to scrape (default: nfl.com).',
+	)
+	parser.add_argument(
+		'--categories',
+		nargs='+',
+		metavar='CATEGORY',
+		help='Stat categories to scrape (default: all categories of each site).',
+	)
+	parser.add_argument(
+		'--weeks',
+		nargs='+',
+		metavar='WEEK',
+		help='Weeks to scrape from weekly sources, e.g. 7 or 1-4 (default: all weeks).',
+	)
+	parser.add_argument(
+		'--season-types',
+		nargs='+',
+		choices=['regular', 'postseason'],
+		help='Season types to scrape (default: both).',
+	)
+	parser.add_argument(
+		'--columns',
+		nargs='+',
+		metavar='COLUMN',
+		help='Stat columns to keep; context columns are always kept (default: all).',
+	)
+	parser.add_argument(
+		'--team', action='store_true', help='Scrape team stats instead of player stats.'
+	)
+
+
+def _filters(args: argparse.Namespace) -> dict:
+	"""Pushdown options shared by every scrape entry point."""
+	return {
+		'weeks': parse_years(args.weeks) if args.weeks else None,
+		'season_types': args.season_types,
+		'columns': args.columns,
+	}
+
+
+def _add_output_args(parser: argparse.ArgumentParser) -> None:
+	parser.add_argument(
+		'--format',
+		choices=['csv', 'parquet'],
+		default=None,
+		help='Output format (default: inferred from the output suffix, else parquet).',
+	)
+	parser.add_argument('-o', '--output', help='Output file path.')
+	parser.add_argument(
+		'--compact',
+		action='store_true',
+		help='Downcast numeric columns to the smallest types that hold them.',
+	)
+	parser.add_argument(
+		'--store',
+		metavar='DIR',
+		help='Upsert the rows into the stored dataset in DIR and report what changed.',
+	)
+
+
+def _write_outputs(frame: pl.DataFrame, args: argparse.Namespace) -> None:
+	if args.compact:
+		frame = compact(frame)
+	if args.output:
+		write_export(frame, _output_format(args), args.output)
+		print(f'wrote {frame.shape[0]} rows to {args.output}')
+	if args.store:
+		changes = Dataset(args.store).upsert(frame, compact=args.compact)
+		print(
+			f'{args.store}: {changes.inserted.shape[0]} inserted, '
+			f'{changes.updated.shape[0]} updated, {changes.unchanged} unchanged'
+		)
+
+
+def _output_format(args: argparse.Namespace) -> str:
+	return args.format or ('csv' if Path(args.output).suffix.lower() == '.csv' else 'parquet')
+
+
+def build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		prog='nfl-webscraper',
+		description='Scrape NFL player or team statistics into a single CSV/Parquet file.',
+	)
+	_add_selection_args(parser)
+	parser.add_argument(
+		'--workers',
+		type=int,
+		default=os.cpu_count() or 1,
+		help='Number of worker processes (default: CPU count).',
+	)
+	parser.add_argument(
+		'--concurrency',
+		type=int,
+		default=None,
+		help='Maximum concurrent requests per site in each worker (default: per-site setting).',
+	)
+	parser.add_argument(
+		'--checkpoint',
+		metavar='DIR',
+		help='Journal completed units in DIR; rerunning with the same DIR resumes the scrape.',
+	)
+	parser.add_argument(
+		'--fingerprints',
+		metavar='DIR',
+		help='Keep page fingerprints in DIR and skip parsing pages that did not change.',
+	)
+	_add_output_args(parser)
+	return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+	parser = build_parser()
+	args = parser.parse_args(argv)
+	if not (args.output or args.store):
+		parser.error('one of -o/--output or --store is required')
+	player = not args.team
+	if args.years:
+		years = parse_years(args.years)
+	else:
+		# Discover once here rather than in every shard
+		years = asyncio.run(discover_years(args.sites, player=player))
+
+	shards = build_shards(args.sites, years, args.categories, player=player)
+	if not shards:
+		print('nothing to scrape for the given sites/categories', file=sys.stderr)
+		return 1
+
+	frame = run_sharded(
+		shards,
+		player=player,
+		workers=args.workers,
+		concurrency=args.concurrency,
+		checkpoint=args.checkpoint,
+		fingerprints=args.fingerprints,
+		filters=_filters(args),
+	)
+	print(f'scraped {frame.shape[0]} rows from {len(shards)} shards')
+	_write_outputs(frame, args)
+	return 0
+
+
+def build_queue_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		prog='nfl-webscraper-queue',
+		description='Distribute a scrape over several machines through a shared SQLite queue.',
+	)
+	parser.add_argument('database', help='Path of the shared queue database.')
+	parser.add_argument(
+		'--lease-seconds',
+		type=float,
+		default=300.0,
+		help='Lease duration before an unrenewed unit is reclaimed (default: 300).',
+	)
+	commands = parser.add_subparsers(dest='command', required=True)
+	_add_selection_args(commands.add_parser('enqueue', help='Enumerate work units into the queue.'))
+	work = commands.add_parser('work', help='Lease and scrape units until the queue is drained.')
+	work.add_argument(
+		'--concurrency', type=int, default=10, help='Units processed at once (default: 10).'
+	)
+	commands.add_parser('status', help='Show the number of units per status.')
+	_add_output_args(commands.add_parser('collect', help='Merge completed units into one file.'))
+	return parser
+
+
+def queue_main(argv: list[str] | None = None) -> int:
+	parser = build_queue_parser()
+	args = parser.parse_args(argv)
+	if args.command == 'collect' and not (args.output or args.store):
+		parser.error('collect needs -o/--output or --store')
+	with WorkQueue(args.database, lease_seconds=args.lease_seconds) as queue:
+		if args.command == 'enqueue':
+			years = parse_years(args.years) if args.years else None
+			added = asyncio.run(enqueue_scrape(
+				queue,
+				years,
+				args.sites,
+				player=not args.team,
+				categories=args.categories,
+				**_filters(args),
+			))
+			print(f'enqueued {added} units')
+		elif args.command == 'work':
+			done = asyncio.run(run_worker(queue, concurrency=args.concurrency))
+			print(f'completed {done} units')
+		elif args.command == 'status':
+			for status, count in sorted(queue.counts().items()):
+				print(f'{status}\t{count}')
+		else:
+			_write_outputs(queue.results(), args)
+	return 0
+
+
+def build_serve_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		prog='nfl-webscraper-serve',
+		description='Refresh the current week on a schedule and serve reads over local HTTP.',
+	)
+	parser.add_argument(
+		'--sites',
+		nargs='+',
+		choices=sorted(SCRAPERS),
+		default=['espn.com'],
+		help='Sites to refresh (default: espn.com).',
+	)
+	parser.add_argument(
+		'--categories',
+		nargs='+',
+		metavar='CATEGORY',
+		help='Stat categories to refresh (default: all categories of each site).',
+	)
+	parser.add_argument(
+		'--team', action='store_true', help='Serve team stats instead of player stats.'
+	)
+	parser.add_argument(
+		'--interval',
+		type=float,
+		default=300.0,
+		help='Seconds between refreshes (default: 300).',
+	)
+	parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1).')
+	parser.add_argument('--port', type=int, default=8765, help='Port to bind (default: 8765).')
+	parser.add_argument(
+		'--concurrency',
+		type=int,
+		default=None,
+		help='Maximum concurrent requests per site (default: per-site setting).',
+	)
+	return parser
+
+
+def serve_main(argv: list[str] | None = None) -> int:
+	args = build_serve_parser().parse_args(argv)
+	watch(
+		args.sites,
+		player=not args.team,
+		categories=args.categories,
+		interval=args.interval,
+		host=args.host,
+		port=args.port,
+		concurrency=args.concurrency,
+	)
+	return 0
+
+
+__all__ = [
+	'build_shards',
+	'discover_years',
+	'main',
+	'parse_years',
+	'queue_main',
+	'run_sharded',
+	'serve_main',
+	'split_shards',
+]
+
+
+if __name__ == '__main__':  # pragma: no cover
+	sys.exit(main())
@@ -0,0 +1,204 @@
+"""Opt-in numeric downcasting for large frames.
+
+`compact` picks, per column, the smallest signed integer type that holds the
+observed range and stores 64-bit floats as Float32 (about seven significant
+digits, ample for ratings and averages) when every observed value survives
+the round trip to four decimal places. With `numeric_strings` columns of
+numeric text -- NFL.com cells such as ``'4,183'`` -- are parsed as well.
+Column ranges are computed in one vectorized pass. `memory_report` shows the
+bytes per column before and after.
+
+Stored datasets record the types chosen (see `Dataset.upsert`); types only
+ever widen, so every partition stays readable with one schema.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+
+import polars as pl
+
+INT_TYPES = (pl.Int8, pl.Int16, pl.Int32, pl.Int64)
+_BITS = {
+	pl.Int8: 8, pl.Int16: 16, pl.Int32: 32, pl.Int64: 64,
+	pl.UInt8: 8, pl.UInt16: 16, pl.UInt32: 32, pl.UInt64: 64,
+}
+
+# Cells NFL.com/ESPN use for "no value"
+_BLANKS = ('', '--', '-')
+
+# Widest integers Float32 represents exactly
+_FLOAT32_EXACT_BITS = 16
+
+# Largest change a round trip through Float32 may make (keeps four decimals);
+# values out of Float32's range become infinite and never fit.
+_FLOAT32_TOLERANCE = 5e-5
+
+
+def _bit_width(dtype: pl.DataType) -> int:
+	return next((bits for t, bits in _BITS.items() if dtype == t), 64)
+
+
+def smallest_int(low: int, high: int) -> pl.DataType:
+	"""Narrowest signed integer type holding every value in [low, high]."""
+	for dtype in INT_TYPES:
+		bits = _BITS[dtype]
+		if -(2 ** (bits - 1)) <= low and high < 2 ** (bits - 1):
+			return dtype()
+	return pl.Int64()
+
+
+def widen(a: pl.DataType, b: pl.DataType) -> pl.DataType:
+	"""Narrowest numeric type able to hold values of both `a` and `b`."""
+	if a == b:
+		return a
+	if a.is_integer() and b.is_integer():
+		return a if _bit_width(a) >= _bit_width(b) else b
+	if all(
+		d == pl.Float32 or (d.is_integer() and _bit_width(d) <= _FLOAT32_EXACT_BITS)
+		for d in (a, b)
+	):
+		return pl.Float32()
+	return pl.Float64()
+
+
+def parse_numeric(name: str) -> pl.Expr:
+	"""Float64 value of a numeric text column (``'4,183'``); blanks become null."""
+	text = pl.col(name).str.strip_chars()
+	return (
+		pl.when(text.is_in(_BLANKS))
+		.then(None)
+		.otherwise(text.str.replace_all(',', ''))
+		.cast(pl.Float64, strict=False)
+	)
+
+
+def _float32_error(value: pl.Expr) -> pl.Expr:
+	"""Largest change storing `value` as Float32 makes (inf when out of range)."""
+	return (value.cast(pl.Float32).cast(pl.Float64) - value).abs().fill_nan(0).max()
+
+
+def _fits_float32(error: float | None) -> bool:
+	return error is None or error <= _FLOAT32_TOLERANCE
+
+
+def _unparsable(name: str) -> pl.Expr:
+	blank = pl.col(name).str.strip_chars().is_in(_BLANKS)
+	return parse_numeric(name).is_null() & pl.col(name).is_not_null() & ~blank
+
+
+def compact_schema(
+	frame: pl.DataFrame,
+	*,
+	exclude: Iterable[str] = (),
+	numeric_strings: bool = False,
+) -> dict[str, pl.DataType]:
+	"""Smallest types for the numeric columns of `frame` (columns that would change only)."""
+	skip = set(exclude)
+	ints = [c for c, dt in frame.schema.items() if c not in skip and dt.is_integer()]
+	floats = [c for c, dt in frame.schema.items() if c not in skip and dt == pl.Float64]
+	texts = [c for c, dt in frame.schema.items() if c not in skip and dt == pl.Utf8]
+	if not numeric_strings:
+		texts = []
+
+	stats = frame.select(
+		*(pl.col(c).min().alias(f'{c}\0min') for c in ints),
+		*(pl.col(c).max().alias(f'{c}\0max') for c in ints),
+		*(_float32_error(pl.col(c)).alias(f'{c}\0err') for c in floats),
+		*(parse_numeric(c).min().alias(f'{c}\0min') for c in texts),
+		*(parse_numeric(c).max().alias(f'{c}\0max') for c in texts),
+		*(((parse_numeric(c) % 1) != 0).any().alias(f'{c}\0frac') for c in texts),
+		*(_float32_error(parse_numeric(c)).alias(f'{c}\0err') for c in texts),
+		*(_unparsable(c).any().alias(f'{c}\0bad') for c in texts),
+	).row(0, named=True) if ints or floats or texts else {}
+
+	chosen: dict[str, pl.DataType] = {}
+	for c in ints:
+		low, high = stats[f'{c}\0min'], stats[f'{c}\0max']
+		dtype = pl.Int8() if low is None else smallest_int(low, high)
+		if dtype != frame.schema[c]:
+			chosen[c] = dtype
+	for c in floats:
+		if _fits_float32(stats[f'{c}\0err']):
+			chosen[c] = pl.Float32()
+	for c in texts:
+		low, high = stats[f'{c}\0min'], stats[f'{c}\0max']
+		if stats[f'{c}\0bad'] or low is None:
+			continue  # not numeric text (or nothing to go on)
+		if not stats[f'{c}\0frac']:
+			chosen[c] = smallest_int(int(low), int(high))
+		elif _fits_float32(stats[f'{c}\0err']):
+			chosen[c] = pl.Float32()
+		else:
+			chosen[c] = pl.Float64()
+	return chosen
+
+
+def apply_schema(frame: pl.DataFrame, dtypes: Mapping[str, pl.DataType]) -> pl.DataFrame:
+	"""Cast `frame` to `dtypes`, parsing numeric text columns on the way."""
+	casts = []
+	for col, dtype in dtypes.items():
+		if col not in frame.columns or frame.schema[col] == dtype:
+			continue
+		source = parse_numeric(col) if frame.schema[col] == pl.Utf8 else pl.col(col)
+		casts.append(source.cast(dtype).alias(col))
+	return frame.with_columns(casts) if casts else frame
+
+
+def compact(
+	frame: pl.DataFrame,
+	*,
+	exclude: Iterable[str] = (),
+	numeric_strings: bool = False,
+) -> pl.DataFrame:
+	"""Downcast the numeric columns of `frame` to the smallest types that hold them."""
+	return apply_schema(
+		frame, compact_schema(frame, exclude=exclude, numeric_strings=numeric_strings)
+	)
+
+
+def memory_report(frame: pl.DataFrame, compacted: pl.DataFrame | None = None) -> pl.DataFrame:
+	"""Bytes per column before and after compaction, with a final total row.
+
+	`compacted` defaults to ``compact(frame)``.
+	"""
+	after = compact(frame) if compacted is None else compacted
+	rows = [
+		{
+			'column': col,
+			'dtype': str(frame.schema[col]),
+			'bytes': frame[col].estimated_size(),
+			'compact_dtype': str(after.schema[col]) if col in after.columns else None,
+			'compact_bytes': after[col].estimated_size() if col in after.columns else 0,
+		}
+		for col in frame.columns
+	]
+	report = pl.DataFrame(
+		rows,
+		schema={
+			'column': pl.Utf8,
+			'dtype': pl.Utf8,
+			'bytes': pl.Int64,
+			'compact_dtype': pl.Utf8,
+			'compact_bytes': pl.Int64,
+		},
+	)
+	total = report.select(
+		pl.lit('(total)').alias('column'),
+		pl.lit(None, dtype=pl.Utf8).alias('dtype'),
+		pl.col('bytes').sum(),
+		pl.lit(None, dtype=pl.Utf8).alias('compact_dtype'),
+		pl.col('compact_bytes').sum(),
+	)
+	return pl.concat([report, total])
+
+
+__all__ = [
+	'apply_schema',
+	'compact',
+	'compact_schema',
+	'memory_report',
+	'parse_numeric',
+	'smallest_int',
+	'widen',
+]
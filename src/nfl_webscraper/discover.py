@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import re
 from datetime import datetime
 
 import httpx
 
-from .http import fetch_html
+from .extract import fetch_page
 
 BASE_URL = 'https://www.nfl.com'
 PLAYER_ROOT = f'{BASE_URL}/stats/player-stats/'
@@ -31,46 +30,21 @@ TEAM_CATEGORIES = {'passing', 'rushing', 'receiving', 'scoring', 'downs'}
 
 async def get_year_urls(client: httpx.AsyncClient, stats_url: str) -> dict[str, str]:
 	try:
-		soup = await fetch_html(client, stats_url)
+		page = await fetch_page(client, stats_url)
 	except Exception:
 		cur = str(datetime.now().year)
 		return {cur: stats_url}
-	year_map: dict[str, str] = {}
-	for opt in soup.find_all('option'):
-		text = opt.get_text(strip=True)
-		if re.fullmatch(r'20\d{2}', text):
-			href = opt.get('value') or opt.get('data-url')
-			if href and not href.startswith('http'):
-				href = BASE_URL.rstrip('/') + '/' + href.lstrip('/')
-			year_map[text] = href or stats_url
+	year_map = page.season_options or page.season_links
 	if not year_map:
-		for a in soup.find_all('a'):
-			txt = a.get_text(strip=True)
-			if re.fullmatch(r'20\d{2}', txt):
-				href = a.get('href')
-				if href and not href.startswith('http'):
-					href = BASE_URL.rstrip('/') + '/' + href.lstrip('/')
-				year_map[txt] = href or stats_url
-	if not year_map:
-		year_map[str(datetime.now().year)] = stats_url
+		year_map = {str(datetime.now().year): stats_url}
 	return dict(sorted(year_map.items(), reverse=True))
 
 
 async def get_category_links(
 	client: httpx.AsyncClient, root_url: str, wanted: set[str]
 ) -> dict[str, str]:
-	soup = await fetch_html(client, root_url)
-	sections: dict[str, str] = {}
-	for a in soup.find_all('a'):
-		text = a.get_text(strip=True).lower()
-		if text in wanted:
-			href = a.get('href')
-			if not href:
-				continue
-			if not href.startswith('http'):
-				href = BASE_URL.rstrip('/') + '/' + href.lstrip('/')
-			sections[text] = href
-	return sections
+	page = await fetch_page(client, root_url)
+	return {text: url for text, url in page.category_links.items() if text in wanted}
 
 
 __all__ = [
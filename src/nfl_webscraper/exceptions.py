@@ -14,4 +14,12 @@ class FetchError(ScraperError):
 	"""Raised when an HTTP fetch fails after retries."""
 
 
-__all__ = ['ScraperError', 'FetchError']
+class DeadlineExceededError(ScraperError, TimeoutError):
+	"""Raised for (and recorded against) units cut off by a scrape deadline."""
+
+
+class EmptyUnitError(ScraperError):
+	"""Recorded against a retried unit that was fetched but parsed to no rows."""
+
+
+__all__ = ['ScraperError', 'FetchError', 'DeadlineExceededError', 'EmptyUnitError']
@@ -0,0 +1,174 @@
+"""Single-pass extraction of everything the scraper needs from a page.
+
+Previously the stats table, the "next" links, the numbered pagination links,
+the season ``<option>``s and the category anchors were each found by a
+separate walk over the parsed tree, and discovery pages were fetched and
+walked again for every shard. `extract_page` visits the tree once (a single
+``find_all`` over tables, anchors and options) and returns a `Page` with all
+of them. Within a `page_cache` block -- entered around every scrape --
+`fetch_page` memoizes pages per client and URL, so within one scrape no page
+is fetched or traversed twice. Outside such a block nothing is cached: a
+client kept across scrapes (a worker, a long-running refresh) fetches every
+page afresh on the next scrape instead of reading a stale copy.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import re
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
+
+import httpx
+import polars as pl
+from bs4 import BeautifulSoup
+
+from .http import fetch_text
+from .parsing import table_frame
+
+# Pages kept per client; discovery pages are the ones actually reused.
+CACHE_SIZE = 256
+
+_YEAR = re.compile(r'20\d{2}')
+
+
+@dataclass(frozen=True)
+class Page:
+	"""What one page offers: its first table plus every kind of link we follow."""
+
+	table: pl.DataFrame
+	# Numbered and "next" pagination links (absolute, sorted)
+	page_links: list[str] = field(default_factory=list)
+	# Season -> URL from the season ``<select>`` (``value``/``data-url``)
+	season_options: dict[str, str] = field(default_factory=dict)
+	# Season -> URL from year-labelled anchors (fallback when there is no select)
+	season_links: dict[str, str] = field(default_factory=dict)
+	# Lowercased anchor text -> URL, for category navigation
+	category_links: dict[str, str] = field(default_factory=dict)
+
+
+_Caches = weakref.WeakKeyDictionary[
+	httpx.AsyncClient, OrderedDict[tuple[str, tuple[str, ...] | None], Page]
+]
+
+# Page caches of the enclosing `page_cache` block (None outside one)
+_scope: ContextVar[_Caches | None] = ContextVar('page_cache', default=None)
+
+
+def _absolute(url: str, href: str) -> str:
+	"""Resolve `href` against the site root of `url` (NFL.com links are root-relative)."""
+	if href.startswith('http'):
+		return href
+	return urljoin(url, '/' + href.lstrip('/'))
+
+
+def extract_page(html: str, url: str, *, columns: tuple[str, ...] | None = None) -> Page:
+	"""Extract the table, pagination, season and category links of `html` in one pass.
+
+	`url` is the page's own address, used to make links absolute; `columns`
+	projects the table while it is parsed.
+	"""
+	soup = BeautifulSoup(html, 'html.parser')
+	table = None
+	page_links: set[str] = set()
+	season_options: dict[str, str] = {}
+	season_links: dict[str, str] = {}
+	category_links: dict[str, str] = {}
+	for tag in soup.find_all(['table', 'a', 'option']):
+		if tag.name == 'table':
+			if table is None:
+				table = tag
+			continue
+		text = tag.get_text(strip=True)
+		if tag.name == 'option':
+			if _YEAR.fullmatch(text):
+				href = tag.get('value') or tag.get('data-url')
+				season_options[text] = _absolute(url, href) if href else url
+			continue
+		href = tag.get('href')
+		lowered = text.lower()
+		if href and (text.isdigit() or 'next' in lowered):
+			page_links.add(_absolute(url, href))
+		if _YEAR.fullmatch(text):
+			season_links[text] = _absolute(url, href) if href else url
+		if href:
+			category_links[lowered] = _absolute(url, href)
+	frame = table_frame(table, columns) if table is not None else pl.DataFrame([])
+	return Page(frame, sorted(page_links), season_options, season_links, category_links)
+
+
+@contextlib.contextmanager
+def page_cache() -> Iterator[None]:
+	"""Keep fetched pages for the duration of the block (one scrape).
+
+	Nested blocks share the outermost block's pages.
+	"""
+	if _scope.get() is not None:
+		yield
+		return
+	token = _scope.set(weakref.WeakKeyDictionary())
+	try:
+		yield
+	finally:
+		_scope.reset(token)
+
+
+def cached_page(
+	client: httpx.AsyncClient, url: str, columns: tuple[str, ...] | None = None
+) -> Page | None:
+	"""The page already extracted for `client` at `url` in this scrape, if any.
+
+	A page extracted without projection also serves projected lookups.
+	"""
+	caches = _scope.get()
+	cache = caches.get(client) if caches is not None else None
+	if cache is None:
+		return None
+	page = cache.get((url, columns))
+	if page is None and columns is not None:
+		full = cache.get((url, None))
+		if full is not None:
+			keep = [c for c in full.table.columns if c in columns]
+			page = Page(
+				full.table.select(keep),
+				full.page_links,
+				full.season_options,
+				full.season_links,
+				full.category_links,
+			)
+	return page
+
+
+def remember(
+	client: httpx.AsyncClient, url: str, page: Page, columns: tuple[str, ...] | None = None
+) -> None:
+	"""Keep `page` for later lookups by `client` in this scrape (outside one it is dropped).
+
+	The least recently stored pages are evicted.
+	"""
+	caches = _scope.get()
+	if caches is None:
+		return
+	cache = caches.setdefault(client, OrderedDict())
+	cache[(url, columns)] = page
+	cache.move_to_end((url, columns))
+	while len(cache) > CACHE_SIZE:
+		cache.popitem(last=False)
+
+
+async def fetch_page(
+	client: httpx.AsyncClient, url: str, *, columns: tuple[str, ...] | None = None
+) -> Page:
+	"""Fetch and extract `url` once per client and scrape; later calls return the same `Page`."""
+	page = cached_page(client, url, columns)
+	if page is None:
+		page = extract_page(await fetch_text(client, url), url, columns=columns)
+		remember(client, url, page, columns)
+	return page
+
+
+__all__ = ['Page', 'cached_page', 'extract_page', 'fetch_page', 'page_cache', 'remember']
@@ -0,0 +1,154 @@
+"""Structured record of work units that failed during a scrape.
+
+A `FailureManifest` collects one `Failure` per unit whose fetch raised --
+site, year, category, week, URL and the error class -- instead of the error
+being printed and dropped or sinking the whole scrape. Units whose discovery
+failed (an NFL.com year page that failed or had no link for the category)
+are recorded too, at the 'discovery' stage.
+The manifest holds enough of each unit -- and the fetch strategy it was
+planned for -- to rebuild it, so `api.retry_failed` re-fetches exactly those
+units with a matching scraper (planning discovery failures again) and merges
+them into the earlier result. Manifests can be saved as JSON lines and
+loaded in another process.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import polars as pl
+
+from .sites.base import WorkUnit
+
+FRAME_SCHEMA = {
+	'site': pl.Utf8,
+	'year': pl.Int64,
+	'category': pl.Utf8,
+	'week': pl.Int64,
+	'season_type': pl.Utf8,
+	'url': pl.Utf8,
+	'error': pl.Utf8,
+	'message': pl.Utf8,
+	'stage': pl.Utf8,
+}
+
+
+@dataclass(frozen=True)
+class Failure:
+	"""One failed unit and the error it failed with."""
+
+	site: str
+	year: int
+	category: str
+	url: str
+	error: str
+	message: str = ''
+	week: int | None = None
+	season_type: str | None = None
+	player: bool = True
+	columns: tuple[str, ...] | None = None
+	# Fetch strategy of the scraper the unit failed in (None: the site's only one)
+	strategy: str | None = None
+	# 'fetch' for a planned unit; 'discovery' when the page listing the unit's
+	# table (NFL.com's year page) failed, so the unit has to be planned again
+	stage: str = 'fetch'
+
+	@classmethod
+	def from_unit(
+		cls,
+		unit: WorkUnit,
+		exc: BaseException,
+		*,
+		strategy: str | None = None,
+		stage: str = 'fetch',
+	) -> Failure:
+		return cls(
+			site=unit.site,
+			year=unit.year,
+			category=unit.category,
+			url=unit.url,
+			error=type(exc).__name__,
+			message=str(exc),
+			week=unit.week,
+			season_type=unit.season_type,
+			player=unit.player,
+			columns=unit.columns,
+			strategy=strategy,
+			stage=stage,
+		)
+
+	@property
+	def unit(self) -> WorkUnit:
+		"""The work unit to fetch again."""
+		return WorkUnit(
+			site=self.site,
+			year=self.year,
+			category=self.category,
+			url=self.url,
+			player=self.player,
+			week=self.week,
+			season_type=self.season_type,
+			columns=self.columns,
+		)
+
+
+class FailureManifest:
+	"""Failed units of one or more scrapes."""
+
+	def __init__(self, failures: list[Failure] | None = None) -> None:
+		self.failures: list[Failure] = list(failures or [])
+
+	def __len__(self) -> int:
+		return len(self.failures)
+
+	def __bool__(self) -> bool:
+		return bool(self.failures)
+
+	def __iter__(self) -> Iterator[Failure]:
+		return iter(self.failures)
+
+	def __repr__(self) -> str:
+		return f'FailureManifest({len(self)} failed units)'
+
+	def record(
+		self,
+		unit: WorkUnit,
+		exc: BaseException,
+		*,
+		strategy: str | None = None,
+		stage: str = 'fetch',
+	) -> None:
+		self.failures.append(Failure.from_unit(unit, exc, strategy=strategy, stage=stage))
+
+	def extend(self, other: FailureManifest) -> None:
+		self.failures.extend(other.failures)
+
+	@property
+	def frame(self) -> pl.DataFrame:
+		"""One row per failure: site, year, category, week, season_type, URL, error, stage."""
+		rows = [{k: getattr(f, k) for k in FRAME_SCHEMA} for f in self.failures]
+		return pl.DataFrame(rows, schema=FRAME_SCHEMA)
+
+	def save(self, path: str | os.PathLike[str]) -> None:
+		"""Write the manifest as JSON lines."""
+		path = Path(path)
+		tmp = path.with_suffix(path.suffix + '.tmp')
+		tmp.write_text(''.join(json.dumps(asdict(f)) + '\n' for f in self.failures))
+		os.replace(tmp, path)
+
+	@classmethod
+	def load(cls, path: str | os.PathLike[str]) -> FailureManifest:
+		failures = []
+		for line in Path(path).read_text().splitlines():
+			entry = json.loads(line)
+			if entry.get('columns') is not None:
+				entry['columns'] = tuple(entry['columns'])
+			failures.append(Failure(**entry))
+		return cls(failures)
+
+
+__all__ = ['Failure', 'FailureManifest']
@@ -0,0 +1,104 @@
+"""Page fingerprints to skip parsing pages that have not changed.
+
+Most pages of an in-season rerun (earlier weeks, finished seasons) are
+byte-identical to the previous run, yet every fetch still paid for a full
+BeautifulSoup parse and DataFrame build. A `FingerprintIndex` remembers, per
+URL, a fast hash of the page's normalized table region together with the
+frame parsed from it. When a freshly fetched page hashes the same, the stored
+frame is returned and the page is never parsed.
+
+Only the table region (first ``<table`` to last ``</table>``) is hashed, so
+ads, timestamps and scripts elsewhere on the page do not defeat the cache.
+Pages whose pagination links matter also hash their ``<a>`` tags.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+import polars as pl
+
+INDEX_NAME = 'index.jsonl'
+
+_WHITESPACE = re.compile(r'\s+')
+_BETWEEN_TAGS = re.compile(r'>\s+<')
+_ANCHOR = re.compile(r'<a\b[^>]*>.*?</a>', re.IGNORECASE | re.DOTALL)
+
+
+def table_region(html: str) -> str:
+	"""Whitespace-normalized markup from the first ``<table`` to the last ``</table>``."""
+	lowered = html.lower()
+	start = lowered.find('<table')
+	end = lowered.rfind('</table>')
+	if start == -1 or end == -1:
+		return ''
+	region = _BETWEEN_TAGS.sub('><', html[start : end + len('</table>')])
+	return _WHITESPACE.sub(' ', region)
+
+
+def fingerprint(html: str, *, links: bool = False) -> str:
+	"""Hash of a page's table region (plus its anchors when `links` is set)."""
+	digest = hashlib.blake2b(table_region(html).encode(), digest_size=16)
+	if links:
+		for anchor in _ANCHOR.findall(html):
+			digest.update(_WHITESPACE.sub(' ', anchor).encode())
+	return digest.hexdigest()
+
+
+class FingerprintIndex:
+	"""Per-URL fingerprints and parsed frames stored under `directory`."""
+
+	def __init__(self, directory: str | os.PathLike[str]) -> None:
+		self.directory = Path(directory)
+		self.directory.mkdir(parents=True, exist_ok=True)
+		self._index = self.directory / INDEX_NAME
+		self._entries: dict[str, dict] = {}
+		self.hits = 0
+		self.misses = 0
+		if self._index.exists():
+			for line in self._index.read_text().splitlines():
+				try:
+					entry = json.loads(line)
+				except json.JSONDecodeError:  # torn final line from a crash mid-write
+					continue
+				self._entries[entry['url']] = entry  # later lines supersede earlier ones
+
+	def lookup(self, url: str, digest: str) -> tuple[pl.DataFrame, list[str]] | None:
+		"""Return the stored (frame, links) for `url` if its fingerprint still matches."""
+		entry = self._entries.get(url)
+		if entry is None or entry['hash'] != digest:
+			self.misses += 1
+			return None
+		self.hits += 1
+		if entry['file'] is None:
+			frame = pl.DataFrame([])
+		else:
+			frame = pl.read_ipc(self.directory / entry['file'], memory_map=False)
+		return frame, list(entry.get('links', []))
+
+	def links(self, url: str) -> list[str] | None:
+		"""Links stored for `url` when it was last parsed, or None if it never was."""
+		entry = self._entries.get(url)
+		return None if entry is None else list(entry.get('links', []))
+
+	def store(
+		self, url: str, digest: str, frame: pl.DataFrame, links: list[str] | None = None
+	) -> None:
+		"""Remember the parsed frame (and optional links) for `url` at `digest`."""
+		filename: str | None = None
+		if frame.shape[0] > 0:
+			filename = hashlib.sha1(url.encode()).hexdigest() + '.arrow'
+			tmp = self.directory / (filename + '.tmp')
+			frame.write_ipc(tmp)
+			os.replace(tmp, self.directory / filename)
+		entry = {'url': url, 'hash': digest, 'file': filename, 'links': list(links or [])}
+		with self._index.open('a') as fh:
+			fh.write(json.dumps(entry) + '\n')
+		self._entries[url] = entry
+
+
+__all__ = ['FingerprintIndex', 'fingerprint', 'table_region']
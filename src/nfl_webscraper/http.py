@@ -3,26 +3,132 @@
 from __future__ import annotations
 
 import asyncio
+import weakref
 
 import httpx
 from bs4 import BeautifulSoup
 
+from .latency import active_latency
+
 DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; nfl-scraper/0.1)'}
 
 
-async def fetch_html(
+class _Flights:
+	"""In-flight fetches of one client, keyed by URL."""
+
+	def __init__(self) -> None:
+		self.pending: dict[str, asyncio.Task[str]] = {}
+		# Callers still awaiting each pending URL
+		self.waiters: dict[str, int] = {}
+		self.saved = 0
+
+
+_flights: weakref.WeakKeyDictionary[httpx.AsyncClient, _Flights] = weakref.WeakKeyDictionary()
+_saved_total = 0
+
+
+def saved_requests(client: httpx.AsyncClient | None = None) -> int:
+	"""Requests avoided by coalescing, for `client` or (None) the whole process."""
+	if client is None:
+		return _saved_total
+	flights = _flights.get(client)
+	return flights.saved if flights is not None else 0
+
+
+async def fetch_text(
 	client: httpx.AsyncClient, url: str, *, retries: int = 3, backoff: float = 0.5
-) -> BeautifulSoup:
+) -> str:
+	"""Fetch a page body as text, retrying with exponential backoff.
+
+	Concurrent calls for the same URL on the same client are coalesced: the
+	first starts the request and the others await its result (see
+	`saved_requests`). A caller being cancelled does not cancel the shared
+	request for the others; once every caller has gone the request is
+	cancelled too.
+
+	Inside `latency.hedging` each attempt is hedged: if it is still pending
+	after the host's observed p95, a duplicate is sent and the first answer
+	wins.
+	"""
+	global _saved_total  # noqa: PLW0603
+	flights = _flights.setdefault(client, _Flights())
+	task = flights.pending.get(url)
+	if task is None:
+		task = asyncio.ensure_future(_fetch_text(client, url, retries=retries, backoff=backoff))
+		flights.pending[url] = task
+		task.add_done_callback(lambda _: flights.pending.pop(url, None))
+	else:
+		flights.saved += 1
+		_saved_total += 1
+	flights.waiters[url] = flights.waiters.get(url, 0) + 1
+	try:
+		return await asyncio.shield(task)
+	finally:
+		flights.waiters[url] -= 1
+		if not flights.waiters[url]:
+			del flights.waiters[url]
+			if not task.done():
+				task.cancel()
+
+
+async def _fetch_text(client: httpx.AsyncClient, url: str, *, retries: int, backoff: float) -> str:
 	last_exc: Exception | None = None
 	for attempt in range(retries):
 		try:
-			resp = await client.get(url, headers=DEFAULT_HEADERS, timeout=30.0)
+			resp = await _get(client, url)
 			resp.raise_for_status()
-			return BeautifulSoup(resp.text, 'html.parser')
+			return resp.text
 		except Exception as exc:  # noqa: BLE001
 			last_exc = exc
 			await asyncio.sleep(backoff * (2**attempt))
 	raise RuntimeError(f'Failed to fetch {url}: {last_exc}')
 
 
-__all__ = ['fetch_html', 'DEFAULT_HEADERS']
+async def _get(client: httpx.AsyncClient, url: str) -> httpx.Response:
+	"""One attempt at `url`, hedged with a duplicate when a latency tracker is active."""
+	tracker = active_latency()
+	if tracker is None:
+		return await client.get(url, headers=DEFAULT_HEADERS, timeout=30.0)
+
+	loop = asyncio.get_running_loop()
+	host = httpx.URL(url).host
+	started = loop.time()
+	primary = asyncio.ensure_future(client.get(url, headers=DEFAULT_HEADERS, timeout=30.0))
+	attempts = [primary]
+	try:
+		delay = tracker.hedge_delay(host)
+		if delay is not None:
+			await asyncio.wait(attempts, timeout=delay)
+			if not primary.done():
+				tracker.hedged += 1
+				attempts.append(
+					asyncio.ensure_future(client.get(url, headers=DEFAULT_HEADERS, timeout=30.0))
+				)
+		winner = None
+		pending = set(attempts)
+		while winner is None and pending:
+			done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+			succeeded = [t for t in done if t.exception() is None]
+			winner = succeeded[0] if succeeded else None
+		if winner is None:
+			return primary.result()  # every attempt failed: raise the first error
+		if winner is not primary:
+			tracker.hedge_wins += 1
+		resp = winner.result()
+		tracker.observe(host, loop.time() - started)
+		return resp
+	finally:
+		for attempt in attempts:
+			if not attempt.done():
+				attempt.cancel()
+
+
+async def fetch_html(
+	client: httpx.AsyncClient, url: str, *, retries: int = 3, backoff: float = 0.5
+) -> BeautifulSoup:
+	"""Fetch and parse a page; concurrent fetches of one URL share a request."""
+	text = await fetch_text(client, url, retries=retries, backoff=backoff)
+	return BeautifulSoup(text, 'html.parser')
+
+
+__all__ = ['fetch_html', 'fetch_text', 'saved_requests', 'DEFAULT_HEADERS']
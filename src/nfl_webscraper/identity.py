@@ -0,0 +1,329 @@
+"""Persistent cross-site player identity index.
+
+NFL.com and ESPN.com format player names differently (ESPN cells read
+"Name, POS", NFL.com has its own spelling of suffixes and punctuation), so
+joining the two sources used to mean fuzzy matching. `PlayerIndex` maps a
+normalized name -- plus the position when the source publishes one -- to a
+stable integer ``player_id`` and attaches it to any scraped frame with
+vectorized hash joins. Unknown players get new ids as they appear and the
+index is saved as a small Parquet file.
+
+Each index entry also keeps the team it was last seen with and that season.
+Candidates for a distinct (name, position) in a frame are the index entries
+with that name whose position does not contradict it. Resolution:
+
+1. the only candidate with the same position;
+2. otherwise the only candidate (a position learned later is filled in);
+3. otherwise the only candidate last seen with the row's team -- or, when
+   several were, the only one seen with it in the row's season;
+4. otherwise, if the frame has no position and several candidates remain,
+   ``player_id`` stays null (ambiguous);
+5. otherwise a new id is minted.
+
+One name and position on two teams in the same week (or, for season tables,
+the same season) are two players: those rows are told apart by team, and
+only candidates seen with that team (or with none) match them.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import polars as pl
+
+NAME_COLUMNS = ('player', 'Player')
+TEAM_COLUMNS = ('team', 'Team')
+
+# Historical/alternate codes mapped to the franchise's current code.
+TEAM_ALIASES = {
+	'JAC': 'JAX',
+	'WSH': 'WAS',
+	'LA': 'LAR',
+	'STL': 'LAR',
+	'SD': 'LAC',
+	'OAK': 'LV',
+	'ARZ': 'ARI',
+	'BLT': 'BAL',
+	'CLV': 'CLE',
+	'HST': 'HOU',
+}
+
+# Positions collapsed onto one code per role.
+POSITION_ALIASES = {
+	'HB': 'RB',
+	'FB': 'RB',
+	'OLB': 'LB',
+	'ILB': 'LB',
+	'MLB': 'LB',
+	'CB': 'DB',
+	'S': 'DB',
+	'SS': 'DB',
+	'FS': 'DB',
+	'DE': 'DL',
+	'DT': 'DL',
+	'NT': 'DL',
+	'PK': 'K',
+}
+
+_SUFFIX = r'\s+(jr|sr|ii|iii|iv|v)$'
+
+INDEX_SCHEMA = {
+	'player_id': pl.UInt32,
+	'name_key': pl.Utf8,
+	'position': pl.Utf8,
+	'team': pl.Utf8,
+	# Season the team was last seen in
+	'season': pl.Int16,
+	'name': pl.Utf8,
+}
+
+# Columns of a distinct player key: name, position and the team telling
+# same-named players of one week apart (null unless needed)
+_KEY = ['_name_key', '_position', '_ident']
+
+
+def normalize_name(expr: pl.Expr) -> pl.Expr:
+	"""Lowercase, accent-free, punctuation-free name without generational suffix."""
+	return (
+		expr.cast(pl.Utf8)
+		.str.normalize('NFKD')
+		.str.replace_all(r'\p{M}', '')
+		.str.to_lowercase()
+		.str.replace_all(r"[.'`’]", '')
+		.str.replace_all(r'[^a-z0-9]+', ' ')
+		.str.strip_chars()
+		.str.replace(_SUFFIX, '')
+	)
+
+
+def normalize_team(expr: pl.Expr) -> pl.Expr:
+	"""Uppercase team code with relocated/alternate codes mapped to the current one."""
+	code = expr.cast(pl.Utf8).str.strip_chars().str.to_uppercase()
+	return code.replace(TEAM_ALIASES)
+
+
+def normalize_position(expr: pl.Expr) -> pl.Expr:
+	code = expr.cast(pl.Utf8).str.strip_chars().str.to_uppercase()
+	return code.replace(POSITION_ALIASES)
+
+
+def _name_column(frame: pl.DataFrame) -> str | None:
+	return next((c for c in NAME_COLUMNS if c in frame.columns), None)
+
+
+class PlayerIndex:
+	"""Stable integer ids for players across sites, persisted at `path`."""
+
+	def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+		self.path = Path(path) if path is not None else None
+		if self.path is not None and self.path.exists():
+			table = pl.read_parquet(self.path)
+			# Indexes saved before a column existed have it null
+			added = [pl.lit(None).alias(c) for c in INDEX_SCHEMA if c not in table.columns]
+			self.table = table.with_columns(added).select(list(INDEX_SCHEMA)).cast(INDEX_SCHEMA)
+		else:
+			self.table = pl.DataFrame(schema=INDEX_SCHEMA)
+
+	def __len__(self) -> int:
+		return self.table.shape[0]
+
+	def save(self) -> None:
+		if self.path is None:
+			raise ValueError('PlayerIndex has no path to save to')
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		tmp = self.path.with_suffix('.tmp')
+		self.table.write_parquet(tmp)
+		os.replace(tmp, self.path)
+
+	def attach(self, frame: pl.DataFrame, *, update: bool = True) -> pl.DataFrame:
+		"""Return `frame` with a ``player_id`` column.
+
+		With `update` (the default) names not in the index get new ids and the
+		index is extended in memory; call `save` to persist it.
+		"""
+		name_col = _name_column(frame)
+		if name_col is None or frame.shape[0] == 0:
+			return frame.with_columns(pl.lit(None, dtype=pl.UInt32).alias('player_id'))
+
+		team_col = next((c for c in TEAM_COLUMNS if c in frame.columns), None)
+		position = (
+			normalize_position(pl.col('position'))
+			if 'position' in frame.columns
+			else pl.lit(None, dtype=pl.Utf8)
+		)
+		team = normalize_team(pl.col(team_col)) if team_col else pl.lit(None, dtype=pl.Utf8)
+		context = [
+			(pl.col(c) if c in frame.columns else pl.lit(None)).cast(pl.Int16).alias(f'_{c}')
+			for c in ('year', 'week')
+		]
+		keyed = frame.with_columns(
+			normalize_name(pl.col(name_col)).alias('_name_key'),
+			position.alias('_position'),
+			team.alias('_team'),
+			*context,
+		)
+		named = keyed.filter(pl.col('_name_key') != '')
+		# The same name and position on two teams in one week (or season table)
+		split = (
+			named.filter(pl.col('_team').is_not_null())
+			.group_by('_name_key', '_position', '_year', '_week')
+			.agg(pl.col('_team').n_unique().alias('_teams'))
+			.group_by('_name_key', '_position')
+			.agg((pl.col('_teams').max() > 1).alias('_split'))
+		)
+		keyed = keyed.join(
+			split, on=['_name_key', '_position'], how='left', nulls_equal=True
+		).with_columns(pl.when(pl.col('_split')).then(pl.col('_team')).alias('_ident'))
+		distinct = (
+			keyed.filter(pl.col('_name_key') != '')
+			.group_by(_KEY, maintain_order=True)
+			.agg(
+				pl.col(name_col).first().alias('_name'),
+				pl.col('_team').sort_by('_year', maintain_order=True).last(),
+				pl.col('_year').max().alias('_season'),
+			)
+		)
+		resolved = self._resolve(distinct, update=update)
+		return keyed.join(resolved, on=_KEY, how='left', nulls_equal=True).drop(
+			'_name_key', '_position', '_team', '_year', '_week', '_split', '_ident'
+		)
+
+	def _resolve(self, keys: pl.DataFrame, *, update: bool) -> pl.DataFrame:
+		"""Map distinct player keys to player ids, minting as needed."""
+		index = self.table
+		keys = keys.with_row_index('_key')
+		candidates = keys.join(
+			index.select(
+				pl.col('name_key').alias('_name_key'), 'player_id', 'position', 'team', 'season'
+			),
+			on='_name_key',
+		).filter(
+			pl.col('_position').is_null()
+			| pl.col('position').is_null()
+			| (pl.col('_position') == pl.col('position')),
+			pl.col('_ident').is_null()
+			| pl.col('team').is_null()
+			| (pl.col('team') == pl.col('_ident')),
+		)
+		same_team = pl.col('team') == pl.col('_team')
+		picked = candidates.group_by('_key').agg(
+			pl.len().alias('_candidates'),
+			pl.col('player_id').filter(pl.col('position') == pl.col('_position')).alias('_exact'),
+			pl.col('player_id').filter(same_team).alias('_same_team'),
+			pl.col('player_id')
+			.filter(same_team & (pl.col('season') == pl.col('_season')))
+			.alias('_same_season'),
+			pl.col('player_id').first().alias('_only'),
+		)
+
+		def only(column: str) -> pl.Expr:
+			return pl.when(pl.col(column).list.len() == 1).then(pl.col(column).list.first())
+
+		merged = keys.join(picked, on='_key', how='left').with_columns(
+			pl.coalesce(
+				# 1. same name and position
+				only('_exact'),
+				# 2. the only candidate
+				pl.when(pl.col('_candidates') == 1).then('_only'),
+				# 3. team, then season, as tiebreakers
+				only('_same_team'),
+				only('_same_season'),
+			).alias('player_id')
+		)
+		# 4. ambiguous: no position or team to tell several same-named players apart
+		ambiguous = (
+			pl.col('player_id').is_null()
+			& pl.col('_position').is_null()
+			& (pl.col('_candidates').fill_null(0) > 1)
+		)
+		missing = merged.filter(pl.col('player_id').is_null() & ~ambiguous)
+
+		if update:
+			matched = merged.filter(pl.col('player_id').is_not_null())
+			# Positions learned for entries that had none
+			learned = matched.filter(pl.col('_position').is_not_null()).select(
+				'player_id', pl.col('_position').alias('_learned')
+			)
+			# The team of the latest season seen
+			seen = matched.sort('_season', nulls_last=False, maintain_order=True).select(
+				'player_id', pl.col('_team').alias('_seen_team'), pl.col('_season').alias('_seen')
+			)
+			newer = pl.col('_seen_team').is_not_null() & (
+				pl.col('season').is_null()
+				| pl.col('_seen').is_null()
+				| (pl.col('_seen') >= pl.col('season'))
+			)
+			index = (
+				index.join(learned.unique('player_id'), on='player_id', how='left')
+				.join(seen.unique('player_id', keep='last'), on='player_id', how='left')
+				.with_columns(
+					pl.coalesce('position', '_learned').alias('position'),
+					pl.when(newer).then('_seen_team').otherwise('team').alias('team'),
+					pl.when(newer)
+					.then(pl.coalesce('_seen', 'season'))
+					.otherwise('season')
+					.alias('season'),
+				)
+				.drop('_learned', '_seen_team', '_seen')
+			)
+			# Position-less rows whose name also arrives with a position in this
+			# batch are resolved after those are minted (rule 2 then applies).
+			positioned = missing.filter(pl.col('_position').is_not_null())['_name_key']
+			deferred = missing.filter(
+				pl.col('_position').is_null() & pl.col('_name_key').is_in(positioned.implode())
+			)
+			missing = missing.join(deferred, on=_KEY, how='anti', nulls_equal=True)
+			# 5. mint ids for players never seen before
+			start = int(index['player_id'].max() or 0) + 1 if index.shape[0] else 1
+			minted = (
+				missing.select(*_KEY, '_team', '_season', '_name')
+				.unique(_KEY, maintain_order=True)
+				.with_row_index('player_id', offset=start)
+			)
+			self.table = pl.concat([
+				index,
+				minted.select(
+					pl.col('player_id').cast(pl.UInt32),
+					pl.col('_name_key').alias('name_key'),
+					pl.col('_position').alias('position'),
+					pl.col('_team').alias('team'),
+					pl.col('_season').alias('season'),
+					pl.col('_name').alias('name'),
+				),
+			]).cast(INDEX_SCHEMA)
+			merged = merged.join(
+				minted.select(*_KEY, pl.col('player_id').alias('_minted')),
+				on=_KEY,
+				how='left',
+				nulls_equal=True,
+			).with_columns(pl.coalesce('player_id', '_minted').alias('player_id'))
+			if deferred.shape[0]:
+				second = self._resolve(
+					deferred.select(*_KEY, '_team', '_season', '_name'), update=True
+				)
+				merged = merged.join(
+					second.rename({'player_id': '_deferred'}), on=_KEY, how='left', nulls_equal=True
+				).with_columns(pl.coalesce('player_id', '_deferred').alias('player_id'))
+
+		return merged.select(*_KEY, pl.col('player_id').cast(pl.UInt32))
+
+
+def attach_player_ids(
+	frame: pl.DataFrame, path: str | os.PathLike[str], *, update: bool = True
+) -> pl.DataFrame:
+	"""Attach ``player_id`` using the index stored at `path`, saving any new players."""
+	index = PlayerIndex(path)
+	out = index.attach(frame, update=update)
+	if update:
+		index.save()
+	return out
+
+
+__all__ = [
+	'PlayerIndex',
+	'attach_player_ids',
+	'normalize_name',
+	'normalize_position',
+	'normalize_team',
+]
@@ -0,0 +1,109 @@
+"""Scrape-wide deadlines and per-host latency tracking for hedged requests.
+
+A single slow page used to hold up the whole gather: the only bound was the
+30 s per-attempt timeout in `http.fetch_text`, times the retries. A
+`Deadline` is one budget for a whole scrape; `BaseSiteScraper.fetch_units`
+cancels the units still running when it expires and records them in the
+failure manifest (as `DeadlineExceededError`), so the rows already fetched are
+returned and the stragglers can be retried later.
+
+`HostLatency` keeps a rolling sample of response times per host. While one
+is active (see `hedging`), a request that is still outstanding after the
+host's observed p95 gets a duplicate, and whichever answers first is used.
+Hedging only starts once a host has `MIN_SAMPLES` observations, so the
+first requests of a scrape are never doubled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import math
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from .exceptions import DeadlineExceededError
+
+# Observations needed before a host's p95 is trusted.
+MIN_SAMPLES = 20
+# Rolling window of response times kept per host.
+WINDOW = 200
+
+
+class Deadline:
+	"""An absolute point on the event loop's clock by which a scrape must finish."""
+
+	def __init__(self, seconds: float) -> None:
+		self.seconds = seconds
+		self.when = asyncio.get_running_loop().time() + seconds
+
+	def remaining(self) -> float:
+		"""Seconds left (never negative)."""
+		return max(0.0, self.when - asyncio.get_running_loop().time())
+
+	@property
+	def expired(self) -> bool:
+		return self.remaining() == 0.0
+
+	def error(self) -> DeadlineExceededError:
+		return DeadlineExceededError(f'scrape deadline of {self.seconds:g}s exceeded')
+
+
+class HostLatency:
+	"""Rolling response times per host and the hedge delay derived from them."""
+
+	def __init__(self, *, quantile: float = 0.95, min_samples: int = MIN_SAMPLES) -> None:
+		self.quantile = quantile
+		self.min_samples = min_samples
+		self.samples: dict[str, deque[float]] = {}
+		# Duplicates fired, and how many of them answered first
+		self.hedged = 0
+		self.hedge_wins = 0
+
+	def observe(self, host: str, seconds: float) -> None:
+		self.samples.setdefault(host, deque(maxlen=WINDOW)).append(seconds)
+
+	def percentile(self, host: str) -> float | None:
+		"""The host's observed `quantile` response time, or None with too few samples."""
+		samples = self.samples.get(host)
+		if not samples or len(samples) < self.min_samples:
+			return None
+		ordered = sorted(samples)
+		return ordered[min(len(ordered) - 1, math.ceil(self.quantile * len(ordered)) - 1)]
+
+	def median(self, host: str) -> float | None:
+		"""The host's typical response time, or None before anything was observed."""
+		samples = self.samples.get(host)
+		if not samples:
+			return None
+		ordered = sorted(samples)
+		return ordered[len(ordered) // 2]
+
+	def hedge_delay(self, host: str) -> float | None:
+		"""How long to wait before duplicating a request to `host` (None: never)."""
+		return self.percentile(host)
+
+
+_active: contextvars.ContextVar[HostLatency | None] = contextvars.ContextVar(
+	'hedging', default=None
+)
+
+
+def active_latency() -> HostLatency | None:
+	"""The tracker hedging requests in the current context, if any."""
+	return _active.get()
+
+
+@contextmanager
+def hedging(tracker: HostLatency | None = None) -> Iterator[HostLatency]:
+	"""Hedge every fetch made in this context (and tasks it starts) against `tracker`."""
+	tracker = tracker if tracker is not None else HostLatency()
+	token = _active.set(tracker)
+	try:
+		yield tracker
+	finally:
+		_active.reset(token)
+
+
+__all__ = ['Deadline', 'DeadlineExceededError', 'HostLatency', 'active_latency', 'hedging']
@@ -7,57 +7,84 @@ import asyncio
 import httpx
 import polars as pl
 
-from .discover import BASE_URL
-from .http import fetch_html
-from .parsing import parse_stats_table
+from .extract import cached_page, extract_page, remember
+from .fingerprint import FingerprintIndex, fingerprint
+from .http import fetch_text
+
+
+async def _load_page(
+	client: httpx.AsyncClient,
+	url: str,
+	*,
+	with_links: bool,
+	columns: tuple[str, ...] | None,
+	fingerprints: FingerprintIndex | None,
+) -> tuple[pl.DataFrame, list[str]]:
+	"""Fetch and extract one page, reusing the stored frame when its fingerprint matches."""
+	page = cached_page(client, url, columns)
+	if page is not None:
+		return page.table, page.page_links if with_links else []
+	text = await fetch_text(client, url)
+	digest = None
+	cache_key = url if columns is None else f'{url}#{",".join(columns)}'
+	if fingerprints is not None:
+		digest = fingerprint(text, links=with_links)
+		cached = fingerprints.lookup(cache_key, digest)
+		if cached is not None:
+			return cached
+	page = extract_page(text, url, columns=columns)
+	remember(client, url, page, columns)
+	links = page.page_links if with_links else []
+	if fingerprints is not None and digest is not None:
+		fingerprints.store(cache_key, digest, page.table, links)
+	return page.table, links
 
 
 async def fetch_all_stats_parallel(
-	client: httpx.AsyncClient, start_url: str, *, concurrency: int = 20
+	client: httpx.AsyncClient,
+	start_url: str,
+	*,
+	concurrency: int = 20,
+	columns: tuple[str, ...] | None = None,
+	fingerprints: FingerprintIndex | None = None,
 ) -> pl.DataFrame:
-	first_soup = await fetch_html(client, start_url)
-	first_df, next_links = parse_stats_table(first_soup)
-	headers = list(first_df.columns) if first_df.shape[1] > 0 else None
-	rows = list(first_df.rows()) if first_df.shape[0] > 0 else []
-	page_urls: set[str] = set()
-	for a in first_soup.find_all('a'):
-		tx = a.get_text(strip=True)
-		if tx.isdigit() or tx.lower() == 'next':
-			href = a.get('href')
-			if href:
-				if not href.startswith('http'):
-					href = BASE_URL.rstrip('/') + '/' + href.lstrip('/')
-				page_urls.add(href)
-	for nl in next_links:
-		if not nl.startswith('http'):
-			full_url = BASE_URL.rstrip('/') + '/' + nl.lstrip('/')
-		else:
-			full_url = nl
-		page_urls.add(full_url)
+	"""Fetch a stats table and all of its pages, concatenated into one frame.
+
+	Pages stay columnar: each parsed page frame is kept as-is and the pages are
+	concatenated once at the end, aligning columns that differ between pages.
+	With a `fingerprints` index, pages whose table is unchanged since the last
+	run are not parsed at all. `columns` projects each page while parsing.
+	"""
+	first_df, links = await _load_page(
+		client, start_url, with_links=True, columns=columns, fingerprints=fingerprints
+	)
+	page_urls = set(links)
 	if start_url in page_urls:
 		page_urls.remove(start_url)
 	if not page_urls:
-		return (
-			pl.DataFrame(rows, schema=headers, orient='row')
-			if headers
-			else pl.DataFrame(rows, orient='row')
-		)
+		return first_df
 	semaphore = asyncio.Semaphore(concurrency)
 
-	async def fetch_and_parse(u: str) -> list[tuple]:
+	async def fetch_and_parse(u: str) -> pl.DataFrame:
 		async with semaphore:
-			soup = await fetch_html(client, u)
-			df, _ = parse_stats_table(soup)
-			return list(df.rows()) if df.shape[0] > 0 else []
+			df, _ = await _load_page(
+				client, u, with_links=False, columns=columns, fingerprints=fingerprints
+			)
+			return df
 
 	tasks = [fetch_and_parse(u) for u in sorted(page_urls)]
-	for part in await asyncio.gather(*tasks):
-		rows.extend(part)
-		return (
-			pl.DataFrame(rows, schema=headers, orient='row')
-			if headers
-			else pl.DataFrame(rows, orient='row')
-		)
+	pages = [first_df, *await asyncio.gather(*tasks)]
+	return concat_pages(pages)
+
+
+def concat_pages(pages: list[pl.DataFrame]) -> pl.DataFrame:
+	"""Concatenate page frames in one pass, unioning columns and relaxing dtypes."""
+	pages = [df for df in pages if df.shape[0] > 0]
+	if not pages:
+		return pl.DataFrame([])
+	if len(pages) == 1:
+		return pages[0]
+	return pl.concat(pages, how='diagonal_relaxed', rechunk=True)
 
 
-__all__ = ['fetch_all_stats_parallel']
+__all__ = ['concat_pages', 'fetch_all_stats_parallel']
@@ -3,24 +3,20 @@
 from __future__ import annotations
 
 import polars as pl
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 
-def parse_stats_table(soup: BeautifulSoup) -> tuple[pl.DataFrame, list[str]]:
+def parse_stats_table(
+	soup: BeautifulSoup, columns: tuple[str, ...] | None = None
+) -> tuple[pl.DataFrame, list[str]]:
+	"""Parse the first table on a page and collect its 'next' links.
+
+	If `columns` is given only those header columns are extracted.
+	"""
 	table = soup.find('table')
 	if not table:
 		return pl.DataFrame([]), []
-	headers = [th.get_text(strip=True) for th in table.find_all('th')]
-	rows: list[list[str]] = []
-	for tr in table.find_all('tr')[1:]:
-		cells = [td.get_text(strip=True) for td in tr.find_all('td')]
-		if cells:
-			rows.append(cells)
-		df = (
-			pl.DataFrame(rows, schema=headers, orient='row')
-			if headers
-			else pl.DataFrame(rows, orient='row')
-		)
+	df = table_frame(table, columns)
 	next_links: list[str] = []
 	for a in soup.find_all('a'):
 		if 'next' in a.get_text(strip=True).lower():
@@ -30,4 +26,29 @@ def parse_stats_table(soup: BeautifulSoup) -> tuple[pl.DataFrame, list[str]]:
 	return df, next_links
 
 
-__all__ = ['parse_stats_table']
+def table_frame(table: Tag, columns: tuple[str, ...] | None = None) -> pl.DataFrame:
+	"""Frame of a ``<table>``'s ``<td>`` rows under its ``<th>`` headers.
+
+	If `columns` is given only those header columns are extracted.
+	"""
+	headers = [th.get_text(strip=True) for th in table.find_all('th')]
+	keep: list[int] | None = None
+	if columns is not None and headers:
+		keep = [i for i, h in enumerate(headers) if h in columns]
+		headers = [headers[i] for i in keep]
+	rows: list[list[str]] = []
+	for tr in table.find_all('tr')[1:]:
+		tds = tr.find_all('td')
+		if keep is not None:
+			tds = [tds[i] for i in keep if i < len(tds)]
+		cells = [td.get_text(strip=True) for td in tds]
+		if cells:
+			rows.append(cells)
+	return (
+		pl.DataFrame(rows, schema=headers, orient='row')
+		if headers
+		else pl.DataFrame(rows, orient='row')
+	)
+
+
+__all__ = ['parse_stats_table', 'table_frame']
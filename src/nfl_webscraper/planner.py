@@ -0,0 +1,266 @@
+"""Dry-run planning: what a scrape would fetch, and what it would cost.
+
+`plan` runs each scraper's `plan_units` without fetching any unit and
+returns a `Plan`: one row per work unit with its predicted request count and
+cache coverage, plus a duration estimate. ESPN.com units are one page each
+and their URLs are deterministic, so its plan costs no requests (unless the
+years have to be discovered). NFL.com planning fetches the discovery pages
+(the root page and one page per year); those requests are counted
+separately. An NFL.com table's page count is taken from the links stored in
+the fingerprint index when available, otherwise from the mean of the tables
+that are known, or `DEFAULT_PAGES`.
+
+A unit already in the checkpoint costs nothing. The duration of each site is
+its request count spread over the scraper's concurrency at the host's
+typical latency (from a `HostLatency` of earlier scrapes, or
+`DEFAULT_LATENCY`), and never below what an optional per-host rate limit
+allows. Sites are scraped concurrently, so the slowest one sets the total.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import dataclass
+
+import httpx
+import polars as pl
+
+from .api import SCRAPERS, SiteName
+from .checkpoint import Checkpoint
+from .fingerprint import FingerprintIndex
+from .latency import HostLatency
+from .sites.base import WorkUnit
+
+# Seconds per request assumed for hosts without observed latencies
+DEFAULT_LATENCY = 0.5
+# Pages assumed per NFL.com table when no table's page count is known
+DEFAULT_PAGES = 1
+
+UNITS_SCHEMA = {
+	'site': pl.Utf8,
+	'year': pl.Int64,
+	'category': pl.Utf8,
+	'season_type': pl.Utf8,
+	'week': pl.Int64,
+	'url': pl.Utf8,
+	'host': pl.Utf8,
+	'requests': pl.Int64,
+	# Request count comes from stored page links rather than an estimate
+	'known': pl.Boolean,
+	# Unit is already in the checkpoint and will not be fetched
+	'checkpointed': pl.Boolean,
+}
+
+
+@dataclass(frozen=True)
+class Plan:
+	"""Work units of a prospective scrape with their predicted cost."""
+
+	units: pl.DataFrame
+	# Requests made while planning (NFL.com/ESPN.com discovery pages)
+	discovery_requests: int
+	# Estimated seconds per site for the unit requests
+	site_seconds: dict[str, float]
+
+	def __repr__(self) -> str:
+		return (
+			f'Plan({self.units.shape[0]} units, {self.requests} requests, '
+			f'~{self.seconds:.0f}s)'
+		)
+
+	@property
+	def requests(self) -> int:
+		"""Predicted requests of the scrape itself (discovery not included)."""
+		return int(self.units['requests'].sum())
+
+	@property
+	def seconds(self) -> float:
+		"""Estimated duration; sites are scraped concurrently."""
+		return max(self.site_seconds.values(), default=0.0)
+
+	@property
+	def summary(self) -> pl.DataFrame:
+		"""Per site: units, checkpointed units, requests and estimated seconds."""
+		seconds = pl.DataFrame(
+			{'site': list(self.site_seconds), 'seconds': list(self.site_seconds.values())},
+			schema={'site': pl.Utf8, 'seconds': pl.Float64},
+		)
+		return (
+			self.units.group_by('site', maintain_order=True)
+			.agg(
+				pl.len().alias('units'),
+				pl.col('checkpointed').sum().alias('checkpointed'),
+				pl.col('requests').sum(),
+			)
+			.join(seconds, on='site', how='left')
+		)
+
+
+def _pages(unit: WorkUnit, fingerprints: FingerprintIndex | None) -> int | None:
+	"""Pages of an NFL.com table according to the fingerprint index, if stored."""
+	if fingerprints is None:
+		return None
+	cache_key = unit.url if unit.columns is None else f'{unit.url}#{",".join(unit.columns)}'
+	links = fingerprints.links(cache_key)
+	if links is None:
+		return None
+	return 1 + len(set(links) - {unit.url})
+
+
+def _unit_rows(
+	units: list[WorkUnit],
+	*,
+	checkpoint: Checkpoint | None,
+	fingerprints: FingerprintIndex | None,
+) -> pl.DataFrame:
+	rows = []
+	for unit in units:
+		paginated = unit.week is None  # NFL.com tables; ESPN.com pages are single
+		pages = _pages(unit, fingerprints) if paginated else 1
+		rows.append({
+			'site': unit.site,
+			'year': unit.year,
+			'category': unit.category,
+			'season_type': unit.season_type,
+			'week': unit.week,
+			'url': unit.url,
+			'host': httpx.URL(unit.url).host,
+			'requests': pages,
+			'known': pages is not None,
+			'checkpointed': checkpoint is not None and unit in checkpoint,
+		})
+	frame = pl.DataFrame(rows, schema=UNITS_SCHEMA)
+	known = frame.filter(pl.col('known'))['requests']
+	fallback = round(known.mean()) if known.len() else DEFAULT_PAGES
+	return frame.with_columns(
+		pl.when(pl.col('checkpointed'))
+		.then(0)
+		.otherwise(pl.col('requests').fill_null(fallback))
+		.alias('requests')
+	)
+
+
+def _site_seconds(
+	units: pl.DataFrame,
+	concurrency: dict[str, int],
+	latency: HostLatency | None,
+	rate_limits: dict[str, float] | None,
+) -> dict[str, float]:
+	seconds: dict[str, float] = {}
+	per_host = units.group_by('site', 'host', maintain_order=True).agg(pl.col('requests').sum())
+	for site, host, requests in per_host.iter_rows():
+		typical = latency.median(host) if latency is not None else None
+		estimate = requests * (typical or DEFAULT_LATENCY) / concurrency[site]
+		if rate_limits and host in rate_limits:
+			estimate = max(estimate, requests / rate_limits[host])
+		seconds[site] = seconds.get(site, 0.0) + estimate
+	return seconds
+
+
+async def _plan(
+	years: list[int] | None,
+	sites: list[SiteName],
+	*,
+	player: bool,
+	categories: list[str] | None,
+	weeks: list[int] | None,
+	season_types: list[str] | None,
+	columns: list[str] | None,
+	concurrency: int | None,
+	checkpoint: str | os.PathLike[str] | None,
+	fingerprints: str | os.PathLike[str] | None,
+	latency: HostLatency | None,
+	rate_limits: dict[str, float] | None,
+) -> Plan:
+	journal = Checkpoint(checkpoint) if checkpoint is not None else None
+	index = FingerprintIndex(fingerprints) if fingerprints is not None else None
+	discovery = 0
+
+	async def count(request: httpx.Request) -> None:
+		nonlocal discovery
+		discovery += 1
+
+	scrapers = [SCRAPERS[site] for site in sites if site in SCRAPERS]
+	async with httpx.AsyncClient() as client:
+		client.event_hooks['request'].append(count)
+		planned = await asyncio.gather(*(
+			scraper.plan_units(
+				client,
+				years,
+				player=player,
+				categories=categories,
+				weeks=weeks,
+				season_types=season_types,
+				columns=columns,
+			)
+			for scraper in scrapers
+		))
+
+	frames = [_unit_rows(units, checkpoint=journal, fingerprints=index) for units in planned]
+	units = pl.concat(frames) if frames else pl.DataFrame(schema=UNITS_SCHEMA)
+	limits = {s.site_name: concurrency or s.concurrency for s in scrapers}
+	return Plan(units, discovery, _site_seconds(units, limits, latency, rate_limits))
+
+
+def plan(
+	years: list[int] | None = None,
+	*,
+	sites: list[SiteName] | SiteName = 'nfl.com',
+	player: bool = True,
+	categories: list[str] | None = None,
+	weeks: list[int] | None = None,
+	season_types: list[str] | None = None,
+	columns: list[str] | None = None,
+	concurrency: int | None = None,
+	checkpoint: str | os.PathLike[str] | None = None,
+	fingerprints: str | os.PathLike[str] | None = None,
+	latency: HostLatency | None = None,
+	rate_limits: dict[str, float] | None = None,
+) -> Plan:
+	"""Plan a scrape without fetching it: units, predicted requests and duration.
+
+	Parameters
+	----------
+	years, sites, categories, weeks, season_types, columns:
+		The selection, as for `get_all_player_stats`/`get_all_team_stats`.
+	player:
+		If True plan a player scrape; otherwise a team scrape.
+	concurrency:
+		Per-site concurrency the scrape will run with (each scraper has a default).
+	checkpoint:
+		Optional checkpoint directory; units it holds are marked and cost nothing.
+	fingerprints:
+		Optional fingerprint index; its stored pagination links give NFL.com
+		tables' exact page counts.
+	latency:
+		Optional `HostLatency` from earlier scrapes (e.g. the tracker passed as
+		``hedge=``); its median per host replaces `DEFAULT_LATENCY`.
+	rate_limits:
+		Optional requests per second allowed per host (e.g. ``{'www.nfl.com': 2}``).
+
+	Returns
+	-------
+	Plan
+		``units`` has one row per work unit; ``requests``, ``seconds`` and
+		``summary`` give the totals.
+	"""
+	if isinstance(sites, str):
+		sites = [sites]
+	return asyncio.run(_plan(
+		years,
+		sites,
+		player=player,
+		categories=categories,
+		weeks=weeks,
+		season_types=season_types,
+		columns=columns,
+		concurrency=concurrency,
+		checkpoint=checkpoint,
+		fingerprints=fingerprints,
+		latency=latency,
+		rate_limits=rate_limits,
+	))
+
+
+__all__ = ['DEFAULT_LATENCY', 'DEFAULT_PAGES', 'Plan', 'plan']
@@ -0,0 +1,71 @@
+"""SQL over the locally stored dataset.
+
+`query` registers lazy scans of a stored `Dataset` in a Polars SQL context
+and executes the statement lazily, so nothing is read until the plan is
+optimized: filters on source, year and category prune whole partition files
+(hive layout), other predicates such as ``team = 'KC'`` are evaluated inside
+the Parquet reader, and only the referenced columns are decoded. Memory is
+bounded by the rows a query actually touches, not by the number of seasons
+stored.
+
+Tables
+------
+stats:
+    Every stored row (see `Dataset.scan`).
+player_season, team_week, team_season:
+    The materialized aggregate views, when they exist.
+"""
+
+from __future__ import annotations
+
+import os
+
+import polars as pl
+
+from .store import Dataset
+
+STATS_TABLE = 'stats'
+
+
+def sql_context(
+	root: str | os.PathLike[str], **frames: pl.DataFrame | pl.LazyFrame
+) -> pl.SQLContext:
+	"""SQL context with the dataset at `root`, its aggregate views and any extra `frames`."""
+	dataset = Dataset(root)
+	tables: dict[str, pl.LazyFrame] = {STATS_TABLE: dataset.scan()}
+	for name in dataset.aggregates.names():
+		tables[name] = dataset.aggregates.scan(name)
+	tables.update({name: frame.lazy() for name, frame in frames.items()})
+	return pl.SQLContext(tables)
+
+
+def query(
+	sql: str,
+	root: str | os.PathLike[str],
+	*,
+	lazy: bool = False,
+	**frames: pl.DataFrame | pl.LazyFrame,
+) -> pl.DataFrame | pl.LazyFrame:
+	"""Run `sql` against the dataset stored at `root`.
+
+	Parameters
+	----------
+	sql:
+		A SELECT statement over the ``stats`` table and/or the aggregate views.
+	root:
+		Directory of the stored dataset (as passed to `upsert`).
+	lazy:
+		Return the optimized-but-unexecuted LazyFrame instead of collecting it.
+	**frames:
+		Extra tables to register under the given names (e.g. a player index).
+
+	Returns
+	-------
+	pl.DataFrame | pl.LazyFrame
+		The query result.
+	"""
+	result = sql_context(root, **frames).execute(sql, eager=False)
+	return result if lazy else result.collect()
+
+
+__all__ = ['query', 'sql_context']
@@ -0,0 +1,152 @@
+"""Per-category and long (tidy) layouts instead of one sparse wide table.
+
+`unify_frames` takes the union of every column of every category and site,
+so a punting row carries all the passing, rushing, receiving and kickoff
+columns as nulls; memory and Parquet size grow with categories x columns.
+Two other layouts keep only the values that exist:
+
+- per category: ``{category: frame}``, each frame holding only the columns
+  its category has (`CategoryFrames.frames`, `split_categories`);
+- long: one row per ``(entity, year, week, category, stat, value)`` with the
+  value as Float64 (`to_long`); NFL.com's text cells are parsed.
+
+`CategoryFrames` is a `FrameSink`: handed to a scrape it collects unit
+frames by category as they complete, so the wide union is never built.
+"""
+
+from __future__ import annotations
+
+import polars as pl
+
+from .compact import parse_numeric
+from .schema import CONTEXT_SCHEMA, unify_frames
+
+# Columns that identify a row rather than measure something
+ENTITY_COLUMNS = ('player_id', 'player', 'Player', 'position', 'team', 'Team', 'result')
+
+LONG_SCHEMA: dict[str, pl.DataType] = {
+	'source': CONTEXT_SCHEMA['source'],
+	'year': CONTEXT_SCHEMA['year'],
+	'season_type': CONTEXT_SCHEMA['season_type'],
+	'week': CONTEXT_SCHEMA['week'],
+	'category': CONTEXT_SCHEMA['category'],
+	'entity': pl.Utf8,
+	'team': pl.Categorical(),
+	'stat': pl.Categorical(),
+	'value': pl.Float64,
+}
+
+
+def stat_columns(frame: pl.DataFrame) -> list[str]:
+	"""Columns of `frame` holding statistics (everything but context and entity columns)."""
+	return [c for c in frame.columns if c not in CONTEXT_SCHEMA and c not in ENTITY_COLUMNS]
+
+
+def drop_empty_columns(frame: pl.DataFrame) -> pl.DataFrame:
+	"""`frame` without the columns that are null in every row."""
+	if frame.shape[0] == 0:
+		return frame
+	counts = frame.select(pl.all().count()).row(0, named=True)
+	return frame.select([c for c, n in counts.items() if n > 0])
+
+
+def split_categories(frame: pl.DataFrame) -> dict[str, pl.DataFrame]:
+	"""Split a wide frame into ``{category: frame}`` keeping only each category's columns."""
+	if frame.shape[0] == 0:
+		return {}
+	return {
+		str(category): drop_empty_columns(part)
+		for (category,), part in frame.partition_by('category', as_dict=True).items()
+	}
+
+
+def _first(frame: pl.DataFrame, names: tuple[str, ...]) -> pl.Expr:
+	present = [pl.col(n).cast(pl.Utf8) for n in names if n in frame.columns]
+	return pl.coalesce(present) if present else pl.lit(None, dtype=pl.Utf8)
+
+
+def entity(frame: pl.DataFrame) -> pl.Expr:
+	"""The row's player name or, for team stats, its team (as text)."""
+	return _first(frame, ('player', 'Player', 'team', 'Team'))
+
+
+def team(frame: pl.DataFrame) -> pl.Expr:
+	"""The row's team (as text), null when the frame has no team column."""
+	return _first(frame, ('team', 'Team'))
+
+
+def to_long(frame: pl.DataFrame) -> pl.DataFrame:
+	"""Unpivot `frame` to ``source, year, season_type, week, category, entity, team, stat, value``.
+
+	`entity` is the player (or, for team stats, the team); cells without a
+	numeric value are dropped.
+	"""
+	stats = stat_columns(frame)
+	if frame.shape[0] == 0 or not stats:
+		return pl.DataFrame(schema=LONG_SCHEMA)
+	ids = frame.select(
+		*(
+			pl.col(c).cast(dt) if c in frame.columns else pl.lit(None, dtype=dt).alias(c)
+			for c, dt in LONG_SCHEMA.items()
+			if c in CONTEXT_SCHEMA
+		),
+		entity(frame).alias('entity'),
+		team(frame).cast(LONG_SCHEMA['team']).alias('team'),
+		*(
+			(parse_numeric(c) if frame.schema[c] == pl.Utf8 else pl.col(c))
+			.cast(pl.Float64)
+			.alias(c)
+			for c in stats
+		),
+	)
+	return (
+		ids.unpivot(
+			stats,
+			index=[c for c in LONG_SCHEMA if c not in ('stat', 'value')],
+			variable_name='stat',
+			value_name='value',
+		)
+		.drop_nulls('value')
+		.with_columns(pl.col('stat').cast(LONG_SCHEMA['stat']))
+	)
+
+
+class CategoryFrames:
+	"""`FrameSink` collecting unit frames by category (see the module docstring)."""
+
+	def __init__(self) -> None:
+		self._parts: dict[str, list[pl.DataFrame]] = {}
+
+	def add(self, frame: pl.DataFrame) -> None:
+		if frame.shape[0] == 0:
+			return
+		for category, part in split_categories(frame).items():
+			self._parts.setdefault(category, []).append(part)
+
+	@property
+	def frames(self) -> dict[str, pl.DataFrame]:
+		"""One frame per category with only that category's columns."""
+		return {
+			category: drop_empty_columns(unify_frames(parts))
+			for category, parts in sorted(self._parts.items())
+		}
+
+	def long(self) -> pl.DataFrame:
+		"""Every collected row in the long layout (see `to_long`)."""
+		frames = [to_long(part) for parts in self._parts.values() for part in parts]
+		if not frames:
+			return pl.DataFrame(schema=LONG_SCHEMA)
+		return pl.concat(frames, how='vertical', rechunk=True)
+
+
+__all__ = [
+	'ENTITY_COLUMNS',
+	'LONG_SCHEMA',
+	'CategoryFrames',
+	'drop_empty_columns',
+	'entity',
+	'split_categories',
+	'stat_columns',
+	'team',
+	'to_long',
+]
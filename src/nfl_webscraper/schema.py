@@ -1,59 +1,121 @@
-"""Schema harmonization utilities."""
+"""Schema harmonization utilities.
+
+Column types come from a static registry instead of being inferred from
+whichever frame happens to come first. Context columns (year, week,
+season_type, category, source) are shared by every site; stat columns are
+declared per site. ESPN.com's cleaned columns keep the same meaning in every
+category, so one table covers all of them; columns it does not declare are
+kept as text by both ESPN decoders. NFL.com cells are kept verbatim as
+strings, only its player/team columns are declared.
+
+Low-cardinality strings are dictionary encoded: `source` and `season_type`
+are `pl.Enum` over their fixed values, while category, team and position
+(open-ended sets) are `pl.Categorical`.
+"""
 
 from __future__ import annotations
 
 import polars as pl
 
+Frame = pl.DataFrame | pl.LazyFrame
+
+SOURCE = pl.Enum(['NFL.com', 'ESPN.com'])
+SEASON_TYPE = pl.Enum(['regular', 'postseason'])
+
+CONTEXT_SCHEMA: dict[str, pl.DataType] = {
+	'year': pl.Int16,
+	'week': pl.Int8,
+	'season_type': SEASON_TYPE,
+	'category': pl.Categorical(),
+	'source': SOURCE,
+}
+
+_ESPN_COUNTS = (
+	'completions', 'attempts', 'yards', 'touchdowns', 'interceptions', 'sacks',
+	'fumbles', 'carries', 'receptions', 'targets', 'longest',
+	# defensive leaders: solo/assisted/total tackles, forced/recovered fumbles,
+	# passes defended
+	'solo', 'ast', 'tot', 'ff', 'fr', 'pd',
+)
+
+SITE_SCHEMAS: dict[str, dict[str, pl.DataType]] = {
+	'ESPN.com': {
+		'rank': pl.Int16,
+		'player': pl.Utf8,
+		'position': pl.Categorical(),
+		'team': pl.Categorical(),
+		'result': pl.Utf8,
+		**dict.fromkeys(_ESPN_COUNTS, pl.Int16),
+		'sacks': pl.Float32,  # defensive leaders credit half sacks
+		'rating': pl.Float32,
+		'average': pl.Float32,
+	},
+	'NFL.com': {
+		'Player': pl.Utf8,
+		'Team': pl.Categorical(),
+	},
+}
+
+REGISTRY: dict[str, pl.DataType] = {
+	**{col: dt for schema in SITE_SCHEMAS.values() for col, dt in schema.items()},
+	**CONTEXT_SCHEMA,
+}
+
+
+def site_schema(site: str) -> dict[str, pl.DataType]:
+	"""Declared stat and context column types for `site` (e.g. 'ESPN.com')."""
+	return {**SITE_SCHEMAS.get(site, {}), **CONTEXT_SCHEMA}
+
+
+def conform(frame: pl.DataFrame) -> pl.DataFrame:
+	"""Cast every registered column of `frame` to its declared type."""
+	casts = [
+		pl.col(col).cast(REGISTRY[col])
+		for col, dt in frame.schema.items()
+		if col in REGISTRY and dt != REGISTRY[col]
+	]
+	return frame.with_columns(casts) if casts else frame
+
 
-def _collect_all_columns(frames: list[pl.DataFrame]) -> list[str]:
+def _collect_all_columns(schemas: list[pl.Schema]) -> list[str]:
 	"""Collect all unique columns and order them with year/category first."""
 	all_cols: set[str] = set()
-	for f in frames:
-		all_cols.update(f.columns)
+	for schema in schemas:
+		all_cols.update(schema.names())
 	return [c for c in ['year', 'category'] if c in all_cols] + [
 		c for c in sorted(all_cols) if c not in {'year', 'category'}
 	]
 
 
-def _build_target_schema(frames: list[pl.DataFrame]) -> dict[str, pl.datatypes.PolarsDataType]:
-	"""Build target schema from all frames, preferring non-Null types."""
-	target: dict[str, pl.datatypes.PolarsDataType] = {}
-	for f in frames:
-		for col, dt in zip(f.columns, f.dtypes, strict=False):
+def _build_target_schema(
+	schemas: list[pl.Schema], columns: list[str]
+) -> dict[str, pl.datatypes.PolarsDataType]:
+	"""Registry types for `columns`; unregistered ones take their first non-Null type."""
+	target = {c: REGISTRY[c] for c in columns if c in REGISTRY}
+	for schema in schemas:
+		for col, dt in schema.items():
 			if col not in target and dt != pl.Null:
 				target[col] = dt
-	target.setdefault('year', pl.Int64)
-	target.setdefault('category', pl.Utf8)
 	return target
 
 
 def _normalize_frame(
-	frame: pl.DataFrame,
+	frame: Frame,
+	schema: pl.Schema,
 	ordered_cols: list[str],
 	target_schema: dict[str, pl.datatypes.PolarsDataType]
-) -> pl.DataFrame:
+) -> Frame:
 	"""Add missing columns and cast types to match target schema."""
-	# Add missing columns
-	adds = []
+	exprs = []
 	for c in ordered_cols:
-		if c not in frame.columns:
-			lit = pl.lit(None).alias(c)
-			if target_schema.get(c) and target_schema[c] != pl.Null:
-				lit = lit.cast(target_schema[c])
-			adds.append(lit)
-	if adds:
-		frame = frame.with_columns(adds)
-
-	# Cast null columns to target types
-	casts = []
-	for col, dt in zip(frame.columns, frame.dtypes, strict=False):
-		tgt = target_schema.get(col)
-		if tgt and dt == pl.Null and tgt != pl.Null:
-			casts.append(pl.col(col).cast(tgt))
-	if casts:
-		frame = frame.with_columns(casts)
-
-	return frame.select(ordered_cols)
+		tgt = target_schema.get(c)
+		if c not in schema:
+			exprs.append(pl.lit(None, dtype=tgt or pl.Null).alias(c))
+		elif tgt is not None and schema[c] != tgt:
+			exprs.append(pl.col(c).cast(tgt))
+		else:
+			exprs.append(pl.col(c))
+	return frame.select(exprs)
 
 
 def unify_frames(frames: list[pl.DataFrame]) -> pl.DataFrame:
@@ -61,22 +123,43 @@ def unify_frames(frames: list[pl.DataFrame]) -> pl.DataFrame:
 	if not frames:
 		return pl.DataFrame([])
 
-	ordered_cols = _collect_all_columns(frames)
-	target_schema = _build_target_schema(frames)
+	schemas = [f.schema for f in frames]
+	ordered_cols = _collect_all_columns(schemas)
+	target_schema = _build_target_schema(schemas, ordered_cols)
 
 	unified_frames = [
-		_normalize_frame(f, ordered_cols, target_schema)
-		for f in frames
+		_normalize_frame(f, schema, ordered_cols, target_schema)
+		for f, schema in zip(frames, schemas, strict=True)
 	]
 
-	if not unified_frames:
-		return pl.DataFrame([])
-
-	result = unified_frames[0]
-	for frame in unified_frames[1:]:
-		result = result.vstack(frame, in_place=False)
+	return pl.concat(unified_frames, how='vertical', rechunk=True)
 
-	return result
 
-
-__all__ = ['unify_frames']
+def unify_lazy(frames: list[pl.LazyFrame]) -> pl.LazyFrame:
+	"""`unify_frames` for lazy scans: the same columns and types, nothing collected."""
+	if not frames:
+		return pl.LazyFrame([])
+
+	schemas = [f.collect_schema() for f in frames]
+	ordered_cols = _collect_all_columns(schemas)
+	target_schema = _build_target_schema(schemas, ordered_cols)
+	return pl.concat(
+		[
+			_normalize_frame(f, schema, ordered_cols, target_schema)
+			for f, schema in zip(frames, schemas, strict=True)
+		],
+		how='vertical',
+	)
+
+
+__all__ = [
+	'CONTEXT_SCHEMA',
+	'REGISTRY',
+	'SEASON_TYPE',
+	'SITE_SCHEMAS',
+	'SOURCE',
+	'conform',
+	'site_schema',
+	'unify_frames',
+	'unify_lazy',
+]
@@ -0,0 +1,158 @@
+"""Vectorized fantasy-points scoring.
+
+A `Ruleset` is declarative: points per unit of a stat column within a
+category, plus threshold bonuses. `score` compiles one or more rulesets into
+a single Polars expression per ruleset and evaluates them together over the
+unified frame (lazily when given a LazyFrame), so millions of player-weeks are
+scored in one pass without any Python per row.
+
+Weights are keyed by category because the unified frame shares column names
+across categories (ESPN's ``yards`` means passing, rushing or receiving yards
+depending on the row). Both the cleaned ESPN columns and the NFL.com headers
+are listed; columns a frame does not have are simply skipped. NFL.com cells
+are strings and are parsed (thousands separators removed) on the fly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+import polars as pl
+
+from .compact import parse_numeric
+
+ENTITY_COLUMNS = ('player', 'Player')
+GROUP_COLUMNS = ('source', 'year', 'season_type', 'week')
+# Tell same-named players apart (see `identity`)
+IDENTITY_COLUMNS = ('player_id', 'team', 'Team')
+
+Frame = pl.DataFrame | pl.LazyFrame
+
+
+@dataclass(frozen=True)
+class Bonus:
+	"""`points` awarded once when `column` reaches `threshold` in a `category` row."""
+
+	category: str
+	column: str
+	threshold: float
+	points: float
+
+
+@dataclass(frozen=True)
+class Ruleset:
+	"""Named scoring rules: ``weights[category][column]`` points per unit, plus bonuses."""
+
+	name: str
+	weights: Mapping[str, Mapping[str, float]] = field(default_factory=dict)
+	bonuses: tuple[Bonus, ...] = ()
+
+	def extend(
+		self,
+		name: str,
+		weights: Mapping[str, Mapping[str, float]] | None = None,
+		bonuses: Iterable[Bonus] = (),
+	) -> Ruleset:
+		"""New ruleset with `weights` overriding/adding to these and extra `bonuses`."""
+		merged = {cat: dict(cols) for cat, cols in self.weights.items()}
+		for cat, cols in (weights or {}).items():
+			merged.setdefault(cat, {}).update(cols)
+		return Ruleset(name, merged, (*self.bonuses, *bonuses))
+
+	def expr(self, schema: Mapping[str, pl.DataType]) -> pl.Expr:
+		"""Compile to one expression computing the points of each row."""
+		terms: list[pl.Expr] = []
+		for category, cols in self.weights.items():
+			parts = [
+				_numeric(col, schema[col]).fill_null(0) * weight
+				for col, weight in cols.items()
+				if col in schema and weight
+			]
+			if parts:
+				terms.append(
+					pl.when(pl.col('category') == category).then(pl.sum_horizontal(parts))
+				)
+		for bonus in self.bonuses:
+			if bonus.column in schema:
+				hit = (pl.col('category') == bonus.category) & (
+					_numeric(bonus.column, schema[bonus.column]) >= bonus.threshold
+				)
+				terms.append(pl.when(hit).then(pl.lit(bonus.points)))
+		if not terms:
+			return pl.lit(0.0)
+		return pl.sum_horizontal(terms).fill_null(0).cast(pl.Float64)
+
+
+def _numeric(column: str, dtype: pl.DataType) -> pl.Expr:
+	value = parse_numeric(column) if dtype == pl.Utf8 else pl.col(column)
+	return value.cast(pl.Float64, strict=False)
+
+
+# ESPN's FUM column appears in every table a player shows up in, so fumbles
+# are only scored from NFL.com's per-category columns.
+STANDARD = Ruleset(
+	'standard',
+	{
+		'passing': {
+			'yards': 0.04, 'touchdowns': 4, 'interceptions': -2,
+			'Pass Yds': 0.04, 'TD': 4, 'INT': -2,
+		},
+		'rushing': {
+			'yards': 0.1, 'touchdowns': 6,
+			'Rush Yds': 0.1, 'TD': 6, 'Rush FUM': -2,
+		},
+		'receiving': {
+			'yards': 0.1, 'touchdowns': 6,
+			'Yds': 0.1, 'TD': 6, 'Rec FUM': -2,
+		},
+		'field goals': {'FGM': 3},
+	},
+)
+HALF_PPR = STANDARD.extend('half_ppr', {'receiving': {'receptions': 0.5, 'Rec': 0.5}})
+PPR = STANDARD.extend('ppr', {'receiving': {'receptions': 1, 'Rec': 1}})
+
+PRESETS = {r.name: r for r in (STANDARD, HALF_PPR, PPR)}
+
+
+def score(
+	frame: Frame, rulesets: Ruleset | Iterable[Ruleset] = (STANDARD, HALF_PPR, PPR)
+) -> Frame:
+	"""Add a ``points_<name>`` column per ruleset to `frame`.
+
+	All rulesets are evaluated in the same ``with_columns`` call. A LazyFrame
+	stays lazy, so the scoring is fused into whatever query it is part of.
+	"""
+	rulesets = [rulesets] if isinstance(rulesets, Ruleset) else list(rulesets)
+	schema = frame.collect_schema()
+	if 'category' not in schema:
+		raise ValueError("frame has no 'category' column to score by")
+	return frame.with_columns(r.expr(schema).alias(f'points_{r.name}') for r in rulesets)
+
+
+def total_points(scored: Frame) -> Frame:
+	"""Sum the ``points_*`` columns of a scored frame per player (and week, if any).
+
+	Players are told apart by ``player_id`` and team as well as by name when
+	the frame has those columns.
+	"""
+	names = scored.collect_schema().names()
+	entity = next((c for c in ENTITY_COLUMNS if c in names), None)
+	if entity is None:
+		raise ValueError('scored frame has no player column')
+	keys = [c for c in GROUP_COLUMNS if c in names] + [entity]
+	keys += [c for c in IDENTITY_COLUMNS if c in names]
+	points = [c for c in names if c.startswith('points_')]
+	return scored.group_by(keys, maintain_order=True).agg(pl.col(points).sum())
+
+
+__all__ = [
+	'HALF_PPR',
+	'PPR',
+	'PRESETS',
+	'STANDARD',
+	'Bonus',
+	'Ruleset',
+	'score',
+	'total_points',
+]
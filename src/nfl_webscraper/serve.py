@@ -0,0 +1,275 @@
+"""Watch/serve daemon: one polite refresher, many fast readers.
+
+During game windows services used to poll by calling `get_all_player_stats`
+again and again, re-scraping every season each time. `watch` instead
+refreshes only the week in progress (weekly sources) and the current season
+totals (the others) on a fixed interval through the regular scrapers. The
+fresh rows replace that slice of a `HotTable`, whose latest unified frame
+stays in memory. A `StatsServer` answers filtered reads from that frame over
+a local HTTP endpoint, as Arrow IPC or JSON::
+
+	GET /stats?player=Josh%20Allen&week=3&format=arrow
+	GET /health
+
+Query parameters other than ``format`` filter on equality of the named
+column; a player or team plus source/year/season_type/week/category is
+answered from the table's `StatsIndex`. A read never reaches the sites.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import polars as pl
+
+from .api import SCRAPERS, SiteName, _gather_multi_site_stats
+from .schema import unify_frames
+from .stats_index import BLOCK_KEY, ENTITY_NAMES, StatsIndex
+
+REGULAR_WEEKS = 18
+POSTSEASON_WEEKS = 5
+
+ARROW_STREAM = 'application/vnd.apache.arrow.stream'
+
+
+def _kickoff(season: int) -> date:
+	"""Thursday after Labor Day (the first Monday of September)."""
+	first = date(season, 9, 1)
+	labor_day = first + timedelta(days=(7 - first.weekday()) % 7)
+	return labor_day + timedelta(days=3)
+
+
+def current_week(today: date | None = None) -> tuple[int, str, int]:
+	"""The (season, season type, week) in progress on `today`.
+
+	January and February belong to the previous season's postseason; before
+	kickoff the first regular-season week is returned.
+	"""
+	today = today or date.today()
+	season = today.year if today.month >= 3 else today.year - 1  # noqa: PLR2004
+	days = (today - _kickoff(season)).days
+	week = max(0, days) // 7 + 1
+	if week <= REGULAR_WEEKS:
+		return season, 'regular', week
+	return season, 'postseason', min(week - REGULAR_WEEKS, POSTSEASON_WEEKS)
+
+
+class HotTable:
+	"""The latest unified frame, replaced slice by slice and read concurrently.
+
+	Rows live in a `StatsIndex`, so a refresh re-indexes only the (source,
+	year, season type, week, category) slices it fetched -- a category that
+	failed or was not refreshed keeps its rows -- and reads by player (plus
+	optional slice coordinates) are index lookups rather than scans.
+	"""
+
+	def __init__(self, frame: pl.DataFrame | None = None) -> None:
+		self.index = StatsIndex(frame)
+		self.version = 0
+		self.refreshed_at: float | None = None
+		self._lock = threading.Lock()
+
+	@property
+	def frame(self) -> pl.DataFrame:
+		with self._lock:
+			return self.index.frame
+
+	def update(self, fresh: pl.DataFrame) -> None:
+		"""Replace the rows of every (source, year, season type, week, category) slice in `fresh`."""
+		if fresh.shape[0] == 0:
+			return
+		with self._lock:
+			self.index.update(fresh)
+			self.version += 1
+			self.refreshed_at = time.time()
+
+	def read(self, filters: dict[str, str] | None = None) -> pl.DataFrame:
+		"""Rows whose columns equal every value in `filters` (compared as text)."""
+		filters = dict(filters or {})
+		with self._lock:
+			looked_up = self._lookup(filters)
+			if looked_up is not None:
+				return looked_up
+			frame = self.index.frame
+		conditions = [
+			pl.col(col).cast(pl.Utf8) == value
+			for col, value in filters.items()
+			if col in frame.columns
+		]
+		if len(conditions) < len(filters):
+			return frame.clear()  # filtering on a column the table does not have
+		return frame.filter(*conditions) if conditions else frame
+
+	def _lookup(self, filters: dict[str, str]) -> pl.DataFrame | None:
+		"""Index lookup for a player or team filter plus slice coordinates, if applicable."""
+		name_column = next((c for c in ENTITY_NAMES if c in filters), None)
+		coordinates = {c: v for c, v in filters.items() if c != name_column}
+		if name_column is None or not set(coordinates) <= set(BLOCK_KEY):
+			return None
+		try:
+			typed = {c: int(v) if c in ('year', 'week') else v for c, v in coordinates.items()}
+		except ValueError:
+			return None
+		if name_column in ('team', 'Team'):
+			return self.index.team(filters[name_column], **typed)
+		return self.index.get(filters[name_column], **typed)
+
+
+async def refresh(
+	hot: HotTable,
+	sites: list[SiteName],
+	*,
+	player: bool = True,
+	categories: list[str] | None = None,
+	concurrency: int | None = None,
+	today: date | None = None,
+) -> int:
+	"""Scrape the current week (weekly sites) and season (the rest) into `hot`.
+
+	Returns the number of rows fetched.
+	"""
+	season, season_type, week = current_week(today)
+	weekly = [s for s in sites if SCRAPERS[s].weekly]
+	totals = [s for s in sites if not SCRAPERS[s].weekly]
+	scrapes = []
+	if weekly:
+		scrapes.append(_gather_multi_site_stats(
+			[season], weekly, player=player, categories=categories,
+			weeks=[week], season_types=[season_type], concurrency=concurrency,
+		))
+	if totals:
+		scrapes.append(_gather_multi_site_stats(
+			[season], totals, player=player, categories=categories, concurrency=concurrency,
+		))
+	frames = await asyncio.gather(*scrapes)
+	fresh = unify_frames([df for df in frames if df.shape[0] > 0])
+	hot.update(fresh)
+	return fresh.shape[0]
+
+
+class StatsServer:
+	"""Local HTTP endpoint serving reads of a `HotTable` from a background thread."""
+
+	def __init__(self, hot: HotTable, host: str = '127.0.0.1', port: int = 8765) -> None:
+		self.hot = hot
+		self.httpd = ThreadingHTTPServer((host, port), _handler(hot))
+		self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+	@property
+	def address(self) -> tuple[str, int]:
+		return self.httpd.server_address[:2]
+
+	def start(self) -> StatsServer:
+		self.thread.start()
+		return self
+
+	def stop(self) -> None:
+		self.httpd.shutdown()
+		self.httpd.server_close()
+
+	def __enter__(self) -> StatsServer:
+		return self.start()
+
+	def __exit__(self, *exc: object) -> None:
+		self.stop()
+
+
+def _handler(hot: HotTable) -> type[BaseHTTPRequestHandler]:
+	class Handler(BaseHTTPRequestHandler):
+		def do_GET(self) -> None:  # noqa: N802
+			url = urlsplit(self.path)
+			if url.path == '/health':
+				body = json.dumps({
+					'rows': hot.frame.shape[0],
+					'version': hot.version,
+					'refreshed_at': hot.refreshed_at,
+				}).encode()
+				self._send(200, 'application/json', body)
+				return
+			if url.path != '/stats':
+				self._send(404, 'application/json', b'{"error": "not found"}')
+				return
+			params = dict(parse_qsl(url.query))
+			fmt = params.pop('format', 'json')
+			frame = hot.read(params)
+			if fmt == 'arrow':
+				buffer = io.BytesIO()
+				frame.write_ipc_stream(buffer)
+				self._send(200, ARROW_STREAM, buffer.getvalue())
+			elif fmt == 'json':
+				self._send(200, 'application/json', frame.write_json().encode())
+			else:
+				self._send(400, 'application/json', b'{"error": "format must be arrow or json"}')
+
+		def _send(self, status: int, content_type: str, body: bytes) -> None:
+			self.send_response(status)
+			self.send_header('Content-Type', content_type)
+			self.send_header('Content-Length', str(len(body)))
+			self.end_headers()
+			self.wfile.write(body)
+
+		def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+			pass  # reads are too frequent to log
+
+	return Handler
+
+
+def watch(
+	sites: list[SiteName] | SiteName = 'espn.com',
+	*,
+	player: bool = True,
+	categories: list[str] | None = None,
+	interval: float = 300.0,
+	host: str = '127.0.0.1',
+	port: int = 8765,
+	concurrency: int | None = None,
+) -> None:
+	"""Refresh the current week every `interval` seconds and serve reads until interrupted.
+
+	Parameters
+	----------
+	sites:
+		Site(s) to refresh; weekly sites refresh the current week, others the
+		current season.
+	player:
+		If True keep player statistics; otherwise team statistics.
+	categories:
+		Optional subset of stat categories to refresh.
+	interval:
+		Seconds between refreshes.
+	host, port:
+		Address of the HTTP endpoint (see the module docstring).
+	concurrency:
+		Optional per-site limit on concurrent fetches.
+	"""
+	if isinstance(sites, str):
+		sites = [sites]
+	hot = HotTable()
+
+	async def loop() -> None:
+		while True:
+			try:
+				rows = await refresh(
+					hot, sites, player=player, categories=categories, concurrency=concurrency
+				)
+				print(f'refreshed {rows} rows (version {hot.version})')
+			except Exception as e:  # noqa: BLE001 - keep serving the last good table
+				print(f'refresh failed: {e}')
+			await asyncio.sleep(interval)
+
+	with StatsServer(hot, host, port) as server:
+		print('serving on http://{}:{}/stats'.format(*server.address))
+		try:
+			asyncio.run(loop())
+		except KeyboardInterrupt:
+			pass
+
+
+__all__ = ['HotTable', 'StatsServer', 'current_week', 'refresh', 'watch']
@@ -2,32 +2,367 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
 
 import httpx
 import polars as pl
 
+from ..exceptions import EmptyUnitError
+from ..extract import page_cache
+from ..schema import unify_frames
+
+if TYPE_CHECKING:
+    from ..checkpoint import Checkpoint
+    from ..failures import FailureManifest
+    from ..fingerprint import FingerprintIndex
+    from ..latency import Deadline
+
+logger = logging.getLogger(__name__)
+
+
+class FrameSink(Protocol):
+    """Receiver of completed unit frames (e.g. `spill.Spill`, `reshape.CategoryFrames`)."""
+
+    def add(self, frame: pl.DataFrame) -> None: ...
+
+
+@dataclass(frozen=True)
+class WorkUnit:
+    """One independently fetchable piece of a scrape.
+
+    For NFL.com a unit is a (year, category) table including its pagination;
+    for ESPN.com it is a single (year, category, season type, week) page.
+    """
+
+    site: str
+    year: int
+    category: str
+    url: str
+    player: bool = True
+    week: int | None = None
+    season_type: str | None = None
+    # Column projection applied while parsing (None keeps every column).
+    columns: tuple[str, ...] | None = None
+
+    @property
+    def key(self) -> str:
+        """Stable identifier of the unit (independent of the resolved URL)."""
+        kind = 'player' if self.player else 'team'
+        parts = [self.site, kind, str(self.year), self.category]
+        if self.season_type is not None:
+            parts.append(self.season_type)
+        if self.week is not None:
+            parts.append(str(self.week))
+        if self.columns is not None:
+            parts.append('columns=' + ','.join(self.columns))
+        return '|'.join(parts)
+
 
 class BaseSiteScraper(ABC):
     """Abstract scraper interface for different sports sites."""
 
+    # Default maximum number of concurrent unit fetches.
+    concurrency = 10
+
+    # True for sites publishing weekly stats (units carry a week); others
+    # publish season totals only.
+    weekly = False
+
+    # True for sites whose team stats are aggregates of their player pages;
+    # such a scraper provides `team_stats_from(players)`, so a run wanting
+    # both derives the team rows instead of fetching the pages twice.
+    teams_from_players = False
+
+    # If True a unit that fails to fetch is logged and dropped instead of
+    # failing the whole scrape.
+    skip_failed_units = False
+
+    # Fetch strategy of sites offering several (see `ESPNScraper.STRATEGIES`);
+    # recorded with failed units so a retry fetches them the same way.
+    strategy: str | None = None
+
+    def __init__(self, *, fingerprints: FingerprintIndex | None = None) -> None:
+        # Optional index of page fingerprints; unchanged pages skip parsing.
+        self.fingerprints = fingerprints
+        # Optional semaphore shared by every scrape of this instance (e.g. all
+        # shards of a worker process); without one each scrape gets its own
+        # `concurrency` limit.
+        self.limiter: asyncio.Semaphore | None = None
+
     @property
     @abstractmethod
     def site_name(self) -> str:
         """Human-readable site identifier."""
 
     @abstractmethod
+    def available_categories(self, *, player: bool) -> list[str]:
+        """Stat categories this site can scrape for players or teams."""
+
+    @abstractmethod
+    async def discover_years(self, client: httpx.AsyncClient, *, player: bool) -> list[int]:
+        """Seasons the site publishes, as a scrape without `years` would plan them."""
+
+    @abstractmethod
+    async def plan_units(
+        self,
+        client: httpx.AsyncClient,
+        years: list[int] | None = None,
+        *,
+        player: bool,
+        categories: list[str] | None = None,
+        weeks: list[int] | None = None,
+        season_types: list[str] | None = None,
+        columns: list[str] | None = None,
+        failures: FailureManifest | None = None,
+    ) -> list[WorkUnit]:
+        """Enumerate the work units a scrape of the given years would fetch.
+
+        Categories, weeks and season types prune the plan before anything is
+        fetched; `columns` is carried on each unit and applied while parsing.
+        Sites that discover their units per year record a year whose
+        discovery fails in `failures` (when given) and plan the other years.
+        """
+
+    @abstractmethod
+    async def fetch_unit(self, client: httpx.AsyncClient, unit: WorkUnit) -> pl.DataFrame:
+        """Fetch and parse one unit, returning rows with context columns attached.
+
+        Fetch errors propagate; `_gather_stats` applies `skip_failed_units`.
+        """
+
     async def get_player_stats(
         self,
         client: httpx.AsyncClient,
-        years: list[int] | None = None
+        years: list[int] | None = None,
+        *,
+        categories: list[str] | None = None,
+        weeks: list[int] | None = None,
+        season_types: list[str] | None = None,
+        columns: list[str] | None = None,
+        concurrency: int | None = None,
+        checkpoint: Checkpoint | None = None,
+        failures: FailureManifest | None = None,
+        deadline: Deadline | None = None,
+        sink: FrameSink | None = None,
     ) -> pl.DataFrame:
-        """Fetch player stats for given years."""
+        """Fetch player stats for given years (optionally a subset of categories)."""
+        return await self._gather_stats(
+            client,
+            years,
+            player=True,
+            categories=categories,
+            weeks=weeks,
+            season_types=season_types,
+            columns=columns,
+            concurrency=concurrency,
+            checkpoint=checkpoint,
+            failures=failures,
+            deadline=deadline,
+            sink=sink,
+        )
 
-    @abstractmethod
     async def get_team_stats(
         self,
         client: httpx.AsyncClient,
-        years: list[int] | None = None
+        years: list[int] | None = None,
+        *,
+        categories: list[str] | None = None,
+        weeks: list[int] | None = None,
+        season_types: list[str] | None = None,
+        columns: list[str] | None = None,
+        concurrency: int | None = None,
+        checkpoint: Checkpoint | None = None,
+        failures: FailureManifest | None = None,
+        deadline: Deadline | None = None,
+        sink: FrameSink | None = None,
+    ) -> pl.DataFrame:
+        """Fetch team stats for given years (optionally a subset of categories)."""
+        return await self._gather_stats(
+            client,
+            years,
+            player=False,
+            categories=categories,
+            weeks=weeks,
+            season_types=season_types,
+            columns=columns,
+            concurrency=concurrency,
+            checkpoint=checkpoint,
+            failures=failures,
+            deadline=deadline,
+            sink=sink,
+        )
+
+    async def _gather_stats(
+        self,
+        client: httpx.AsyncClient,
+        years: list[int] | None,
+        *,
+        player: bool,
+        categories: list[str] | None = None,
+        weeks: list[int] | None = None,
+        season_types: list[str] | None = None,
+        columns: list[str] | None = None,
+        concurrency: int | None = None,
+        checkpoint: Checkpoint | None = None,
+        failures: FailureManifest | None = None,
+        deadline: Deadline | None = None,
+        sink: FrameSink | None = None,
+    ) -> pl.DataFrame:
+        """Plan the scrape, fetch every unit concurrently and unify the results.
+
+        Parameters
+        ----------
+        client:
+            HTTP client to use for requests.
+        years:
+            Optional collection of season years to restrict the scrape to. If None
+            all discovered years are included.
+        player:
+            If True scrape player statistics; otherwise team statistics.
+        categories:
+            Optional subset of category names to scrape. If None every category
+            the site offers is included.
+        weeks, season_types:
+            Optional week numbers / season types ('regular', 'postseason') to
+            restrict the plan to; sites without weekly pages plan nothing when
+            weeks are requested.
+        columns:
+            Optional stat columns to keep; projection happens during parsing and
+            the context columns (year, category, source, ...) are always kept.
+        concurrency:
+            Maximum concurrent unit fetches (defaults to `self.concurrency`);
+            ignored when the instance has a shared `limiter`.
+        checkpoint:
+            Optional journal; units it already holds are loaded from disk instead
+            of fetched, and every newly fetched unit is recorded as it finishes.
+        failures:
+            Optional manifest; units that fail to fetch are recorded there and
+            dropped instead of failing the scrape (see `fetch_units`).
+        deadline:
+            Optional budget for the whole scrape, planning included. Units
+            still running when it expires are cancelled and the rows fetched
+            so far are returned (see `fetch_units`).
+        sink:
+            Optional `FrameSink` (such as a `Spill`); completed units are handed
+            to it instead of being kept, and an empty frame is returned.
+
+        Returns
+        -------
+        pl.DataFrame
+            Unified table containing all rows from every fetched unit; may be
+            empty if no rows were fetched.
+        """
+        # Pages fetched while planning (discovery) are reused by the fetches
+        with page_cache():
+            try:
+                async with asyncio.timeout_at(deadline.when if deadline else None):
+                    units = await self.plan_units(
+                        client,
+                        years,
+                        player=player,
+                        categories=categories,
+                        weeks=weeks,
+                        season_types=season_types,
+                        columns=columns,
+                        failures=failures,
+                    )
+            except TimeoutError:
+                if deadline is None or not deadline.expired:
+                    raise
+                logger.warning(
+                    '%s: deadline exceeded while planning; nothing fetched', self.site_name
+                )
+                return pl.DataFrame([])
+
+            return await self.fetch_units(
+                client,
+                units,
+                concurrency=concurrency,
+                checkpoint=checkpoint,
+                failures=failures,
+                deadline=deadline,
+                sink=sink,
+            )
+
+    async def fetch_units(
+        self,
+        client: httpx.AsyncClient,
+        units: list[WorkUnit],
+        *,
+        concurrency: int | None = None,
+        checkpoint: Checkpoint | None = None,
+        failures: FailureManifest | None = None,
+        deadline: Deadline | None = None,
+        sink: FrameSink | None = None,
+        require_rows: bool = False,
     ) -> pl.DataFrame:
-        """Fetch team stats for given years."""
+        """Fetch `units` concurrently and unify the results.
+
+        A unit that raises is recorded in `failures` when a manifest is given;
+        otherwise it is logged and dropped if `skip_failed_units` is set, and
+        the error propagates if not. With `require_rows` a unit that parses to
+        no rows fails too (`EmptyUnitError`), as a retry should not count a
+        page it cannot read as recovered.
+
+        When `deadline` expires the units still running (or waiting for a
+        slot) are cancelled and recorded in `failures` as `DeadlineExceededError`
+        -- or counted in a logged warning without a manifest -- and the units
+        already fetched are returned.
+
+        With a `sink` every completed unit is added to it and the returned
+        frame is empty; read the rows back from the sink (e.g. `Spill.scan`).
+        """
+        # Throttle maximum concurrent unit fetches to avoid overloading the site.
+        semaphore = self.limiter or asyncio.Semaphore(concurrency or self.concurrency)
+
+        cut_off: list[WorkUnit] = []
+
+        def keep(df: pl.DataFrame) -> pl.DataFrame:
+            if sink is None:
+                return df
+            sink.add(df)
+            return pl.DataFrame([])
+
+        async def fetch(unit: WorkUnit) -> pl.DataFrame:
+            if checkpoint is not None and unit in checkpoint:
+                return keep(checkpoint.load(unit))
+            try:
+                async with asyncio.timeout_at(deadline.when if deadline else None):
+                    async with semaphore:
+                        df = await self.fetch_unit(client, unit)
+                if require_rows and df.shape[0] == 0:
+                    raise EmptyUnitError(f'{unit.url} parsed to no rows')
+            except TimeoutError:
+                if deadline is None or not deadline.expired:
+                    raise
+                cut_off.append(unit)
+                if failures is not None:
+                    failures.record(unit, deadline.error(), strategy=self.strategy)
+                return pl.DataFrame([])
+            except Exception as e:
+                if failures is not None:
+                    failures.record(unit, e, strategy=self.strategy)
+                    return pl.DataFrame([])
+                if not self.skip_failed_units:
+                    raise
+                # Log error but continue with other units
+                print(f'Error fetching {unit.key}: {e}')
+                return pl.DataFrame([])
+            if checkpoint is not None:
+                checkpoint.record(unit, df)
+            return keep(df)
+
+        with page_cache():
+            frames = await asyncio.gather(*(fetch(u) for u in units))
+        if cut_off and failures is None:
+            logger.warning(
+                '%s: deadline exceeded; %d of %d units not fetched',
+                self.site_name, len(cut_off), len(units),
+            )
+
+        # Unify schemas across all gathered frames (handles missing columns & dtypes).
+        return unify_frames([df for df in frames if df.shape[0] > 0])
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
-import asyncio
-from typing import Any
+import json
+from typing import TYPE_CHECKING, Any
 
 import httpx
 import polars as pl
 from bs4 import BeautifulSoup
 
-from ..http import fetch_html
-from ..schema import unify_frames
-from .base import BaseSiteScraper
+from ..aggregates import team_week
+from ..fingerprint import fingerprint
+from ..http import fetch_html, fetch_text
+from ..schema import CONTEXT_SCHEMA, SITE_SCHEMAS
+from .base import BaseSiteScraper, WorkUnit
+from .espn_json import decode_leaders
+
+if TYPE_CHECKING:
+    from ..failures import FailureManifest
+    from ..fingerprint import FingerprintIndex
 
 
 class ESPNScraper(BaseSiteScraper):
@@ -19,6 +26,15 @@ class ESPNScraper(BaseSiteScraper):
 
     BASE_URL = "https://www.espn.com/nfl/weekly/leaders"
 
+    # ESPN's JSON stats endpoint (the 'json' strategy)
+    JSON_URL = (
+        "https://site.web.api.espn.com/apis/common/v3/sports/football/nfl/statistics/byathlete"
+    )
+
+    # How units are fetched: 'html' weekly-leaders pages or the 'json' stats API
+    STRATEGIES = ('html', 'json')
+    strategy = 'html'
+
     # ESPN categories mapping
     STAT_TYPES = {
         'passing': 'passing',
@@ -33,95 +49,159 @@ class ESPNScraper(BaseSiteScraper):
         'postseason': 3
     }
 
+    # Default maximum number of concurrent weekly page fetches.
+    concurrency = 10
+
+    # Weekly leaders: every unit is one week
+    weekly = True
+
+    # A missing week should not sink the other ~90 pages of a season.
+    skip_failed_units = True
+
+    # Team stats are group-bys of the weekly leaders pages (see `team_stats_from`)
+    teams_from_players = True
+
+    # Weeks published per season type (postseason: Wild Card, Divisional, Conference, Super Bowl)
+    WEEKS = {
+        'regular': range(1, 19),
+        'postseason': range(1, 6),
+    }
+
+    def __init__(
+        self,
+        *,
+        fingerprints: FingerprintIndex | None = None,
+        strategy: str | None = None,
+        json_url: str | None = None,
+    ) -> None:
+        super().__init__(fingerprints=fingerprints)
+        if strategy is not None:
+            if strategy not in self.STRATEGIES:
+                raise ValueError(f"strategy must be one of {', '.join(self.STRATEGIES)}")
+            self.strategy = strategy
+        if json_url is not None:
+            # e.g. a local stand-in serving recorded responses
+            self.JSON_URL = json_url
+
     @property
     def site_name(self) -> str:
         return "ESPN.com"
 
-    async def get_player_stats(
-        self,
-        client: httpx.AsyncClient,
-        years: list[int] | None = None
-    ) -> pl.DataFrame:
-        """Fetch player stats from ESPN.com for given years."""
-        return await self._gather_stats(client, years, player=True)
-
-    async def get_team_stats(
-        self,
-        client: httpx.AsyncClient,
-        years: list[int] | None = None
-    ) -> pl.DataFrame:
-        """Fetch team stats from ESPN.com for given years."""
-        # ESPN weekly leaders are player-focused, but we can aggregate
-        # For now, return empty DataFrame - team stats would need different endpoint
-        return pl.DataFrame([])
+    def available_categories(self, *, player: bool) -> list[str]:
+        # Team categories are derived from the same player pages
+        return list(self.STAT_TYPES)
 
-    async def _gather_stats(
+    async def plan_units(
         self,
         client: httpx.AsyncClient,
-        years: list[int] | None,
+        years: list[int] | None = None,
         *,
-        player: bool
-    ) -> pl.DataFrame:
-        """Internal method that orchestrates ESPN scraping.
-
-        ESPN provides weekly stats, so we'll fetch all weeks for each year/stat type.
+        player: bool,
+        categories: list[str] | None = None,
+        weeks: list[int] | None = None,
+        season_types: list[str] | None = None,
+        columns: list[str] | None = None,
+        failures: FailureManifest | None = None,
+    ) -> list[WorkUnit]:
+        """Enumerate one unit per (year, stat type, season type, week) page.
+
+        ESPN URLs are fully deterministic, so no requests are made unless the
+        years have to be discovered. Categories, weeks and season types prune
+        the plan; `columns` (cleaned names such as 'player' or 'yards') is
+        applied while parsing. With the 'json' strategy the units point at
+        the JSON stats endpoint instead of the HTML pages.
+
+        Team units fetch the very same pages; their rows are the players'
+        rows grouped by team (see `team_stats_from`).
         """
-        if not player:
-            # Team stats not implemented yet for ESPN weekly leaders
-            return pl.DataFrame([])
-
         # ESPN supports historical years - discover available years or use defaults
         if years is None:
             years = await self._discover_available_years(client)
-        
-        frames: list[pl.DataFrame] = []
-        tasks: list[asyncio.Task] = []
 
-        # Throttle requests to be respectful
-        semaphore = asyncio.Semaphore(10)
+        stat_types = [
+            s for s in self.STAT_TYPES
+            if not categories or s in {c.lower() for c in categories}
+        ]
+        projection = tuple(c.lower() for c in columns) if columns else None
+        build_url = self._build_json_url if self.strategy == 'json' else self._build_url
+        return [
+            WorkUnit(
+                site=self.site_name,
+                year=year,
+                category=stat_type,
+                url=build_url(week, season_type, stat_type, year),
+                player=player,
+                week=week,
+                season_type=season_type,
+                columns=projection,
+            )
+            for year in years
+            for stat_type in stat_types
+            for season_type, season_weeks in self.WEEKS.items()
+            if not season_types or season_type in season_types
+            for week in season_weeks
+            if not weeks or week in weeks
+        ]
+
+    async def fetch_unit(self, client: httpx.AsyncClient, unit: WorkUnit) -> pl.DataFrame:
+        """Fetch stats for one week/stat type combination.
+
+        A team unit parses every column of the page and groups the player
+        rows by team; its `columns` projection applies to the team rows.
+        """
+        text = await fetch_text(client, unit.url)
+        columns = unit.columns if unit.player else None
+        if self.strategy == 'json':
+            # Decoding JSON is cheap enough that fingerprints are not consulted
+            df = decode_leaders(json.loads(text), unit.category, columns)
+        elif self.fingerprints is None:
+            df = self._parse_stats_table(BeautifulSoup(text, 'html.parser'), columns)
+        else:
+            digest = fingerprint(text)
+            cache_key = unit.url if columns is None else f"{unit.url}#{','.join(columns)}"
+            cached = self.fingerprints.lookup(cache_key, digest)
+            if cached is not None:
+                df, _ = cached
+            else:
+                df = self._parse_stats_table(BeautifulSoup(text, 'html.parser'), columns)
+                self.fingerprints.store(cache_key, digest, df)
+        if df.shape[0] == 0:
+            return df
+        # Add context columns
+        context = {
+            'year': unit.year,
+            'week': unit.week,
+            'season_type': unit.season_type,
+            'category': unit.category,
+            'source': self.site_name,
+        }
+        df = df.with_columns(
+            pl.lit(value, dtype=CONTEXT_SCHEMA[name]).alias(name) for name, value in context.items()
+        )
+        if unit.player:
+            return df
+        teams = self.team_stats_from(df)
+        if unit.columns is None:
+            return teams
+        keep = {'team', *unit.columns, *CONTEXT_SCHEMA}
+        return teams.select(c for c in teams.columns if c in keep)
+
+    def team_stats_from(self, players: pl.DataFrame) -> pl.DataFrame:
+        """Team-week stats of this site's weekly player rows, without fetching anything.
+
+        One row per (year, season type, week, category, team) with the summed
+        counting stats, the number of listed players and the game's result
+        and score (see `aggregates.team_week`); pass the rows to
+        `aggregates.team_season` for season totals instead.
+        """
+        if players.shape[0] == 0 or 'team' not in players.columns:
+            return pl.DataFrame([])
+        rows = players.filter(pl.col('source') == self.site_name, pl.col('week').is_not_null())
+        return team_week(rows) if rows.shape[0] > 0 else pl.DataFrame([])
 
-        async def fetch_week_stats(year: int, week: int, stat_type: str, season_type: str) -> None:
-            """Fetch stats for one week/stat type combination."""
-            async with semaphore:
-                try:
-                    url = self._build_url(week, season_type, stat_type, year)
-                    soup = await fetch_html(client, url)
-                    df = self._parse_stats_table(soup)
-
-                    if df.shape[0] > 0:
-                        # Add context columns
-                        df = df.with_columns([
-                            pl.lit(year).alias('year'),
-                            pl.lit(week).alias('week'),
-                            pl.lit(season_type).alias('season_type'),
-                            pl.lit(stat_type).alias('category'),
-                            pl.lit(self.site_name).alias('source'),
-                        ])
-                        frames.append(df)
-
-                except Exception as e:
-                    # Log error but continue with other weeks
-                    print(f"Error fetching ESPN {year} week {week} {stat_type}: {e}")
-
-        # Generate tasks for all combinations
-        for year in years:
-            for stat_type in self.STAT_TYPES.keys():
-                # Regular season weeks 1-18
-                for week in range(1, 19):
-                    tasks.append(asyncio.create_task(
-                        fetch_week_stats(year, week, stat_type, 'regular')
-                    ))
-
-                # Postseason weeks (typically 4-5 weeks: Wild Card, Divisional, Conference, Super Bowl)
-                for week in range(1, 6):
-                    tasks.append(asyncio.create_task(
-                        fetch_week_stats(year, week, stat_type, 'postseason')
-                    ))
-
-        # Execute all tasks
-        await asyncio.gather(*tasks, return_exceptions=True)
-
-        return unify_frames(frames)
+    async def discover_years(self, client: httpx.AsyncClient, *, player: bool) -> list[int]:
+        """Seasons with weekly leaders; team stats come from the same pages."""
+        return await self._discover_available_years(client)
 
     async def _discover_available_years(self, client: httpx.AsyncClient) -> list[int]:
         """Discover available years for ESPN weekly leaders.
@@ -162,8 +242,32 @@ class ESPNScraper(BaseSiteScraper):
             
         return base_url
 
-    def _parse_stats_table(self, soup: BeautifulSoup) -> pl.DataFrame:
-        """Parse ESPN stats table from BeautifulSoup object."""
+    def _build_json_url(
+        self, week: int, season_type: str, stat_type: str, year: int | None = None
+    ) -> str:
+        """Build the JSON stats URL for one week/type combination."""
+        params = [
+            ('region', 'us'),
+            ('lang', 'en'),
+            ('contentorigin', 'espn'),
+            ('isqualified', 'false'),
+            ('limit', '1000'),
+            ('category', stat_type),
+            ('seasontype', str(self.SEASON_TYPES[season_type])),
+            ('week', str(week)),
+        ]
+        if year is not None:
+            params.append(('season', str(year)))
+        return str(httpx.URL(self.JSON_URL, params=params))
+
+    def _parse_stats_table(
+        self, soup: BeautifulSoup, columns: tuple[str, ...] | None = None
+    ) -> pl.DataFrame:
+        """Parse ESPN stats table from BeautifulSoup object.
+
+        If `columns` is given only those (cleaned) columns are extracted and
+        converted; cells of every other column are never touched.
+        """
         # ESPN uses specific table structure - find table with "Sortable" in title
         tables = soup.find_all('table', class_='tablehead')
         target_table = None
@@ -202,16 +306,31 @@ class ESPNScraper(BaseSiteScraper):
             if not headers:
                 return pl.DataFrame([])
 
+            # Column projection: indices of the headers to extract
+            keep = [i for i, h in enumerate(headers) if columns is None or h in columns]
+            if not keep:
+                return pl.DataFrame([])
+            schema = [headers[i] for i in keep]
+            # The player cell reads "Name, POS"; keep the position as its own column
+            with_position = 'player' in schema and (columns is None or 'position' in columns)
+            if with_position:
+                schema.append('position')
+
             # Extract data rows (start from row 2)
             data_rows = []
             for row in rows[2:]:
                 cells = row.find_all(['td', 'th'])
                 if len(cells) >= len(headers):
                     row_data = []
-                    for i, cell in enumerate(cells[:len(headers)]):
-                        text = cell.get_text(strip=True)
-                        cleaned = self._clean_cell_value(text, headers[i] if i < len(headers) else '')
+                    position = None
+                    for i in keep:
+                        text = cells[i].get_text(strip=True)
+                        cleaned = self._clean_cell_value(text, headers[i])
                         row_data.append(cleaned)
+                        if headers[i] == 'player' and ',' in text:
+                            position = text.split(',', 1)[1].strip() or None
+                    if with_position:
+                        row_data.append(position)
                     
                     # Only add rows that have meaningful data
                     if any(val is not None and str(val).strip() != '' for val in row_data):
@@ -220,8 +339,13 @@ class ESPNScraper(BaseSiteScraper):
             if not data_rows:
                 return pl.DataFrame([])
 
-            # Create DataFrame
-            return pl.DataFrame(data_rows, schema=headers, orient='row')
+            # Create DataFrame with the registry's column types
+            declared = SITE_SCHEMAS[self.site_name]
+            return pl.DataFrame(
+                data_rows,
+                schema=[(name, declared.get(name, pl.Utf8)) for name in schema],
+                orient='row',
+            )
 
         except Exception as e:
             print(f"Error parsing ESPN table: {e}")
@@ -262,10 +386,10 @@ class ESPNScraper(BaseSiteScraper):
         type_mapping = {
             'numeric': {
                 'rank', 'completions', 'attempts', 'yards', 'touchdowns',
-                'interceptions', 'sacks', 'fumbles', 'carries', 'receptions',
-                'targets', 'longest'
+                'interceptions', 'fumbles', 'carries', 'receptions',
+                'targets', 'longest', 'solo', 'ast', 'tot', 'ff', 'fr', 'pd'
             },
-            'float': {'rating', 'average'}
+            'float': {'rating', 'average', 'sacks'}
         }
 
         # Conversion functions
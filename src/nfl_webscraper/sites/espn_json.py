@@ -0,0 +1,149 @@
+"""Decoding of ESPN's JSON statistics responses.
+
+The weekly-leaders HTML pages are the heaviest page weight per useful byte
+of any source: the whole page is downloaded and every ``table.tablehead`` is
+searched for the "Sortable" title row. ESPN's stats API (``byathlete``)
+returns the same leaders as JSON: the category's stat ``names`` once, then
+per athlete the display name, team, position and a ``values`` array aligned
+with those names::
+
+    {"categories": [{"name": "passing", "names": ["completions", ...]}],
+     "athletes": [{"athlete": {"displayName": ..., "teamShortName": ...,
+                               "position": {"abbreviation": ...}},
+                   "categories": [{"name": "passing", "values": [25, ...]}]}]}
+
+`decode_leaders` maps those names to the cleaned columns the HTML parser
+produces and builds every column at once, with the registry's types, so
+both strategies yield the same output schema. Stats the registry does not
+declare stay text, as the HTML parser keeps them, written the way the page
+shows them (``5``, not ``5.0``). Values that do not fit their declared
+type (a fractional value in an integer column) raise instead of being
+truncated, so the unit is recorded as failed. The weekly pages' ``result``
+column (game score) has no equivalent in the stats response.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import polars as pl
+
+from ..schema import SITE_SCHEMAS
+
+SITE = 'ESPN.com'
+
+# ESPN stat names -> cleaned column names of the HTML weekly leaders tables
+STAT_NAMES: dict[str, dict[str, str]] = {
+    'passing': {
+        'completions': 'completions',
+        'passingAttempts': 'attempts',
+        'passingYards': 'yards',
+        'passingTouchdowns': 'touchdowns',
+        'interceptions': 'interceptions',
+        'sacks': 'sacks',
+        'fumbles': 'fumbles',
+        'QBRating': 'rating',
+    },
+    'rushing': {
+        'rushingAttempts': 'carries',
+        'rushingYards': 'yards',
+        'yardsPerRushAttempt': 'average',
+        'longRushing': 'longest',
+        'rushingTouchdowns': 'touchdowns',
+        'fumbles': 'fumbles',
+    },
+    'receiving': {
+        'receptions': 'receptions',
+        'receivingTargets': 'targets',
+        'receivingYards': 'yards',
+        'yardsPerReception': 'average',
+        'longReception': 'longest',
+        'receivingTouchdowns': 'touchdowns',
+        'fumbles': 'fumbles',
+    },
+    'defensive': {
+        'soloTackles': 'solo',
+        'assistTackles': 'ast',
+        'totalTackles': 'tot',
+        'sacks': 'sacks',
+        'interceptions': 'interceptions',
+        'fumblesForced': 'ff',
+        'fumblesRecovered': 'fr',
+        'passesDefended': 'pd',
+    },
+}
+
+
+def decode_leaders(
+    payload: dict[str, Any], category: str, columns: tuple[str, ...] | None = None
+) -> pl.DataFrame:
+    """Frame of one ``byathlete`` response, shaped like the HTML weekly leaders table.
+
+    `category` is the scraper's stat type ('passing', ...); `columns` projects
+    the cleaned columns as in `ESPNScraper._parse_stats_table`.
+    """
+    athletes = payload.get('athletes') or []
+    wanted = next(
+        (c for c in payload.get('categories', []) if c.get('name') == category), None
+    )
+    if not athletes or wanted is None:
+        return pl.DataFrame([])
+
+    mapping = STAT_NAMES.get(category, {})
+    stat_index = {
+        mapping.get(name, name.lower()): i for i, name in enumerate(wanted.get('names', []))
+    }
+
+    def keep(name: str) -> bool:
+        return columns is None or name in columns
+
+    def stat_values(athlete: dict[str, Any]) -> list[Any]:
+        for entry in athlete.get('categories', []):
+            if entry.get('name') == category:
+                return entry.get('values') or []
+        return []
+
+    values = [stat_values(a) for a in athletes]
+    info = [a.get('athlete', {}) for a in athletes]
+    data: dict[str, list[Any]] = {}
+    if keep('rank'):
+        data['rank'] = list(range(1, len(athletes) + 1))
+    if keep('player'):
+        data['player'] = [a.get('displayName') for a in info]
+        if keep('position'):
+            data['position'] = [(a.get('position') or {}).get('abbreviation') for a in info]
+    if keep('team'):
+        data['team'] = [a.get('teamShortName') for a in info]
+    declared = SITE_SCHEMAS[SITE]
+    for name, i in stat_index.items():
+        if keep(name):
+            column = [row[i] if i < len(row) else None for row in values]
+            if name not in declared:
+                data[name] = [_text(v) for v in column]
+            elif declared[name].is_integer():
+                data[name] = [_whole(v) for v in column]
+            else:
+                data[name] = column
+    if not data:
+        return pl.DataFrame([])
+
+    return pl.DataFrame(data, schema={name: declared.get(name, pl.Utf8) for name in data})
+
+
+def _whole(value: Any) -> Any:
+    """`value` as an int when it is a whole number; anything else is left to fail the cast."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _text(value: Any) -> str | None:
+    """`value` as the weekly pages print it: whole numbers without a decimal point."""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+__all__ = ['STAT_NAMES', 'decode_leaders']
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
+import logging
 import re
+from dataclasses import replace
+from typing import TYPE_CHECKING
 
 import httpx
 import polars as pl
@@ -16,9 +18,15 @@ from ..discover import (
     get_category_links,
     get_year_urls,
 )
+from ..exceptions import ScraperError
 from ..pagination import fetch_all_stats_parallel
-from ..schema import unify_frames
-from .base import BaseSiteScraper
+from ..schema import conform
+from .base import BaseSiteScraper, WorkUnit
+
+if TYPE_CHECKING:
+    from ..failures import FailureManifest
+
+logger = logging.getLogger(__name__)
 
 
 def ensure_year_in_url(url: str, year: str) -> str:
@@ -34,57 +42,62 @@ def ensure_year_in_url(url: str, year: str) -> str:
     return f'{url}{joiner}season={year}'
 
 
+# The table a year page shows before a category is chosen
+DEFAULT_CATEGORY = 'passing'
+
+
 class NFLComScraper(BaseSiteScraper):
     """Scraper for NFL.com stats."""
 
+    # Default maximum number of concurrent page-category fetches.
+    concurrency = 20
+
     @property
     def site_name(self) -> str:
         return "NFL.com"
 
-    async def get_player_stats(
-        self,
-        client: httpx.AsyncClient,
-        years: list[int] | None = None
-    ) -> pl.DataFrame:
-        """Fetch player stats from NFL.com for given years."""
-        return await self._gather_stats(client, years, player=True)
+    def available_categories(self, *, player: bool) -> list[str]:
+        return sorted(PLAYER_CATEGORIES if player else TEAM_CATEGORIES)
 
-    async def get_team_stats(
-        self,
-        client: httpx.AsyncClient,
-        years: list[int] | None = None
-    ) -> pl.DataFrame:
-        """Fetch team stats from NFL.com for given years."""
-        return await self._gather_stats(client, years, player=False)
+    async def discover_years(self, client: httpx.AsyncClient, *, player: bool) -> list[int]:
+        """Seasons listed on the root stats page."""
+        year_urls = await get_year_urls(client, PLAYER_ROOT if player else TEAM_ROOT)
+        return sorted(int(year) for year in year_urls)
 
-    async def _gather_stats(
+    async def plan_units(
         self,
         client: httpx.AsyncClient,
-        years: list[int] | None,
+        years: list[int] | None = None,
         *,
-        player: bool
-    ) -> pl.DataFrame:
-        """Internal method that orchestrates the full NFL.com scrape.
-
-        Parameters
-        ----------
-        client:
-            HTTP client to use for requests.
-        years:
-            Optional collection of season years to restrict the scrape to. If None
-            all discovered years are included (typically most recent first).
-        player:
-            If True scrape player statistics; otherwise team statistics.
-
-        Returns
-        -------
-        pl.DataFrame
-            Unified table containing all rows from every (year, category) combo.
-            Always includes at least the columns: ['year', 'category', 'source'] when data
-            exists; may be empty if no rows were fetched.
+        player: bool,
+        categories: list[str] | None = None,
+        weeks: list[int] | None = None,
+        season_types: list[str] | None = None,
+        columns: list[str] | None = None,
+        failures: FailureManifest | None = None,
+    ) -> list[WorkUnit]:
+        """Discover the (year, category) tables to fetch.
+
+        Discovery requires the root stats page plus one page per year to resolve
+        category links; the pagination of each table is handled in `fetch_unit`.
+        NFL.com tables are regular-season totals, so a plan restricted to weeks
+        or to other season types is empty and costs no requests.
+
+        With a `failures` manifest a year page that cannot be fetched is
+        recorded there -- one discovery failure per wanted category, which
+        `api.retry_failed` plans again -- and the other years are planned.
+        A requested category the year page has no link for is recorded the
+        same way (logged as a warning without a manifest) and skipped.
         """
+        if weeks or (season_types and 'regular' not in season_types):
+            return []
         root = PLAYER_ROOT if player else TEAM_ROOT
-        categories = PLAYER_CATEGORIES if player else TEAM_CATEGORIES
+        wanted = PLAYER_CATEGORIES if player else TEAM_CATEGORIES
+        if categories:
+            wanted = wanted & {c.lower() for c in categories}
+            if not wanted:
+                return []
+        projection = tuple(columns) if columns else None
 
         # Discover available years from the root stats page.
         year_urls = await get_year_urls(client, root)
@@ -92,35 +105,68 @@ class NFLComScraper(BaseSiteScraper):
             # Filter discovered years to requested subset (keeping only those present).
             year_urls = {str(y): u for y, u in year_urls.items() if int(y) in years}
 
-        frames: list[pl.DataFrame] = []  # Collected raw DataFrames per category/year.
-        tasks: list[asyncio.Task] = []
-
-        # Throttle maximum concurrent page-category fetches to avoid overloading the site.
-        semaphore = asyncio.Semaphore(20)
-
-        async def fetch_year_cat(year: str, cat: str, url: str) -> None:
-            """Fetch one (year, category) table (with pagination) and append to frames if non-empty."""
-            async with semaphore:
-                df = await fetch_all_stats_parallel(client, ensure_year_in_url(url, year))
-                if df.shape[0] > 0:
-                    # Attach context columns before accumulation.
-                    df = df.with_columns([
-                        pl.lit(int(year)).alias('year'),
-                        pl.lit(cat).alias('category'),
-                        pl.lit(self.site_name).alias('source'),
-                    ])
-                    frames.append(df)
-
-        # For each year, discover category links and enqueue fetch tasks.
+        units: list[WorkUnit] = []
+        # For each year, discover category links and emit one unit per table.
         for year, base_url in year_urls.items():
-            cat_links = await get_category_links(client, base_url, categories)
-            if not cat_links:  # Fallback: treat base page as a single category (first of the set)
-                cat_links = {list(categories)[0]: base_url}
+            page = WorkUnit(
+                site=self.site_name,
+                year=int(year),
+                category='',
+                url=base_url,
+                player=player,
+                columns=projection,
+            )
+            try:
+                cat_links = await get_category_links(client, base_url, wanted)
+            except Exception as e:
+                if failures is None:
+                    raise
+                self._discovery_failed(failures, page, wanted, e)
+                continue
+            missing = wanted - cat_links.keys()
+            if not categories:
+                if not cat_links:  # Fallback: the year page itself shows the default table
+                    cat_links = {DEFAULT_CATEGORY: base_url}
+            elif missing:
+                # Never label another table (the year page) as a requested category
+                error = ScraperError(f'no link for {", ".join(sorted(missing))}; skipped')
+                self._discovery_failed(failures, page, missing, error)
             for cat, url in cat_links.items():
-                tasks.append(asyncio.create_task(fetch_year_cat(year, cat, url)))
-
-        # Execute all tasks concurrently (respecting semaphore limits).
-        await asyncio.gather(*tasks)
-
-        # Unify schemas across all gathered frames (handles missing columns & dtypes).
-        return unify_frames(frames)
+                units.append(WorkUnit(
+                    site=self.site_name,
+                    year=int(year),
+                    category=cat,
+                    url=ensure_year_in_url(url, year),
+                    player=player,
+                    columns=projection,
+                ))
+        return units
+
+    def _discovery_failed(
+        self,
+        failures: FailureManifest | None,
+        page: WorkUnit,
+        categories: set[str],
+        exc: Exception,
+    ) -> None:
+        """Record `categories` of the year `page` as discovery failures, to be planned again."""
+        if failures is None:
+            logger.warning('%s %s: %s', self.site_name, page.year, exc)
+            return
+        for cat in sorted(categories):
+            failures.record(
+                replace(page, category=cat), exc, strategy=self.strategy, stage='discovery'
+            )
+
+    async def fetch_unit(self, client: httpx.AsyncClient, unit: WorkUnit) -> pl.DataFrame:
+        """Fetch one (year, category) table (with pagination) and attach context columns."""
+        df = await fetch_all_stats_parallel(
+            client, unit.url, columns=unit.columns, fingerprints=self.fingerprints
+        )
+        if df.shape[0] == 0:
+            return df
+        return conform(df.with_columns([
+            pl.lit(unit.year).alias('year'),
+            pl.lit(unit.category).alias('category'),
+            pl.lit(self.site_name).alias('source'),
+        ]))
@@ -0,0 +1,111 @@
+"""Bounded-memory scrapes: completed units spill to disk, exports stream.
+
+Normally every unit's frame stays in memory until the scrape ends, is
+unified into one more copy and only then written out, so a full multi-season,
+multi-site scrape peaks at several times the final dataset size. With a
+`Spill` each completed unit is buffered only until `budget` bytes are held;
+the buffer is then unified and written as one Arrow IPC file in a spill
+directory. The export is built by a lazy scan over those files (unified with
+`schema.unify_lazy`) and written with ``sink_parquet``/``sink_csv``, so peak
+memory is bounded by the budget and the streaming engine rather than by the
+length of the history.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import polars as pl
+
+from .schema import unify_frames, unify_lazy
+
+# Bytes of completed frames held in memory before they are written out
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+
+class Spill:
+	"""Spill directory collecting unit frames of one scrape.
+
+	Parameters
+	----------
+	directory:
+		Where to write the spilled files; a temporary directory (removed by
+		`cleanup`) when None.
+	budget:
+		Bytes of frames buffered in memory before they are written to disk.
+	"""
+
+	def __init__(
+		self, directory: str | os.PathLike[str] | None = None, *, budget: int = DEFAULT_BUDGET
+	) -> None:
+		self.owned = directory is None
+		if directory is None:
+			self.directory = Path(tempfile.mkdtemp(prefix='nfl-spill-'))
+		else:
+			self.directory = Path(directory)
+			self.directory.mkdir(parents=True, exist_ok=True)
+		self.budget = budget
+		self.files: list[Path] = []
+		self.rows = 0
+		self._buffer: list[pl.DataFrame] = []
+		self._buffered = 0
+
+	def __repr__(self) -> str:
+		return f'Spill({str(self.directory)!r}, {len(self.files)} files, {self.rows} rows)'
+
+	def add(self, frame: pl.DataFrame) -> None:
+		"""Take a completed unit's rows; writes the buffer out once it exceeds the budget."""
+		if frame.shape[0] == 0:
+			return
+		self._buffer.append(frame)
+		self._buffered += frame.estimated_size()
+		self.rows += frame.shape[0]
+		if self._buffered >= self.budget:
+			self.flush()
+
+	def flush(self) -> None:
+		"""Write whatever is buffered to a new spill file."""
+		if not self._buffer:
+			return
+		path = self.directory / f'part-{len(self.files):05d}.arrow'
+		unify_frames(self._buffer).write_ipc(path)
+		self.files.append(path)
+		self._buffer = []
+		self._buffered = 0
+
+	def scan(self) -> pl.LazyFrame:
+		"""Lazy scan over everything spilled, with the columns/types of `unify_frames`."""
+		self.flush()
+		return unify_lazy([pl.scan_ipc(path) for path in self.files])
+
+	def sink(self, export: str, filename: str | os.PathLike[str]) -> None:
+		"""Stream the spilled rows into `filename` ('csv' or 'parquet')."""
+		fmt = export.lower()
+		if fmt not in {'csv', 'parquet', 'pq'}:
+			raise ValueError("export must be 'csv' or 'parquet'")
+		scan = self.scan()
+		if not self.files:
+			# Nothing was fetched: write the same empty file the in-memory path would
+			empty = pl.DataFrame([])
+			if fmt == 'csv':
+				empty.write_csv(filename)
+			else:
+				empty.write_parquet(filename)
+		elif fmt == 'csv':
+			scan.sink_csv(filename)
+		else:
+			scan.sink_parquet(filename)
+
+	def cleanup(self) -> None:
+		"""Remove the spill directory if this `Spill` created it."""
+		self._buffer = []
+		self._buffered = 0
+		if self.owned:
+			shutil.rmtree(self.directory, ignore_errors=True)
+			self.files = []
+
+
+__all__ = ['DEFAULT_BUDGET', 'Spill']
@@ -0,0 +1,190 @@
+"""In-memory indexed stats for point lookups without scanning the table.
+
+Looking up one player or team used to filter the whole unified frame. A
+`StatsIndex` keeps the rows in blocks, one per (source, year, season type,
+week, category) -- the unit a refresh replaces -- each sorted by entity (player, or
+team for team stats) with the sortedness flag set on the name column when
+every row has a name. Hash indexes map
+
+- (block, entity) to the entity's contiguous row range in the block,
+- (block, team) to the team's row positions,
+- entity to the blocks it appears in,
+
+so `get`/`team` are dictionary lookups plus zero-copy slices (or one gather)
+instead of full scans. `update` replaces only the blocks present in a fresh
+frame and re-indexes just those, so a refresh that lacks a category (a failed
+unit, or a category subset) keeps that category's rows. `frame` concatenates
+the blocks in (source, year, season type, week, category, entity) order and
+is cached until the next update.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import polars as pl
+
+from .reshape import entity, team
+from .schema import unify_frames
+
+BLOCK_KEY = ('source', 'year', 'season_type', 'week', 'category')
+# Columns `reshape.entity` takes the entity from, in order of preference
+ENTITY_NAMES = ('player', 'Player', 'team', 'Team')
+
+Block = tuple[str | None, int | None, str | None, int | None, str | None]
+
+
+def _order(block: Block) -> tuple:
+	# Sort None (season totals) before any week
+	return tuple((value is not None, value) for value in block)
+
+
+def _matches(block: Block, wanted: Block) -> bool:
+	return all(w is None or b == w for b, w in zip(block, wanted, strict=True))
+
+
+class StatsIndex:
+	"""Stats blocked by (source, year, season type, week, category), indexed by entity and team."""
+
+	def __init__(self, frame: pl.DataFrame | None = None) -> None:
+		self._blocks: dict[Block, pl.DataFrame] = {}
+		self._entities: dict[Block, dict[str, tuple[int, int]]] = {}
+		self._teams: dict[Block, dict[str, list[int]]] = {}
+		self._entity_blocks: dict[str, set[Block]] = {}
+		self._frame: pl.DataFrame | None = None
+		if frame is not None:
+			self.update(frame)
+
+	def __len__(self) -> int:
+		return sum(block.shape[0] for block in self._blocks.values())
+
+	def __repr__(self) -> str:
+		return f'StatsIndex({len(self._blocks)} blocks, {len(self)} rows)'
+
+	@property
+	def blocks(self) -> list[Block]:
+		"""Block keys in sort order."""
+		return sorted(self._blocks, key=_order)
+
+	@property
+	def frame(self) -> pl.DataFrame:
+		"""Every row, sorted by (source, year, season type, week, category, entity)."""
+		if self._frame is None:
+			blocks = [self._blocks[key] for key in self.blocks]
+			self._frame = unify_frames(blocks)
+		return self._frame
+
+	def update(self, fresh: pl.DataFrame) -> set[Block]:
+		"""Replace the blocks present in `fresh`; returns the keys of the replaced blocks."""
+		if fresh.shape[0] == 0:
+			return set()
+		keyed = fresh.with_columns(
+			pl.lit(None).alias(c) for c in BLOCK_KEY if c not in fresh.columns
+		)
+		parts = keyed.partition_by(list(BLOCK_KEY), as_dict=True, include_key=True)
+		for key, part in parts.items():
+			block = part.select(fresh.columns)
+			self._drop(key)
+			self._index(key, block)
+		self._frame = None
+		return set(parts)
+
+	def _drop(self, key: Block) -> None:
+		for name in self._entities.pop(key, {}):
+			blocks = self._entity_blocks.get(name)
+			if blocks is not None:
+				blocks.discard(key)
+				if not blocks:
+					del self._entity_blocks[name]
+		self._teams.pop(key, None)
+		self._blocks.pop(key, None)
+
+	def _index(self, key: Block, block: pl.DataFrame) -> None:
+		keyed = (
+			block.with_columns(entity(block).alias('_entity'), team(block).alias('_team'))
+			.sort('_entity', nulls_last=True)
+			.with_row_index('_row')
+		)
+		ranges = (
+			keyed.filter(pl.col('_entity').is_not_null())
+			.group_by('_entity', maintain_order=True)
+			.agg(pl.col('_row').first(), pl.len())
+		)
+		teams = (
+			keyed.filter(pl.col('_team').is_not_null())
+			.group_by('_team', maintain_order=True)
+			.agg(pl.col('_row'))
+		)
+		entities = {name: (start, length) for name, start, length in ranges.iter_rows()}
+		sorted_block = keyed.drop('_entity', '_team', '_row')
+		name_column = next((c for c in ENTITY_NAMES if c in block.columns), None)
+		# Rows are sorted by the coalesced entity, which is the name column only
+		# while no row falls back to a later entity column
+		if (
+			name_column is not None
+			and block.schema[name_column] == pl.Utf8
+			and block[name_column].null_count() == 0
+		):
+			sorted_block = sorted_block.set_sorted(name_column)
+		self._blocks[key] = sorted_block
+		self._entities[key] = entities
+		self._teams[key] = {name: rows for name, rows in teams.iter_rows()}
+		for name in entities:
+			self._entity_blocks.setdefault(name, set()).add(key)
+
+	def _select(self, blocks: Iterable[Block], wanted: Block) -> list[Block]:
+		return sorted((b for b in blocks if _matches(b, wanted)), key=_order)
+
+	def get(
+		self,
+		name: str,
+		*,
+		source: str | None = None,
+		year: int | None = None,
+		season_type: str | None = None,
+		week: int | range | None = None,
+		category: str | None = None,
+	) -> pl.DataFrame:
+		"""Rows of player (or team) `name`, optionally restricted to a block or week range.
+
+		With every coordinate given this is two dictionary lookups and a slice.
+		"""
+		weeks = week if isinstance(week, range) else None
+		wanted: Block = (source, year, season_type, None if weeks is not None else week, category)
+		if None not in wanted:
+			candidates = [wanted] if wanted in self._blocks else []
+		else:
+			candidates = self._select(self._entity_blocks.get(name, ()), wanted)
+		if weeks is not None:
+			candidates = [b for b in candidates if b[3] in weeks]
+		parts = []
+		for key in candidates:
+			span = self._entities[key].get(name)
+			if span is not None:
+				parts.append(self._blocks[key].slice(*span))
+		return parts[0] if len(parts) == 1 else unify_frames(parts)
+
+	def team(
+		self,
+		name: str,
+		*,
+		source: str | None = None,
+		year: int | None = None,
+		season_type: str | None = None,
+		week: int | range | None = None,
+		category: str | None = None,
+	) -> pl.DataFrame:
+		"""Rows whose team is `name` (e.g. every KC player of a week)."""
+		weeks = week if isinstance(week, range) else None
+		wanted: Block = (source, year, season_type, None if weeks is not None else week, category)
+		parts = []
+		for key in self._select(self._teams, wanted):
+			if weeks is not None and key[3] not in weeks:
+				continue
+			rows = self._teams[key].get(name)
+			if rows:
+				parts.append(self._blocks[key][rows])
+		return unify_frames(parts)
+
+
+__all__ = ['BLOCK_KEY', 'StatsIndex']
@@ -0,0 +1,324 @@
+"""Local stored dataset with content-hash upserts.
+
+Scraped frames are merged into a directory of Parquet files partitioned as
+``source=<site>/year=<year>/category=<category>/part.parquet`` (hive layout,
+values percent-encoded). Rows are matched on their natural key -- source,
+year, week, season_type, category plus the player/team column -- and every
+stored row carries a hash of its remaining values. An upsert compares those
+hashes to split the incoming rows into inserted, updated and unchanged, and
+only rewrites the partitions that actually changed.
+
+The union of the partition files' column types is kept in
+``_schema.parquet`` (an empty frame) next to ``_dtypes.json`` and extended
+by every upsert, so `Dataset.scan` reads one footer instead of every
+partition's and leaves the partition pruning to ``scan_parquet``.
+
+Row hashes are a seeded Polars hash of one canonical string per row: the
+column names, then each value as text (widened to Int64/Float64 first,
+categoricals by label). They are stable across processes and column
+widths; should a Polars upgrade change its string hash, the first upsert
+after it reports every row as updated once.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import polars as pl
+
+from .aggregates import Aggregates
+from .compact import apply_schema, compact_schema, widen
+
+NATURAL_KEYS = ('source', 'year', 'week', 'season_type', 'category')
+ENTITY_KEYS = ('player', 'Player', 'team', 'Team')
+PARTITION_KEYS = ('source', 'year', 'category')
+HASH_COLUMN = '_row_hash'
+PART_NAME = 'part.parquet'
+DTYPES_NAME = '_dtypes.json'
+SCHEMA_NAME = '_schema.parquet'
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+	"""Outcome of an upsert: the rows that were inserted or updated, and how many were unchanged."""
+
+	inserted: pl.DataFrame
+	updated: pl.DataFrame
+	unchanged: int
+
+	@property
+	def changed(self) -> pl.DataFrame:
+		"""Inserted and updated rows together (the delta to recompute from)."""
+		frames = [df for df in (self.inserted, self.updated) if df.shape[0] > 0]
+		if not frames:
+			return pl.DataFrame([])
+		return pl.concat(frames, how='diagonal_relaxed')
+
+	def __bool__(self) -> bool:
+		return self.inserted.shape[0] > 0 or self.updated.shape[0] > 0
+
+
+def key_columns(frame: pl.DataFrame) -> list[str]:
+	"""Natural key columns present in `frame`."""
+	return [c for c in (*NATURAL_KEYS, *ENTITY_KEYS) if c in frame.columns]
+
+
+def _encoded(name: str, dtype: pl.DataType) -> pl.Expr:
+	"""Column as hashed: its value as text, independent of its declared width or encoding."""
+	value = pl.col(name)
+	if dtype.is_integer():
+		value = value.cast(pl.Int64)
+	elif dtype.is_float():
+		value = value.cast(pl.Float64)
+	# Categorical/Enum by label, since physical codes differ between runs; the
+	# 'v'/'n' prefix keeps a null apart from any text value
+	return pl.concat_str([pl.lit('v'), value.cast(pl.Utf8)]).fill_null(pl.lit('n'))
+
+
+def with_row_hash(frame: pl.DataFrame, keys: list[str]) -> pl.DataFrame:
+	"""Attach `_row_hash`, a hash of every non-key column (in name order)."""
+	values = sorted(c for c in frame.columns if c not in keys and c != HASH_COLUMN)
+	if not values:
+		return frame.with_columns(pl.lit(0, dtype=pl.UInt64).alias(HASH_COLUMN))
+	# The column names lead the encoding, so adding a column changes every hash
+	header = pl.lit('\x1e'.join(values))
+	encoded = pl.concat_str(
+		[header, *(_encoded(c, frame.schema[c]) for c in values)], separator='\x1f'
+	)
+	return frame.with_columns(encoded.hash(seed=0).alias(HASH_COLUMN))
+
+
+class Dataset:
+	"""Partitioned Parquet dataset rooted at `root`."""
+
+	def __init__(self, root: str | os.PathLike[str]) -> None:
+		self.root = Path(root)
+
+	@property
+	def aggregates(self) -> Aggregates:
+		"""Materialized season/team views stored under ``<root>/_aggregates``."""
+		return Aggregates(self)
+
+	def partition_path(self, source: str, year: int, category: str) -> Path:
+		return (
+			self.root
+			/ f'source={quote(str(source), safe="")}'
+			/ f'year={year}'
+			/ f'category={quote(str(category), safe="")}'
+			/ PART_NAME
+		)
+
+	def partitions(self) -> list[Path]:
+		"""Every partition file currently stored."""
+		return sorted(self.root.glob(f'source=*/year=*/category=*/{PART_NAME}'))
+
+	def read_partition(self, path: Path) -> pl.DataFrame:
+		"""Read one partition, restoring its partition columns from the path."""
+		values = dict(part.split('=', 1) for part in path.parent.relative_to(self.root).parts)
+		return pl.read_parquet(path).drop(HASH_COLUMN, strict=False).with_columns(
+			pl.lit(unquote(values['source'])).alias('source'),
+			pl.lit(int(values['year'])).alias('year'),
+			pl.lit(unquote(values['category'])).alias('category'),
+		)
+
+	def file_schema(self) -> dict[str, pl.DataType]:
+		"""Union of the column types stored across all partition files.
+
+		Numeric columns use their recorded, widest type.
+		"""
+		recorded = self.recorded_dtypes()
+		return {col: recorded.get(col, dtype) for col, dtype in self._stored_schema().items()}
+
+	def _stored_schema(self) -> dict[str, pl.DataType]:
+		"""Column types of the partition files (first seen wins), from ``_schema.parquet``.
+
+		A dataset written before the file existed has it rebuilt from the
+		partition footers once.
+		"""
+		path = self.root / SCHEMA_NAME
+		if path.exists():
+			return dict(pl.read_parquet_schema(path))
+		schema: dict[str, pl.DataType] = {}
+		for part in self.partitions():
+			for col, dtype in pl.read_parquet_schema(part).items():
+				schema.setdefault(col, dtype)
+		if schema:
+			self._record_schema(schema)
+		return schema
+
+	def _record_schema(self, schema: dict[str, pl.DataType]) -> None:
+		path = self.root / SCHEMA_NAME
+		tmp = path.with_suffix('.tmp')
+		pl.DataFrame(schema=schema).write_parquet(tmp)
+		os.replace(tmp, path)
+
+	def recorded_dtypes(self) -> dict[str, pl.DataType]:
+		"""Numeric column types every partition fits in (see `upsert`)."""
+		path = self.root / DTYPES_NAME
+		if not path.exists():
+			return {}
+		return {col: getattr(pl, name)() for col, name in json.loads(path.read_text()).items()}
+
+	def _record_dtypes(self, dtypes: dict[str, pl.DataType]) -> None:
+		self.root.mkdir(parents=True, exist_ok=True)
+		path = self.root / DTYPES_NAME
+		tmp = path.with_suffix('.tmp')
+		tmp.write_text(json.dumps({col: str(dt) for col, dt in sorted(dtypes.items())}, indent=1))
+		os.replace(tmp, path)
+
+	def _numeric_dtypes(self, frame: pl.DataFrame, *, compact: bool) -> pl.DataFrame:
+		"""Cast numeric columns to the recorded types, widening the record as needed.
+
+		With `compact` a column's candidate type is the smallest holding its
+		values, otherwise its own type; either way it never narrows a type
+		already recorded, so every stored partition fits the record.
+		"""
+		recorded = self.recorded_dtypes()
+		keys = key_columns(frame)
+		chosen = compact_schema(frame, exclude=keys) if compact else {}
+		targets = dict(recorded)
+		for col, dtype in frame.schema.items():
+			if col in keys or not (dtype.is_numeric() or col in chosen):
+				continue
+			wanted = chosen.get(col, dtype)
+			targets[col] = widen(recorded[col], wanted) if col in recorded else wanted
+		if targets != recorded:
+			self._record_dtypes(targets)
+		numeric = {c: targets[c] for c, dt in frame.schema.items() if c in targets and dt.is_numeric()}
+		return apply_schema(frame, numeric)
+
+	def scan(self) -> pl.LazyFrame:
+		"""Lazily scan the whole dataset (partition columns come from the paths).
+
+		The schema comes from ``_schema.parquet``, so no partition file is
+		opened until the query runs; filters on source, year and category then
+		prune whole partition files.
+		"""
+		schema = self.file_schema()
+		if not schema:
+			return pl.LazyFrame()
+		return pl.scan_parquet(
+			self.root / '**' / PART_NAME,
+			hive_partitioning=True,
+			schema=schema,
+			missing_columns='insert',
+			# partitions written before a recorded type widened hold narrower types
+			cast_options=pl.ScanCastOptions(integer_cast='upcast', float_cast='upcast'),
+		).drop(HASH_COLUMN, strict=False)
+
+	def read(self) -> pl.DataFrame:
+		"""Read the whole dataset, dropping the internal row hash column."""
+		frames = [self.read_partition(p) for p in self.partitions()]
+		if not frames:
+			return pl.DataFrame([])
+		return pl.concat(frames, how='diagonal_relaxed')
+
+	def upsert(self, frame: pl.DataFrame, *, compact: bool = False) -> ChangeSet:
+		"""Merge `frame` into the dataset, returning the change set.
+
+		With `compact` numeric columns are downcast to the smallest types that
+		hold them (see `compact.compact`). Every upsert records the numeric
+		types in ``_dtypes.json`` and casts to them; recorded types only ever
+		widen, so all partitions share them whether compacted or not.
+
+		Rows whose natural key is new are inserted, rows whose content hash
+		differs replace the stored row, and all other rows are left untouched.
+		Only partitions with inserted or updated rows are rewritten, and the
+		aggregate views (see `aggregates`) are refreshed for just those
+		partitions.
+		"""
+		if frame.shape[0] == 0:
+			return ChangeSet(pl.DataFrame([]), pl.DataFrame([]), 0)
+		missing = [c for c in PARTITION_KEYS if c not in frame.columns]
+		if missing:
+			raise ValueError(f'frame is missing partition columns: {missing}')
+		frame = self._numeric_dtypes(frame, compact=compact)
+
+		inserted: list[pl.DataFrame] = []
+		updated: list[pl.DataFrame] = []
+		unchanged = 0
+		stored = self._stored_schema()
+		schema = dict(stored)
+		for (source, year, category), part in frame.partition_by(
+			list(PARTITION_KEYS), as_dict=True, maintain_order=True
+		).items():
+			ins, upd, same, written = self._upsert_partition(
+				str(source), int(year), str(category), part
+			)
+			inserted.append(ins)
+			updated.append(upd)
+			unchanged += same
+			for col, dtype in written.items():
+				schema.setdefault(col, dtype)
+		if schema != stored:
+			self._record_schema(schema)
+
+		def stack(frames: list[pl.DataFrame]) -> pl.DataFrame:
+			frames = [df for df in frames if df.shape[0] > 0]
+			return pl.concat(frames, how='diagonal_relaxed') if frames else pl.DataFrame([])
+
+		changes = ChangeSet(stack(inserted), stack(updated), unchanged)
+		if changes:
+			self.aggregates.refresh(changes)
+		return changes
+
+	def _upsert_partition(
+		self, source: str, year: int, category: str, part: pl.DataFrame
+	) -> tuple[pl.DataFrame, pl.DataFrame, int, pl.Schema]:
+		"""Inserted rows, updated rows, unchanged count and the schema written (if any)."""
+		# Columns that are entirely null here are artifacts of unifying with
+		# other categories/sites; dropping them keeps hashes and files stable.
+		part = part.select([c for c in part.columns if part[c].null_count() < part.shape[0]])
+		keys = key_columns(part)
+		part = with_row_hash(part.unique(subset=keys, keep='last', maintain_order=True), keys)
+		local_keys = [c for c in keys if c not in PARTITION_KEYS]
+
+		path = self.partition_path(source, year, category)
+		stored = pl.read_parquet(path) if path.exists() else None
+		payload = part.drop([c for c in PARTITION_KEYS if c in part.columns])
+
+		if stored is None or not local_keys:
+			merged = payload
+			changes = payload.with_columns(pl.lit(None, dtype=pl.UInt64).alias('_stored_hash'))
+		else:
+			stored_keys = stored.select(local_keys + [HASH_COLUMN]).rename(
+				{HASH_COLUMN: '_stored_hash'}
+			)
+			casts = [pl.col(c).cast(stored.schema[c]) for c in local_keys if c in stored.columns]
+			payload = payload.with_columns(casts)
+			changes = payload.join(stored_keys, on=local_keys, how='left', nulls_equal=True)
+			kept = stored.join(payload.select(local_keys), on=local_keys, how='anti', nulls_equal=True)
+			merged = pl.concat([kept, payload], how='diagonal_relaxed')
+
+		is_new = pl.col('_stored_hash').is_null()
+		is_changed = pl.col('_stored_hash') != pl.col(HASH_COLUMN)
+		context = [
+			pl.lit(source).alias('source'),
+			pl.lit(year).alias('year'),
+			pl.lit(category).alias('category'),
+		]
+		ins = changes.filter(is_new).drop('_stored_hash', HASH_COLUMN).with_columns(context)
+		upd = changes.filter(~is_new & is_changed).drop('_stored_hash', HASH_COLUMN).with_columns(context)
+		same = changes.shape[0] - ins.shape[0] - upd.shape[0]
+
+		if not (ins.shape[0] or upd.shape[0]):
+			return ins, upd, same, pl.Schema()
+		path.parent.mkdir(parents=True, exist_ok=True)
+		tmp = path.with_suffix('.tmp')
+		merged.write_parquet(tmp)
+		os.replace(tmp, path)
+		return ins, upd, same, merged.schema
+
+
+def upsert(
+	root: str | os.PathLike[str], frame: pl.DataFrame, *, compact: bool = False
+) -> ChangeSet:
+	"""Upsert `frame` into the dataset stored at `root` (see `Dataset.upsert`)."""
+	return Dataset(root).upsert(frame, compact=compact)
+
+
+__all__ = ['ChangeSet', 'Dataset', 'upsert']
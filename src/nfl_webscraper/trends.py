@@ -0,0 +1,238 @@
+"""Vectorized rolling-window and trend statistics over weekly rows.
+
+Consumers of the weekly ESPN data computed trailing averages, form and ranks
+in Python loops per player. `add_trends` adds them as Polars window
+expressions instead, evaluated in one ``with_columns`` (lazily when given a
+LazyFrame). For every stat column ``c`` of a `Trends` spec:
+
+- ``c_mean_N`` / ``c_sum_N``: mean and sum over the player's last N weekly
+  rows (the weeks the player appears in, across seasons);
+- ``c_ewm``: exponentially weighted form, ``half_life`` rows;
+- ``c_season``: season-to-date total;
+- ``c_rank``: rank within the week's category (and position), highest
+  first. Season-total rows (no week) are ranked within the season.
+
+Windows follow each player (``player_id`` when present, else the name) per
+source and category, ordered by year, regular season before postseason,
+then week. Rows without a week get no window values.
+
+`update_trends` folds new or corrected weeks into a frame that already has
+trends: only the affected players' rows from the first changed week onward
+are recomputed, seeded from the rows just before it, so adding one week
+costs one week of work rather than the player's whole history.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import polars as pl
+
+from .compact import parse_numeric
+from .schema import unify_frames
+
+ENTITY_KEYS = ('player_id', 'player', 'Player', 'team', 'Team')
+WEEK_KEY = ('source', 'year', 'season_type', 'week', 'category')
+
+Frame = pl.DataFrame | pl.LazyFrame
+
+# Chronological position of a weekly row within its player's history
+_ORDER = '_order'
+
+_weekly = pl.col('week').is_not_null()
+
+
+@dataclass(frozen=True)
+class Trends:
+	"""Stat `columns` to trend, the rolling `windows` (in weeks) and the EWM `half_life`."""
+
+	columns: tuple[str, ...]
+	windows: tuple[int, ...] = (3,)
+	half_life: float = 2.0
+	# Columns (besides the week and category) ranks are computed within
+	rank_within: tuple[str, ...] = ('position',)
+
+	@property
+	def context(self) -> int:
+		"""Earlier rows a window ending at a new row reaches back to."""
+		return max((*self.windows, 2)) - 1
+
+	def names(self, schema: Mapping[str, pl.DataType]) -> list[str]:
+		"""Output columns for the stat columns present in `schema`."""
+		return [name for c in self.columns if c in schema for name in self._names(c)]
+
+	def _names(self, column: str) -> list[str]:
+		rolling = [f'{column}_{kind}_{n}' for n in self.windows for kind in ('mean', 'sum')]
+		return [*rolling, f'{column}_ewm', f'{column}_season', f'{column}_rank']
+
+	def window_exprs(self, schema: Mapping[str, pl.DataType]) -> list[pl.Expr]:
+		"""Rolling, EWM and season-to-date expressions (need the ``_order`` column)."""
+		return [*self._rolling(schema), *self._ewm(schema), *self._season(schema)]
+
+	def _stats(self, schema: Mapping[str, pl.DataType]) -> list[tuple[str, pl.Expr]]:
+		return [(c, _numeric(c, schema[c])) for c in self.columns if c in schema]
+
+	def _rolling(self, schema: Mapping[str, pl.DataType]) -> list[pl.Expr]:
+		player = [*_player_keys(schema), _weekly]
+		return [
+			_per_row(getattr(value, f'rolling_{kind}')(n, min_samples=1), player)
+			.alias(f'{c}_{kind}_{n}')
+			for c, value in self._stats(schema)
+			for n in self.windows
+			for kind in ('mean', 'sum')
+		]
+
+	def _ewm(self, schema: Mapping[str, pl.DataType]) -> list[pl.Expr]:
+		player = [*_player_keys(schema), _weekly]
+		return [
+			_per_row(value.ewm_mean(half_life=self.half_life, adjust=False), player)
+			.alias(f'{c}_ewm')
+			for c, value in self._stats(schema)
+		]
+
+	def _season(self, schema: Mapping[str, pl.DataType]) -> list[pl.Expr]:
+		season = [*_player_keys(schema), 'year', _weekly]
+		return [
+			_per_row(value.cum_sum(), season).alias(f'{c}_season')
+			for c, value in self._stats(schema)
+		]
+
+	def rank_exprs(self, schema: Mapping[str, pl.DataType]) -> list[pl.Expr]:
+		"""Per-week (or per-season, for totals) rank of each stat column."""
+		block = [c for c in (*WEEK_KEY, *self.rank_within) if c in schema]
+		return [
+			_numeric(c, schema[c]).rank('min', descending=True).over(block).alias(f'{c}_rank')
+			for c in self.columns
+			if c in schema
+		]
+
+
+def _numeric(column: str, dtype: pl.DataType) -> pl.Expr:
+	value = parse_numeric(column) if dtype == pl.Utf8 else pl.col(column)
+	return value.cast(pl.Float64, strict=False)
+
+
+def _player_keys(schema: Mapping[str, pl.DataType]) -> list[str]:
+	entity = next((c for c in ENTITY_KEYS if c in schema), None)
+	if entity is None:
+		raise ValueError('frame has no player or team column to compute trends per')
+	return [c for c in ('source', 'category') if c in schema] + [entity]
+
+
+def _per_row(expr: pl.Expr, partition: list[str | pl.Expr]) -> pl.Expr:
+	# Null for season-total rows, which have no place in a weekly window
+	return pl.when(_weekly).then(expr.over(partition, order_by=_ORDER))
+
+
+def _order(schema: Mapping[str, pl.DataType]) -> pl.Expr:
+	postseason = (
+		pl.when(pl.col('season_type') == 'postseason').then(50).otherwise(0)
+		if 'season_type' in schema
+		else pl.lit(0)
+	)
+	year = pl.col('year').cast(pl.Int32)
+	return (year * 100 + postseason + pl.col('week')).alias(_ORDER)
+
+
+def _check(schema: Mapping[str, pl.DataType]) -> None:
+	missing = [c for c in ('year', 'week') if c not in schema]
+	if missing:
+		raise ValueError(f'frame has no {missing} column(s); trends need weekly rows')
+
+
+def add_trends(frame: Frame, trends: Trends) -> Frame:
+	"""Add the rolling, EWM, season-to-date and rank columns of `trends` to `frame`.
+
+	A LazyFrame stays lazy, so the window expressions are fused into the
+	surrounding query.
+	"""
+	schema = frame.collect_schema()
+	_check(schema)
+	return (
+		frame.with_columns(_order(schema))
+		.with_columns(*trends.window_exprs(schema), *trends.rank_exprs(schema))
+		.drop(_ORDER)
+	)
+
+
+def update_trends(previous: pl.DataFrame, fresh: pl.DataFrame, trends: Trends) -> pl.DataFrame:
+	"""Replace the weeks `fresh` covers in `previous` and recompute only what they affect.
+
+	`previous` is an `add_trends` result; each (source, year, season type,
+	week, category) present in `fresh` replaces those rows. Ranks are
+	computed for the fresh weeks alone. Rolling, EWM and season-to-date
+	values are recomputed for the players in the replaced weeks, from their
+	first changed week onward, seeded by the `Trends.context` rows before it;
+	everything else keeps its stored values.
+
+	Returns
+	-------
+	pl.DataFrame
+		Same rows as ``add_trends(<previous with fresh applied>, trends)``; the
+		untouched rows first, then the recomputed ones.
+	"""
+	if fresh.shape[0] == 0:
+		return previous
+	schema = fresh.schema
+	_check(schema)
+	player = _player_keys(schema)
+	block = [c for c in WEEK_KEY if c in schema]
+	replaced = fresh.select(block).unique()
+	order = _order(schema)
+
+	kept = previous.join(replaced, on=block, how='anti', nulls_equal=True)
+	dropped = previous.join(replaced, on=block, how='semi', nulls_equal=True)
+	starts = (
+		pl.concat([dropped.select(*player, order), fresh.select(*player, order)])
+		.drop_nulls(_ORDER)
+		.group_by(player)
+		.agg(pl.col(_ORDER).min().alias('_start'))
+	)
+	kept = kept.with_columns(order).join(starts, on=player, how='left', nulls_equal=True)
+	later = pl.col(_ORDER) >= pl.col('_start')
+	settled = kept.filter(later.not_() | pl.col('_start').is_null() | pl.col(_ORDER).is_null())
+	redo = kept.filter(later)
+	context = (
+		settled.filter(pl.col('_start').is_not_null() & pl.col(_ORDER).is_not_null())
+		.sort(_ORDER)
+		.group_by(player, maintain_order=True)
+		.tail(trends.context)
+	)
+
+	ranked = fresh.with_columns(*trends.rank_exprs(schema), order)
+	recomputed = _recompute(trends, context, unify_frames([redo, ranked]), player)
+	result = unify_frames([
+		settled.drop(_ORDER, '_start'),
+		recomputed.drop(_ORDER, '_start', strict=False),
+	])
+	columns = [c for c in previous.columns if c in result.columns]
+	return result.select(*columns, *(c for c in result.columns if c not in columns))
+
+
+def _recompute(
+	trends: Trends, context: pl.DataFrame, rows: pl.DataFrame, player: list[str]
+) -> pl.DataFrame:
+	"""Window values of `rows`, continuing the stored values of `context`."""
+	schema = rows.schema
+	raw = unify_frames([context.with_columns(pl.lit(True).alias('_context')), rows])
+	raw = raw.with_columns(pl.col('_context').fill_null(False)).with_row_index('_row')
+	# Rolling windows need the raw values of the earlier rows ...
+	result = raw.with_columns(trends._rolling(raw.schema))
+	# ... EWM and running totals only the player's last stored value, fed in
+	# as that row's value.
+	seed = pl.col('_context') & (
+		pl.col(_ORDER) == pl.col(_ORDER).filter(pl.col('_context')).max().over(player)
+	)
+	seeded = raw.filter(pl.col('_context').not_() | seed)
+	for kind, exprs in (('ewm', trends._ewm), ('season', trends._season)):
+		stored = seeded.with_columns(
+			pl.when(pl.col('_context')).then(pl.col(f'{c}_{kind}')).otherwise(value).alias(c)
+			for c, value in trends._stats(schema)
+		)
+		values = stored.select('_row', *exprs(stored.schema))
+		result = result.drop(values.columns[1:]).join(values, on='_row', how='left')
+	return result.filter(pl.col('_context').not_()).drop('_context', '_row')
+
+
+__all__ = ['ENTITY_KEYS', 'Trends', 'add_trends', 'update_trends']
@@ -0,0 +1,333 @@
+"""SQLite-backed work queue for spreading scrapes over several machines.
+
+Work units (see `sites.base.WorkUnit`) are enumerated once into a shared
+SQLite database. Workers on any node lease units, heartbeat while fetching
+and commit each unit's frame back into the database. A lease that is not
+renewed before it expires is handed to the next worker that asks, so a dead
+node never loses work; an expired lease counts as an attempt, so a unit that
+keeps crashing its worker is eventually parked as failed.
+
+The database must live on a filesystem with working POSIX locks (a local
+disk, or a network share that supports them); no other broker is needed.
+It uses SQLite's rollback journal rather than WAL, which relies on shared
+memory and is unsafe when nodes open the file over NFS/SMB.
+
+Typical flow::
+
+	queue = WorkQueue('backfill.db')
+	await enqueue_scrape(queue, [2019, 2020], ['nfl.com', 'espn.com'], player=True)
+	await run_worker(queue)  # on every node, as many times as you like
+	frame = queue.results()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import socket
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import httpx
+import polars as pl
+
+from .api import SCRAPERS, SiteName
+from .schema import unify_frames
+from .sites.base import BaseSiteScraper, WorkUnit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+	id INTEGER PRIMARY KEY AUTOINCREMENT,
+	key TEXT NOT NULL UNIQUE,
+	site TEXT NOT NULL,
+	player INTEGER NOT NULL,
+	year INTEGER NOT NULL,
+	category TEXT NOT NULL,
+	season_type TEXT,
+	week INTEGER,
+	url TEXT NOT NULL,
+	columns TEXT,
+	status TEXT NOT NULL DEFAULT 'pending',
+	lease_owner TEXT,
+	lease_expires REAL,
+	attempts INTEGER NOT NULL DEFAULT 0,
+	error TEXT,
+	result BLOB
+);
+CREATE INDEX IF NOT EXISTS units_status ON units (status, lease_expires);
+"""
+
+_UNIT_COLUMNS = ('site', 'player', 'year', 'category', 'season_type', 'week', 'url', 'columns')
+
+
+@dataclass(frozen=True)
+class Lease:
+	"""A unit currently leased to a worker."""
+
+	id: int
+	unit: WorkUnit
+	owner: str
+	expires: float
+
+
+def default_worker_id() -> str:
+	"""Identifier unique to this process on this host."""
+	return f'{socket.gethostname()}:{os.getpid()}'
+
+
+class WorkQueue:
+	"""Leased work queue stored in a single SQLite database file.
+
+	Parameters
+	----------
+	path:
+		Database file shared by every worker.
+	lease_seconds:
+		How long a lease stays valid without a heartbeat.
+	max_attempts:
+		Units that failed (or whose lease expired) this many times are parked
+		as 'failed' instead of being handed out again.
+	clock:
+		Time source (seconds); injectable for tests.
+	"""
+
+	def __init__(
+		self,
+		path: str | os.PathLike[str],
+		*,
+		lease_seconds: float = 300.0,
+		max_attempts: int = 3,
+		clock: Callable[[], float] = time.time,
+	) -> None:
+		self.path = os.fspath(path)
+		self.lease_seconds = lease_seconds
+		self.max_attempts = max_attempts
+		self._clock = clock
+		# Workers call in from `asyncio.to_thread`; the lock serializes them.
+		self._conn = sqlite3.connect(
+			self.path, timeout=60.0, isolation_level=None, check_same_thread=False
+		)
+		self._lock = threading.Lock()
+		self._conn.execute('PRAGMA journal_mode=DELETE')
+		self._conn.executescript(_SCHEMA)
+
+	def close(self) -> None:
+		self._conn.close()
+
+	def __enter__(self) -> WorkQueue:
+		return self
+
+	def __exit__(self, *exc: object) -> None:
+		self.close()
+
+	def enqueue(self, units: Iterable[WorkUnit]) -> int:
+		"""Add units to the queue, ignoring any already present; returns how many were added."""
+		rows = [
+			(
+				u.key, u.site, int(u.player), u.year, u.category, u.season_type, u.week, u.url,
+				','.join(u.columns) if u.columns is not None else None,
+			)
+			for u in units
+		]
+		with self._transaction():
+			before = self._conn.total_changes
+			self._conn.executemany(
+				f'INSERT OR IGNORE INTO units (key, {", ".join(_UNIT_COLUMNS)}) '
+				f'VALUES (?, {", ".join("?" for _ in _UNIT_COLUMNS)})',
+				rows,
+			)
+			return self._conn.total_changes - before
+
+	def lease(self, owner: str, *, limit: int = 1) -> list[Lease]:
+		"""Lease up to `limit` pending units, reclaiming any whose lease has expired.
+
+		Every lease counts as an attempt; an expired lease that used the last
+		one is parked as 'failed' instead of being reclaimed.
+		"""
+		now = self._clock()
+		expires = now + self.lease_seconds
+		with self._transaction():
+			self._conn.execute(
+				"UPDATE units SET status = 'failed', lease_owner = NULL, lease_expires = NULL, "
+				"error = 'lease expired' "
+				"WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+				(now, self.max_attempts),
+			)
+			rows = self._conn.execute(
+				f'SELECT id, {", ".join(_UNIT_COLUMNS)} FROM units '
+				"WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+				'ORDER BY id LIMIT ?',
+				(now, limit),
+			).fetchall()
+			self._conn.executemany(
+				"UPDATE units SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+				'attempts = attempts + 1 WHERE id = ?',
+				[(owner, expires, row[0]) for row in rows],
+			)
+		return [Lease(row[0], _row_to_unit(row[1:]), owner, expires) for row in rows]
+
+	def heartbeat(self, lease: Lease) -> bool:
+		"""Extend a lease; returns False if the lease was lost to another worker."""
+		return self._update_lease(
+			lease, 'lease_expires = ?', (self._clock() + self.lease_seconds,)
+		)
+
+	def complete(self, lease: Lease, frame: pl.DataFrame) -> bool:
+		"""Store the unit's frame and mark it done; returns False if the lease was lost."""
+		buf = io.BytesIO()
+		frame.write_ipc(buf)
+		return self._update_lease(
+			lease,
+			"status = 'done', lease_owner = NULL, lease_expires = NULL, error = NULL, result = ?",
+			(buf.getvalue(),),
+		)
+
+	def fail(self, lease: Lease, error: BaseException) -> bool:
+		"""Release a lease after an error so the unit is retried (or parked once exhausted)."""
+		return self._update_lease(
+			lease,
+			"status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+			'lease_owner = NULL, lease_expires = NULL, error = ?',
+			(self.max_attempts, f'{type(error).__name__}: {error}'),
+		)
+
+	def counts(self) -> dict[str, int]:
+		"""Number of units per status ('pending', 'leased', 'done', 'failed')."""
+		with self._lock:
+			rows = self._conn.execute('SELECT status, COUNT(*) FROM units GROUP BY status')
+			return dict(rows.fetchall())
+
+	def results(self) -> pl.DataFrame:
+		"""Unify the frames of every completed unit."""
+		with self._lock:
+			rows = self._conn.execute(
+				"SELECT result FROM units WHERE status = 'done' AND result IS NOT NULL ORDER BY id"
+			).fetchall()
+		frames = [pl.read_ipc(io.BytesIO(blob)) for (blob,) in rows]
+		return unify_frames([df for df in frames if df.shape[0] > 0])
+
+	def _update_lease(self, lease: Lease, assignments: str, params: tuple) -> bool:
+		with self._transaction():
+			cur = self._conn.execute(
+				f"UPDATE units SET {assignments} WHERE id = ? AND status = 'leased' "
+				'AND lease_owner = ?',
+				(*params, lease.id, lease.owner),
+			)
+			return cur.rowcount == 1
+
+	@contextmanager
+	def _transaction(self) -> Iterator[None]:
+		# BEGIN IMMEDIATE takes the write lock up front so two workers can never
+		# select and lease the same unit.
+		with self._lock:
+			self._conn.execute('BEGIN IMMEDIATE')
+			try:
+				yield
+			except BaseException:
+				self._conn.execute('ROLLBACK')
+				raise
+			self._conn.execute('COMMIT')
+
+
+def _row_to_unit(values: tuple) -> WorkUnit:
+	fields = dict(zip(_UNIT_COLUMNS, values, strict=True))
+	fields['player'] = bool(fields['player'])
+	if fields['columns'] is not None:
+		fields['columns'] = tuple(fields['columns'].split(','))
+	return WorkUnit(**fields)
+
+
+def _scraper_for(site: str) -> BaseSiteScraper:
+	for scraper in SCRAPERS.values():
+		if scraper.site_name == site:
+			return scraper
+	raise KeyError(f'no scraper registered for {site!r}')
+
+
+async def enqueue_scrape(
+	queue: WorkQueue,
+	years: list[int] | None,
+	sites: list[SiteName] | SiteName,
+	*,
+	player: bool,
+	categories: list[str] | None = None,
+	weeks: list[int] | None = None,
+	season_types: list[str] | None = None,
+	columns: list[str] | None = None,
+) -> int:
+	"""Plan the units of a scrape and add them to `queue`; returns how many were added."""
+	if isinstance(sites, str):
+		sites = [sites]
+	async with httpx.AsyncClient() as client:
+		plans = await asyncio.gather(*(
+			SCRAPERS[site].plan_units(
+				client,
+				years,
+				player=player,
+				categories=categories,
+				weeks=weeks,
+				season_types=season_types,
+				columns=columns,
+			)
+			for site in sites
+			if site in SCRAPERS
+		))
+	return queue.enqueue(u for units in plans for u in units)
+
+
+async def run_worker(
+	queue: WorkQueue,
+	*,
+	owner: str | None = None,
+	concurrency: int = 10,
+	client: httpx.AsyncClient | None = None,
+) -> int:
+	"""Lease and process units until every unit is done or failed.
+
+	Each leased unit is heartbeated at a third of the lease duration while it
+	is being fetched. While other workers still hold leases this worker waits,
+	so it picks their units up if they die. Queue calls run in a thread so
+	waiting on the database lock never blocks the event loop. Returns the
+	number of units this worker completed.
+	"""
+	owner = owner or default_worker_id()
+	if client is None:
+		async with httpx.AsyncClient() as own_client:
+			return await run_worker(queue, owner=owner, concurrency=concurrency, client=own_client)
+
+	async def process(lease: Lease) -> bool:
+		async def keep_alive() -> None:
+			while True:
+				await asyncio.sleep(queue.lease_seconds / 3)
+				await asyncio.to_thread(queue.heartbeat, lease)
+
+		beat = asyncio.create_task(keep_alive())
+		try:
+			frame = await _scraper_for(lease.unit.site).fetch_unit(client, lease.unit)
+		except Exception as exc:  # noqa: BLE001
+			await asyncio.to_thread(queue.fail, lease, exc)
+			return False
+		finally:
+			beat.cancel()
+		return await asyncio.to_thread(queue.complete, lease, frame)
+
+	completed = 0
+	while True:
+		leases = await asyncio.to_thread(queue.lease, owner, limit=concurrency)
+		if not leases:
+			counts = await asyncio.to_thread(queue.counts)
+			if not counts.get('leased'):
+				return completed
+			# Other workers hold the remaining units; wait in case their leases lapse.
+			await asyncio.sleep(queue.lease_seconds / 3)
+			continue
+		results = await asyncio.gather(*(process(lease) for lease in leases))
+		completed += sum(results)
+
+
+__all__ = ['Lease', 'WorkQueue', 'default_worker_id', 'enqueue_scrape', 'run_worker']
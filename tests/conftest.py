@@ -0,0 +1,150 @@
+"""Offline fixtures: canned ESPN/NFL.com pages served through httpx.MockTransport."""
+
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+ESPN_PASSING_ROWS = [
+    ['1', 'Patrick Mahomes, QB', 'KC', 'W 27-20', '25', '35', '300', '3', '1', '1', '0', '110.2'],
+    ['2', 'Josh Allen, QB', 'BUF', 'L 17-24', '20', '30', '250', '2', '0', '2', '1', '101.5'],
+]
+ESPN_PASSING_HEADERS = [
+    'RK', 'PLAYER', 'TEAM', 'RESULT', 'COMP', 'ATT', 'YDS', 'TD', 'INT', 'SACK', 'FUM', 'RAT',
+]
+
+ESPN_DEFENSIVE_ROWS = [
+    ['1', 'Micah Parsons, LB', 'DAL', 'W 30-10', '5', '2', '7', '2', '1', '0', '0', '1', '3'],
+    ['2', 'Fred Warner, LB', 'SF', 'L 10-30', '9', '4', '13', '0', '0', '1', '1', '2', '0'],
+]
+ESPN_DEFENSIVE_HEADERS = [
+    'RK', 'PLAYER', 'TEAM', 'RESULT', 'SOLO', 'AST', 'TOT', 'SACK', 'FF', 'FR', 'INT', 'PD',
+    'STUFFS',
+]
+# ESPN stat names of the ``byathlete`` response, in the order of the page's columns
+ESPN_STAT_NAMES = {
+    'passing': [
+        'completions', 'passingAttempts', 'passingYards', 'passingTouchdowns',
+        'interceptions', 'sacks', 'fumbles', 'QBRating',
+    ],
+    'defensive': [
+        'soloTackles', 'assistTackles', 'totalTackles', 'sacks', 'fumblesForced',
+        'fumblesRecovered', 'interceptions', 'passesDefended', 'stuffs',
+    ],
+}
+
+
+# Default headers and rows of each category's canned leaders table
+ESPN_LEADERS = {
+    'passing': (ESPN_PASSING_HEADERS, ESPN_PASSING_ROWS),
+    'defensive': (ESPN_DEFENSIVE_HEADERS, ESPN_DEFENSIVE_ROWS),
+}
+
+
+def espn_page(rows=None, headers=None, title=None, category='passing') -> str:
+    """Render a minimal ESPN weekly leaders page (`category` picks the default table)."""
+    default_headers, default_rows = ESPN_LEADERS[category]
+    rows = default_rows if rows is None else rows
+    headers = headers or default_headers
+    title = title or f'Sortable {category.title()} Leaders'
+    head = ''.join(f'<td>{h}</td>' for h in headers)
+    body = ''.join('<tr>' + ''.join(f'<td>{c}</td>' for c in r) + '</tr>' for r in rows)
+    return (
+        '<html><body><div>ad banner</div>'
+        f'<table class="tablehead"><tr><td>{title}</td></tr><tr>{head}</tr>{body}</table>'
+        '</body></html>'
+    )
+
+
+def espn_payload(rows=None, category='passing') -> dict:
+    """Render an ESPN ``byathlete`` JSON response with the same leaders as `espn_page`."""
+    rows = ESPN_LEADERS[category][1] if rows is None else rows
+    names = ESPN_STAT_NAMES[category]
+    athletes = []
+    for _rank, player, team, _result, *stats in rows:
+        name, position = (part.strip() for part in player.split(','))
+        athletes.append({
+            'athlete': {
+                'displayName': name,
+                'teamShortName': team,
+                'position': {'abbreviation': position},
+            },
+            'categories': [{'name': category, 'values': [float(v) for v in stats]}],
+        })
+    return {'categories': [{'name': category, 'names': names}], 'athletes': athletes}
+
+
+def nfl_page(headers, rows, links=()) -> str:
+    """Render a minimal NFL.com stats page with optional anchor links."""
+    head = ''.join(f'<th>{h}</th>' for h in headers)
+    body = ''.join('<tr>' + ''.join(f'<td>{c}</td>' for c in r) + '</tr>' for r in rows)
+    anchors = ''.join(f'<a href="{href}">{text}</a>' for text, href in links)
+    return f'<html><body>{anchors}<table><tr>{head}</tr>{body}</table></body></html>'
+
+
+def nfl_site_handler(request: httpx.Request) -> httpx.Response:
+    """Serve a canned NFL.com: root, the 2024 year page and its passing/rushing tables."""
+    pages = {
+        '/stats/player-stats/': (
+            '<html><select><option value="/stats/player-stats/2024">2024</option>'
+            '<option value="/stats/player-stats/2023">2023</option></select>'
+            '<a href="/stats/player-stats/category/passing/2024/reg/all">Passing</a>'
+            '<a href="/stats/player-stats/category/rushing/2024/reg/all">Rushing</a></html>'
+        ),
+        '/stats/player-stats/2024': (
+            '<html><a href="/stats/player-stats/category/passing/2024/reg/all">Passing</a>'
+            '<a href="/stats/player-stats/category/rushing/2024/reg/all">Rushing</a></html>'
+        ),
+        '/stats/player-stats/category/passing/2024/reg/all': nfl_page(
+            ['Player', 'Pass Yds', 'TD'], [['Joe Burrow', '4918', '43']]
+        ),
+        '/stats/player-stats/category/rushing/2024/reg/all': nfl_page(
+            ['Player', 'Rush Yds', 'TD'], [['Saquon Barkley', '2005', '13']]
+        ),
+    }
+    page = pages.get(request.url.path)
+    return httpx.Response(200, text=page) if page else httpx.Response(404)
+
+
+@pytest.fixture
+def espn_html() -> Callable[..., str]:
+    return espn_page
+
+
+@pytest.fixture
+def espn_json() -> Callable[..., dict]:
+    return espn_payload
+
+
+@pytest.fixture
+def espn_passing_rows() -> list[list[str]]:
+    return [list(row) for row in ESPN_PASSING_ROWS]
+
+
+@pytest.fixture
+def nfl_html() -> Callable[..., str]:
+    return nfl_page
+
+
+@pytest.fixture
+def nfl_site() -> Callable[[httpx.Request], httpx.Response]:
+    """Handler for `mock_client` serving the canned NFL.com pages."""
+    return nfl_site_handler
+
+
+@pytest.fixture
+def mock_client() -> Callable[..., httpx.AsyncClient]:
+    """Build an AsyncClient answering from a handler; every requested URL is recorded."""
+
+    def build(handler: Callable[[httpx.Request], httpx.Response]) -> httpx.AsyncClient:
+        requested: list[str] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            return handler(request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+        client.requested = requested
+        return client
+
+    return build
@@ -0,0 +1,80 @@
+import polars as pl
+
+from nfl_webscraper.store import Dataset
+
+
+def _week(week, yards, category='passing'):
+    return pl.DataFrame({
+        'player': ['Patrick Mahomes', 'Travis Kelce', 'Josh Allen'],
+        'position': ['QB', 'TE', 'QB'],
+        'team': ['KC', 'KC', 'BUF'],
+        'yards': yards,
+        'touchdowns': [2, 1, 1],
+        'longest': [40, 25, 30 + week],
+        'year': [2024] * 3,
+        'week': [week] * 3,
+        'season_type': ['regular'] * 3,
+        'category': [category] * 3,
+        'source': ['ESPN.com'] * 3,
+    })
+
+
+def test_upsert_materializes_season_and_team_views(tmp_path):
+    """Player-season, team-week and team-season totals are stored next to the data."""
+    ds = Dataset(tmp_path)
+    ds.upsert(pl.concat([_week(1, [300, 80, 250]), _week(2, [200, 60, 280])]))
+    assert sorted(ds.aggregates.names()) == ['player_season', 'team_season', 'team_week']
+
+    season = ds.aggregates.read('player_season')
+    mahomes = season.filter(pl.col('player') == 'Patrick Mahomes').row(0, named=True)
+    assert (mahomes['yards'], mahomes['touchdowns'], mahomes['games']) == (500, 4, 2)
+    allen = season.filter(pl.col('player') == 'Josh Allen').row(0, named=True)
+    assert allen['longest'] == 32 and allen['position'] == 'QB'
+
+    team_week = ds.aggregates.read('team_week').filter(pl.col('team') == 'KC')
+    assert team_week['yards'].to_list() == [380, 260]
+    team_season = ds.aggregates.scan('team_season').filter(pl.col('team') == 'KC').collect()
+    assert team_season['yards'].to_list() == [640]
+    assert team_season['games'].to_list() == [2]
+
+
+def test_new_week_only_reaggregates_touched_partitions(tmp_path):
+    """Adding a receiving week updates its rows and leaves other partitions' rows in place."""
+    ds = Dataset(tmp_path)
+    ds.upsert(pl.concat([_week(1, [300, 80, 250]), _week(1, [5, 90, 0], 'receiving')]))
+    before = ds.aggregates.read('player_season').filter(pl.col('category') == 'passing')
+
+    ds.upsert(_week(2, [0, 110, 0], 'receiving'))
+    season = ds.aggregates.read('player_season')
+    assert season.filter(pl.col('category') == 'passing').equals(before)
+    kelce = season.filter((pl.col('category') == 'receiving') & (pl.col('player') == 'Travis Kelce'))
+    assert kelce['yards'].to_list() == [200]
+    assert kelce['games'].to_list() == [2]
+
+    # Rebuilding from scratch gives the same result as the incremental refresh
+    incremental = ds.aggregates.read('team_season')
+    ds.aggregates.refresh()
+    assert ds.aggregates.read('team_season').equals(incremental)
+
+
+def test_defensive_counts_and_same_named_players_stay_apart(tmp_path):
+    """Defensive counting stats are summed, per team when two players share a name."""
+    week = pl.DataFrame({
+        'player': ['Josh Allen', 'Josh Allen'],
+        'team': ['BUF', 'JAX'],
+        'tot': [None, 7],
+        'sacks': [None, 1.5],
+        'year': [2024] * 2,
+        'week': [1] * 2,
+        'season_type': ['regular'] * 2,
+        'category': ['defensive'] * 2,
+        'source': ['ESPN.com'] * 2,
+    })
+    ds = Dataset(tmp_path)
+    ds.upsert(pl.concat([week, week.with_columns(pl.col('week') + 1)]))
+    season = ds.aggregates.read('player_season').sort('team')
+    assert season['team'].to_list() == ['BUF', 'JAX']
+    assert season['tot'].to_list() == [0, 14]
+    assert season['sacks'].to_list() == [0.0, 3.0]
+    team_season = ds.aggregates.read('team_season').sort('team')
+    assert team_season['tot'].to_list() == [0, 14]
@@ -0,0 +1,39 @@
+import asyncio
+
+import httpx
+
+from nfl_webscraper.checkpoint import Checkpoint
+from nfl_webscraper.sites import ESPNScraper
+
+
+def test_rerun_fetches_only_missing_units(tmp_path, mock_client, espn_html):
+    """A resumed scrape skips journaled units and keeps their rows."""
+    failing = {'/week/2/'}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if any(part in str(request.url) for part in failing):
+            return httpx.Response(500)
+        return httpx.Response(200, text=espn_html())
+
+    scraper = ESPNScraper()
+    first = mock_client(handler)
+    df = asyncio.run(scraper.get_player_stats(
+        first, [2024], categories=['passing'], checkpoint=Checkpoint(tmp_path)
+    ))
+    # 23 weeks; the regular and postseason week-2 pages fail
+    assert df.shape[0] == 2 * (23 - 2)
+
+    failing.clear()
+    second = mock_client(handler)
+    df = asyncio.run(scraper.get_player_stats(
+        second, [2024], categories=['passing'], checkpoint=Checkpoint(tmp_path)
+    ))
+    assert df.shape[0] == 2 * 23
+    assert sorted(u.split('/week/')[1][:1] for u in second.requested) == ['2', '2']
+    assert len(Checkpoint(tmp_path)) == 23
+
+
+def test_torn_journal_line_is_ignored(tmp_path):
+    """A partially written final journal line does not break resuming."""
+    (tmp_path / 'journal.jsonl').write_text('{"key": "a", "file": null, "rows": 0}\n{"key": ')
+    assert len(Checkpoint(tmp_path)) == 1
@@ -0,0 +1,71 @@
+import asyncio
+
+import httpx
+
+from nfl_webscraper import cli
+from nfl_webscraper.cli import build_shards, parse_years, split_shards
+
+
+def test_parse_years_expands_ranges():
+    """Year arguments accept single years, ranges and comma lists."""
+    assert parse_years(['2021']) == [2021]
+    assert parse_years(['2019-2021', '2023']) == [2019, 2020, 2021, 2023]
+    assert parse_years(['2024,2022']) == [2022, 2024]
+
+
+def test_build_shards_respects_site_categories():
+    """Shards only contain categories the site offers."""
+    shards = build_shards(['nfl.com', 'espn.com'], [2024], ['passing', 'punting'], player=True)
+    assert ('nfl.com', 2024, 'passing') in shards
+    assert ('nfl.com', 2024, 'punting') in shards
+    assert ('espn.com', 2024, 'passing') in shards
+    assert ('espn.com', 2024, 'punting') not in shards
+    # ESPN team stats are derived from the same weekly leaders categories
+    teams = build_shards(['espn.com'], None, None, player=False)
+    assert teams == build_shards(['espn.com'], None, None, player=True)
+
+
+def test_split_shards_round_robin():
+    """Shards are spread evenly and never produce empty groups."""
+    shards = build_shards(['espn.com'], [2022, 2023], None, player=True)
+    groups = split_shards(shards, 3)
+    assert len(groups) == 3
+    assert sorted(s for g in groups for s in g) == sorted(shards)
+    assert max(len(g) for g in groups) - min(len(g) for g in groups) <= 1
+    assert len(split_shards(shards[:2], 8)) == 2
+
+
+def test_years_are_discovered_once_for_all_shards(mock_client, monkeypatch):
+    """Without --years the parent discovers each site's seasons; shards carry them."""
+    root = (
+        '<html><select><option value="/stats/player-stats/2024">2024</option>'
+        '<option value="/stats/player-stats/2023">2023</option></select></html>'
+    )
+    client = mock_client(lambda request: httpx.Response(200, text=root))
+    monkeypatch.setattr(cli.httpx, 'AsyncClient', lambda: client)
+    years = asyncio.run(cli.discover_years(['nfl.com'], player=True))
+    assert years == {'nfl.com': [2023, 2024]}
+    assert len(client.requested) == 1
+    shards = build_shards(['nfl.com'], years, ['passing'], player=True)
+    assert shards == [('nfl.com', 2023, 'passing'), ('nfl.com', 2024, 'passing')]
+
+
+def test_shards_of_a_site_share_one_concurrency_limit(mock_client, espn_html, monkeypatch):
+    """--concurrency caps a site's requests across all shards of a worker, not per shard."""
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, text=espn_html())
+
+    client = mock_client(handler)
+    monkeypatch.setattr(cli.httpx, 'AsyncClient', lambda: client)
+    shards = [('espn.com', 2024, 'passing'), ('espn.com', 2024, 'rushing')]
+    options = {'player': True, 'concurrency': 1, 'weeks': [1, 2], 'season_types': ['regular']}
+    cli.run_shard_group(shards, options)
+    assert len(client.requested) == 4
+    assert peak == 1
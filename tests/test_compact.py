@@ -0,0 +1,74 @@
+import polars as pl
+
+from nfl_webscraper.compact import compact, compact_schema, memory_report
+from nfl_webscraper.store import Dataset
+
+
+def _weeks(yards, rating):
+    return pl.DataFrame({
+        'player': ['Patrick Mahomes', 'Josh Allen'],
+        'yards': yards,
+        'touchdowns': [3, 2],
+        'rating': rating,
+        'year': [2024, 2024],
+        'week': [1, 1],
+        'season_type': ['regular', 'regular'],
+        'category': ['passing', 'passing'],
+        'source': ['ESPN.com', 'ESPN.com'],
+    })
+
+
+def test_compact_picks_smallest_types_for_observed_ranges():
+    """Counts shrink to Int8/Int16, floats to Float32; numeric text is opt-in."""
+    df = pl.DataFrame({
+        'touchdowns': [3, 2],
+        'yards': [300, -5],
+        'rating': [110.2, 98.5],
+        'Pass Yds': ['4,183', '--'],
+        'Player': ['Joe Burrow', 'Backup QB'],
+    })
+    assert compact_schema(df) == {
+        'touchdowns': pl.Int8, 'yards': pl.Int16, 'rating': pl.Float32,
+    }
+    out = compact(df, numeric_strings=True)
+    assert out.schema['Pass Yds'] == pl.Int16
+    assert out['Pass Yds'].to_list() == [4183, None]
+    assert out.schema['Player'] == pl.Utf8
+
+
+def test_floats_stay_float64_when_float32_would_lose_them():
+    """Float32 is only chosen when every value keeps its range and four decimals."""
+    df = pl.DataFrame({
+        'rating': [110.2, 98.5],
+        'huge': [1e39, 1.0],
+        'precise': [16_777_217.5, 1.0],
+        'Avg': ['4.5', '123456.789'],
+    })
+    assert compact_schema(df, numeric_strings=True) == {
+        'rating': pl.Float32, 'Avg': pl.Float64,
+    }
+
+
+def test_memory_report_shows_bytes_before_and_after():
+    """Per-column sizes plus a total row; compaction never grows a column."""
+    df = pl.DataFrame({'touchdowns': list(range(100)), 'rating': [1.5] * 100})
+    report = memory_report(df)
+    assert report['column'].to_list() == ['touchdowns', 'rating', '(total)']
+    assert report['compact_dtype'].to_list()[:2] == ['Int8', 'Float32']
+    total = report.row(2, named=True)
+    assert total['bytes'] == 1600 and total['compact_bytes'] == 500
+
+
+def test_compacting_upserts_record_types_that_only_widen(tmp_path):
+    """The stored dataset records chosen types; a later wider value widens them."""
+    ds = Dataset(tmp_path)
+    ds.upsert(_weeks([100, 120], [99.0, 101.5]), compact=True)
+    assert ds.recorded_dtypes() == {
+        'rating': pl.Float32, 'touchdowns': pl.Int8, 'yards': pl.Int8,
+    }
+    ds.upsert(_weeks([100, 400], [99.0, 101.5]).with_columns(week=pl.lit(2)), compact=True)
+    assert ds.recorded_dtypes()['yards'] == pl.Int16
+
+    stored = ds.scan().collect()
+    assert stored.schema['yards'] == pl.Int16
+    assert sorted(stored['yards'].to_list()) == [100, 100, 120, 400]
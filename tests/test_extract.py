@@ -0,0 +1,62 @@
+import asyncio
+
+import httpx
+
+from nfl_webscraper.extract import extract_page, fetch_page, page_cache
+from nfl_webscraper.sites import NFLComScraper
+
+ROOT = 'https://www.nfl.com/stats/player-stats/'
+PASSING = '/stats/player-stats/category/passing/2024/reg/all'
+
+
+def test_extract_page_collects_everything_in_one_pass(nfl_html):
+    """Table, pagination, season options and category links come from one extraction."""
+    html = (
+        '<select><option value="/stats/player-stats/2024">2024</option><option>All</option></select>'
+        + nfl_html(
+            ['Player', 'Pass Yds'],
+            [['Joe Burrow', '4,918']],
+            [('Passing', PASSING), ('2', PASSING + '?page=2'), ('Next Page', PASSING + '?page=2')],
+        )
+    )
+    page = extract_page(html, ROOT, columns=('Player',))
+    assert page.table.columns == ['Player']
+    assert page.page_links == ['https://www.nfl.com' + PASSING + '?page=2']
+    assert page.season_options == {'2024': 'https://www.nfl.com/stats/player-stats/2024'}
+    assert page.category_links['passing'] == 'https://www.nfl.com' + PASSING
+
+
+def test_pages_are_fetched_once_per_scrape(mock_client, nfl_html):
+    """Within a page_cache block pages are reused; outside one they are fetched afresh."""
+    root = (
+        '<select><option value="/stats/player-stats/2024">2024</option></select>'
+        f'<a href="{PASSING}">Passing</a>'
+    )
+    pages = {
+        '/stats/player-stats/': root,
+        '/stats/player-stats/2024': f'<a href="{PASSING}">Passing</a>',
+        PASSING: nfl_html(['Player', 'Pass Yds'], [['Joe Burrow', '4918']]),
+    }
+    client = mock_client(lambda request: httpx.Response(200, text=pages[request.url.path]))
+    scraper = NFLComScraper()
+
+    async def run():
+        with page_cache():
+            for categories in (['passing'], ['passing']):
+                await scraper.plan_units(client, [2024], player=True, categories=categories)
+            full = await fetch_page(client, 'https://www.nfl.com' + PASSING)
+            projected = await fetch_page(
+                client, 'https://www.nfl.com' + PASSING, columns=('Pass Yds',)
+            )
+        return full, projected
+
+    full, projected = asyncio.run(run())
+    assert len(client.requested) == 3
+    assert full.table.columns == ['Player', 'Pass Yds']
+    assert projected.table.columns == ['Pass Yds']
+
+    # The next scrape on the same client sees the page as it is now
+    pages[PASSING] = nfl_html(['Player', 'Pass Yds'], [['Joe Burrow', '4920']])
+    fresh = asyncio.run(fetch_page(client, 'https://www.nfl.com' + PASSING))
+    assert len(client.requested) == 4
+    assert fresh.table['Pass Yds'].to_list() == ['4920']
@@ -0,0 +1,109 @@
+import asyncio
+
+import httpx
+
+from nfl_webscraper import api
+from nfl_webscraper.failures import FailureManifest
+from nfl_webscraper.sites import ESPNScraper, NFLComScraper
+
+
+def test_failed_units_are_listed_and_retried(tmp_path, mock_client, espn_html, monkeypatch):
+    """A failed week lands in the manifest; retry_failed fetches only that week."""
+    broken = {'week/2/'}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if any(part in str(request.url) for part in broken):
+            return httpx.Response(404)
+        return httpx.Response(200, text=espn_html())
+
+    client = mock_client(handler)
+    manifest = FailureManifest()
+    df = asyncio.run(ESPNScraper().get_player_stats(
+        client, [2024], categories=['passing'], weeks=[1, 2], season_types=['regular'],
+        failures=manifest,
+    ))
+    assert df['week'].to_list() == [1, 1]
+    failed = manifest.frame
+    assert failed.select('site', 'year', 'category', 'week', 'error').rows() == [
+        ('ESPN.com', 2024, 'passing', 2, 'RuntimeError')
+    ]
+    assert failed['url'][0].endswith('/week/2/seasontype/2/type/passing/year/2024')
+
+    # The manifest survives a round trip; the retry re-fetches one page only
+    manifest.save(tmp_path / 'failed.jsonl')
+    loaded = FailureManifest.load(tmp_path / 'failed.jsonl')
+    broken.clear()
+    retry_client = mock_client(handler)
+    monkeypatch.setattr(api.httpx, 'AsyncClient', lambda: retry_client)
+    merged, remaining = api.retry_failed(loaded, df)
+    assert retry_client.requested == [failed['url'][0]]
+    assert not remaining
+    assert sorted(merged['week'].to_list()) == [1, 1, 2, 2]
+
+
+def test_retry_keeps_the_strategy_and_empty_pages_stay_failed(
+    mock_client, espn_html, espn_json, monkeypatch
+):
+    """JSON-strategy failures are re-fetched as JSON; a page parsing to no rows is not recovered."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    manifest = FailureManifest()
+    scraper = ESPNScraper(strategy='json', json_url='http://stand-in.test/byathlete')
+    asyncio.run(scraper.get_player_stats(
+        mock_client(handler), [2024], categories=['passing'], weeks=[1, 2],
+        season_types=['regular'], failures=manifest,
+    ))
+    assert [f.strategy for f in manifest] == ['json', 'json']
+
+    def recovered(request: httpx.Request) -> httpx.Response:
+        if 'week=2' in str(request.url):
+            return httpx.Response(200, json={'categories': [], 'athletes': []})
+        return httpx.Response(200, json=espn_json())
+
+    retry_client = mock_client(recovered)
+    monkeypatch.setattr(api.httpx, 'AsyncClient', lambda: retry_client)
+    merged, remaining = api.retry_failed(manifest)
+    assert merged['week'].to_list() == [1, 1]
+    assert [(f.week, f.error) for f in remaining] == [(2, 'EmptyUnitError')]
+
+
+def test_nfl_discovery_failures_are_recorded_and_replanned(mock_client, nfl_html, monkeypatch):
+    """A year page that fails is recorded per category; the other years still scrape."""
+    pages = {
+        '/stats/player-stats/': (
+            '<html><select><option value="/stats/player-stats/2024">2024</option>'
+            '<option value="/stats/player-stats/2023">2023</option></select></html>'
+        ),
+        '/stats/player-stats/2024': (
+            '<html><a href="/stats/player-stats/category/passing/2024/reg/all">Passing</a></html>'
+        ),
+        '/stats/player-stats/category/passing/2024/reg/all': nfl_html(
+            ['Player', 'Pass Yds'], [['Joe Burrow', '4918']]
+        ),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = pages.get(request.url.path)
+        return httpx.Response(200, text=page) if page else httpx.Response(404)
+
+    manifest = FailureManifest()
+    df = asyncio.run(NFLComScraper().get_player_stats(
+        mock_client(handler), [2023, 2024], categories=['passing'], failures=manifest
+    ))
+    assert df['year'].to_list() == [2024]
+    assert manifest.frame.select('year', 'category', 'stage').rows() == [
+        (2023, 'passing', 'discovery')
+    ]
+
+    pages['/stats/player-stats/2023'] = (
+        '<html><a href="/stats/player-stats/category/passing/2023/reg/all">Passing</a></html>'
+    )
+    pages['/stats/player-stats/category/passing/2023/reg/all'] = nfl_html(
+        ['Player', 'Pass Yds'], [['Jared Goff', '4575']]
+    )
+    retry_client = mock_client(handler)
+    monkeypatch.setattr(api.httpx, 'AsyncClient', lambda: retry_client)
+    merged, remaining = api.retry_failed(manifest, df)
+    assert not remaining
+    assert sorted(merged['year'].to_list()) == [2023, 2024]
@@ -0,0 +1,48 @@
+import asyncio
+
+import httpx
+
+from nfl_webscraper.fingerprint import FingerprintIndex, fingerprint
+from nfl_webscraper.sites import ESPNScraper
+
+
+def test_fingerprint_ignores_markup_outside_tables(espn_html):
+    """Ads and whitespace outside the table region do not change the hash."""
+    page = espn_html()
+    assert fingerprint(page) == fingerprint(page.replace('ad banner', 'other ad'))
+    assert fingerprint(page) == fingerprint(page.replace('<tr>', '\n  <tr>'))
+    assert fingerprint(page) != fingerprint(page.replace('300', '301'))
+
+
+def test_unchanged_pages_skip_parsing(tmp_path, mock_client, espn_html, monkeypatch):
+    """A rerun only parses pages whose table changed."""
+    parsed = []
+    scraper = ESPNScraper(fingerprints=FingerprintIndex(tmp_path))
+    original = scraper._parse_stats_table
+    monkeypatch.setattr(
+        scraper, '_parse_stats_table', lambda *args: parsed.append(1) or original(*args)
+    )
+
+    def run(handler):
+        return asyncio.run(scraper.get_player_stats(
+            mock_client(handler), [2024], categories=['passing']
+        ))
+
+    first = run(lambda request: httpx.Response(200, text=espn_html()))
+    assert len(parsed) == 23
+
+    parsed.clear()
+    scraper.fingerprints = FingerprintIndex(tmp_path)  # fresh process, same directory
+
+    def week3_changed(request: httpx.Request) -> httpx.Response:
+        page = espn_html()
+        if '/week/3/seasontype/2/' in str(request.url):
+            page = page.replace('300', '333')
+        return httpx.Response(200, text=page.replace('ad banner', 'new ad'))
+
+    second = run(week3_changed)
+    assert len(parsed) == 1
+    assert scraper.fingerprints.hits == 22
+    assert first.shape == second.shape
+    changed = second.filter((second['week'] == 3) & (second['season_type'] == 'regular'))
+    assert changed['yards'].to_list() == [333, 250]
@@ -0,0 +1,38 @@
+import asyncio
+
+import httpx
+
+from nfl_webscraper.http import fetch_html, fetch_text, saved_requests
+
+URL = 'https://www.nfl.com/stats/player-stats/'
+
+
+def test_concurrent_identical_fetches_share_one_request(mock_client):
+    """Four concurrent callers share one request (three saved); a later call fetches again."""
+    client = mock_client(lambda request: httpx.Response(200, text='<p>root</p>'))
+
+    async def run():
+        texts = await asyncio.gather(*(fetch_text(client, URL) for _ in range(4)))
+        soup = await fetch_html(client, URL)  # sequential: a fresh request
+        return texts, soup
+
+    texts, soup = asyncio.run(run())
+    assert texts == ['<p>root</p>'] * 4
+    assert soup.p.get_text() == 'root'
+    assert client.requested == [URL, URL]
+    assert saved_requests(client) == 3
+
+
+def test_cancelled_caller_does_not_cancel_shared_request(mock_client):
+    """Cancelling the first caller leaves the coalesced request running for the rest."""
+    client = mock_client(lambda request: httpx.Response(200, text='ok'))
+
+    async def run():
+        first = asyncio.ensure_future(fetch_text(client, URL))
+        second = asyncio.ensure_future(fetch_text(client, URL))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == 'ok'
+    assert len(client.requested) == 1
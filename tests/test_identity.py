@@ -0,0 +1,82 @@
+import polars as pl
+
+from nfl_webscraper.identity import PlayerIndex, attach_player_ids, normalize_name
+
+
+def _espn():
+    return pl.DataFrame({
+        'player': ['Patrick Mahomes', 'Josh Allen', 'Josh Allen', 'Kenneth Walker III'],
+        'position': ['QB', 'QB', 'LB', 'RB'],
+        'team': ['KC', 'BUF', 'JAC', 'SEA'],
+    })
+
+
+def test_normalize_name_drops_accents_punctuation_and_suffixes():
+    """Spelling differences between sites collapse onto one key."""
+    names = pl.Series(['Patrick Mahomes II', "Ja'Marr Chase", 'Zoë  Müller Jr.', 'A.J. Brown'])
+    assert pl.select(normalize_name(pl.lit(names))).to_series().to_list() == [
+        'patrick mahomes', 'jamarr chase', 'zoe muller', 'aj brown',
+    ]
+
+
+def test_same_player_gets_same_id_across_sites():
+    """NFL.com rows resolve to ids minted from ESPN rows; same-named players stay apart."""
+    index = PlayerIndex()
+    espn = index.attach(_espn())
+    assert espn['player_id'].to_list() == [1, 2, 3, 4]
+
+    nfl = index.attach(pl.DataFrame({'Player': ['Patrick Mahomes', 'Kenneth Walker', 'Josh Allen']}))
+    # Without a position the two Josh Allens cannot be told apart
+    assert nfl['player_id'].to_list() == [1, 4, None]
+    assert index.table.filter(pl.col('player_id') == 3)['team'].to_list() == ['JAX']
+
+
+def test_new_players_are_minted_and_saved(tmp_path):
+    """Unknown players get the next id; the index round-trips through disk."""
+    path = tmp_path / 'players.parquet'
+    attach_player_ids(_espn(), path)
+    nfl = attach_player_ids(pl.DataFrame({'Player': ["Ja'Marr Chase", 'Patrick Mahomes']}), path)
+    assert nfl['player_id'].to_list() == [5, 1]
+
+    # ESPN later reports the position, which is learned instead of minting again
+    espn = attach_player_ids(
+        pl.DataFrame({'player': ['JaMarr Chase'], 'position': ['WR'], 'team': ['CIN']}), path
+    )
+    assert espn['player_id'].to_list() == [5]
+    index = PlayerIndex(path)
+    assert len(index) == 5
+    assert index.table.filter(pl.col('player_id') == 5)['position'].to_list() == ['WR']
+
+
+def test_team_tells_same_named_players_apart():
+    """NFL.com rows with a Team column resolve same-named players by their team."""
+    index = PlayerIndex()
+    index.attach(_espn())
+    nfl = index.attach(pl.DataFrame({
+        'Player': ['Josh Allen', 'Josh Allen'], 'Team': ['BUF', 'JAX'], 'year': [2024, 2024],
+    }))
+    assert nfl['player_id'].to_list() == [2, 3]
+    assert len(index) == 4
+
+
+def test_same_named_players_first_seen_without_position_get_two_ids():
+    """Two teams for one name in one season are two players; positions are learned later."""
+    index = PlayerIndex()
+    nfl = index.attach(pl.DataFrame({
+        'Player': ['Josh Allen', 'Josh Allen', 'Josh Allen'],
+        'Team': ['BUF', 'JAX', 'BUF'],
+        'year': [2024, 2024, 2023],
+    }))
+    assert nfl['player_id'].to_list() == [1, 2, 1]
+    espn = index.attach(pl.DataFrame({
+        'player': ['Josh Allen', 'Josh Allen'], 'position': ['LB', 'QB'], 'team': ['JAC', 'BUF'],
+    }))
+    assert espn['player_id'].to_list() == [2, 1]
+    assert index.table.sort('player_id')['position'].to_list() == ['QB', 'LB']
+
+    # A traded player: one name on two teams in different seasons stays one player
+    traded = index.attach(pl.DataFrame({
+        'Player': ['Amari Cooper', 'Amari Cooper'], 'Team': ['CLE', 'BUF'], 'year': [2023, 2024],
+    }))
+    assert traded['player_id'].to_list() == [3, 3]
+    assert index.table.filter(pl.col('player_id') == 3)['team'].to_list() == ['BUF']
@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import httpx
+
+from nfl_webscraper.failures import FailureManifest
+from nfl_webscraper.http import fetch_text
+from nfl_webscraper.latency import Deadline, HostLatency, hedging
+from nfl_webscraper.sites import ESPNScraper
+
+URL = 'https://www.espn.com/nfl/weekly/leaders/_/week/1/seasontype/2/type/passing/year/2024'
+
+
+def test_deadline_returns_partial_results(mock_client, espn_html):
+    """A week still loading at the deadline is cancelled and listed; the rest is returned."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if 'week/2/' in str(request.url):
+            await asyncio.sleep(30)
+        return httpx.Response(200, text=espn_html())
+
+    client = mock_client(handler)
+    manifest = FailureManifest()
+
+    async def run():
+        return await ESPNScraper().get_player_stats(
+            client, [2024], categories=['passing'], weeks=[1, 2], season_types=['regular'],
+            failures=manifest, deadline=Deadline(0.5),
+        )
+
+    started = time.monotonic()
+    df = asyncio.run(run())
+    assert time.monotonic() - started < 5
+    assert df['week'].to_list() == [1, 1]
+    assert manifest.frame.select('week', 'error').rows() == [(2, 'DeadlineExceededError')]
+
+
+def test_slow_request_is_hedged(mock_client):
+    """Past the host's p95 a duplicate is sent and the faster answer wins."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        if len(calls) == 1:
+            await asyncio.sleep(30)
+        return httpx.Response(200, text='ok')
+
+    client = mock_client(handler)
+    tracker = HostLatency()
+    for _ in range(20):
+        tracker.observe('www.espn.com', 0.05)
+    assert tracker.hedge_delay('www.espn.com') == 0.05
+    assert tracker.hedge_delay('www.nfl.com') is None
+
+    async def run():
+        with hedging(tracker):
+            return await fetch_text(client, URL)
+
+    started = time.monotonic()
+    assert asyncio.run(run()) == 'ok'
+    assert time.monotonic() - started < 5
+    assert len(client.requested) == 2
+    assert (tracker.hedged, tracker.hedge_wins) == (1, 1)
@@ -0,0 +1,27 @@
+import asyncio
+
+import httpx
+
+from nfl_webscraper.pagination import fetch_all_stats_parallel
+
+BASE = 'https://www.nfl.com/stats/player-stats/category/passing/2024/reg/all'
+
+
+def test_all_pages_are_concatenated(mock_client, nfl_html):
+    """Every linked page is fetched once and columns are aligned across pages."""
+    links = [('1', BASE), ('2', BASE + '?page=2'), ('3', BASE + '?page=3'), ('Next', BASE + '?page=2')]
+    pages = {
+        '': nfl_html(['Player', 'Pass Yds'], [['A', '1'], ['B', '2']], links),
+        'page=2': nfl_html(['Player', 'Pass Yds'], [['C', '3']], links),
+        'page=3': nfl_html(['Player', 'Pass Yds', 'TD'], [['D', '4', '1']], links),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=pages[request.url.query.decode()])
+
+    client = mock_client(handler)
+    df = asyncio.run(fetch_all_stats_parallel(client, BASE))
+    assert df['Player'].to_list() == ['A', 'B', 'C', 'D']
+    assert df.columns == ['Player', 'Pass Yds', 'TD']
+    assert df['TD'].to_list() == [None, None, None, '1']
+    assert len(client.requested) == 3
@@ -0,0 +1,54 @@
+import asyncio
+
+import httpx
+import polars as pl
+import pytest
+
+from nfl_webscraper import planner
+from nfl_webscraper.checkpoint import Checkpoint
+from nfl_webscraper.fingerprint import FingerprintIndex
+from nfl_webscraper.latency import HostLatency
+from nfl_webscraper.sites import ESPNScraper
+
+
+def test_espn_plan_costs_no_requests(tmp_path, mock_client, monkeypatch):
+    """ESPN units are counted one request each; checkpointed units cost nothing."""
+    client = mock_client(lambda request: httpx.Response(500))
+    monkeypatch.setattr(planner.httpx, 'AsyncClient', lambda: client)
+    units = asyncio.run(ESPNScraper().plan_units(
+        client, [2024], player=True, categories=['passing'], weeks=[1], season_types=['regular']
+    ))
+    Checkpoint(tmp_path / 'ckpt').record(units[0], pl.DataFrame([]))
+    latency = HostLatency()
+    latency.observe('www.espn.com', 2.0)
+
+    result = planner.plan(
+        [2024], sites='espn.com', categories=['passing', 'rushing'], weeks=[1],
+        season_types=['regular'], checkpoint=tmp_path / 'ckpt', latency=latency,
+        concurrency=1, rate_limits={'www.espn.com': 10},
+    )
+    assert client.requested == []
+    assert result.discovery_requests == 0
+    assert result.units.select('category', 'requests', 'checkpointed').rows() == [
+        ('passing', 0, True), ('rushing', 1, False)
+    ]
+    assert result.requests == 1
+    assert result.seconds == pytest.approx(2.0)
+    assert result.summary.row(0) == ('ESPN.com', 2, 1, 1, 2.0)
+
+
+def test_nfl_plan_counts_discovery_and_known_pages(tmp_path, mock_client, nfl_site, monkeypatch):
+    """NFL.com discovery requests are counted; stored pagination links give page counts."""
+    client = mock_client(nfl_site)
+    monkeypatch.setattr(planner.httpx, 'AsyncClient', lambda: client)
+    passing = 'https://www.nfl.com/stats/player-stats/category/passing/2024/reg/all'
+    index = FingerprintIndex(tmp_path / 'fp')
+    index.store(passing, 'digest', pl.DataFrame([]), [passing, passing + '?page=2',
+                                                     passing + '?page=3'])
+
+    result = planner.plan([2024], fingerprints=tmp_path / 'fp')
+    assert result.discovery_requests == len(client.requested) == 2
+    assert sorted(result.units.select('category', 'requests', 'known').rows()) == [
+        ('passing', 3, True), ('rushing', 3, False)
+    ]
+    assert result.requests == 6
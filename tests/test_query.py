@@ -0,0 +1,47 @@
+import polars as pl
+
+from nfl_webscraper.query import query
+from nfl_webscraper.store import Dataset
+
+
+def _season(year):
+    return pl.DataFrame({
+        'player': ['Patrick Mahomes', 'Josh Allen'],
+        'team': ['KC', 'BUF'],
+        'yards': [300, 250],
+        'year': [year, year],
+        'week': [1, 1],
+        'season_type': ['regular', 'regular'],
+        'category': ['passing', 'passing'],
+        'source': ['ESPN.com', 'ESPN.com'],
+    })
+
+
+def test_query_filters_are_pushed_into_the_scan(tmp_path):
+    """Year/team predicates and the projection reach the Parquet scan."""
+    ds = Dataset(tmp_path)
+    for year in (2022, 2023, 2024):
+        ds.upsert(_season(year))
+
+    sql = "SELECT player, yards FROM stats WHERE year = 2024 AND team = 'KC'"
+    plan = query(sql, tmp_path, lazy=True)
+    scan = plan.explain().split('SCAN', 1)[1]
+    assert 'SELECTION' in scan and '"team"' in scan
+
+    # Other seasons' partitions are pruned, so damaging one does not matter
+    ds.partition_path('ESPN.com', 2022, 'passing').write_bytes(b'not parquet')
+    assert plan.collect().rows() == [('Patrick Mahomes', 300)]
+
+
+def test_query_joins_aggregate_views_and_extra_frames(tmp_path):
+    """Aggregate views and caller-supplied frames are available as tables."""
+    ds = Dataset(tmp_path)
+    ds.upsert(_season(2024))
+    divisions = pl.DataFrame({'team': ['KC', 'BUF'], 'division': ['AFC West', 'AFC East']})
+    out = query(
+        'SELECT d.division, t.yards FROM team_season t JOIN divisions d ON t.team = d.team '
+        'ORDER BY t.yards DESC',
+        tmp_path,
+        divisions=divisions,
+    )
+    assert out.rows() == [('AFC West', 300), ('AFC East', 250)]
@@ -0,0 +1,53 @@
+import httpx
+import polars as pl
+
+from nfl_webscraper import api
+from nfl_webscraper.reshape import split_categories, to_long
+from nfl_webscraper.schema import unify_frames
+
+PASSING = pl.DataFrame({
+    'Player': ['Joe Burrow'], 'Pass Yds': ['4,918'], 'TD': ['43'],
+    'year': [2024], 'category': ['passing'], 'source': ['NFL.com'],
+})
+PUNTING = pl.DataFrame({
+    'Player': ['Logan Cooke'], 'Net Avg': ['43.1'], 'year': [2024],
+    'category': ['punting'], 'source': ['NFL.com'],
+})
+
+
+def test_split_categories_keeps_only_each_categorys_columns():
+    """A punting frame split off the wide table carries no passing columns."""
+    frames = split_categories(unify_frames([PASSING, PUNTING]))
+    assert sorted(frames) == ['passing', 'punting']
+    assert 'Pass Yds' not in frames['punting'].columns
+    assert 'Net Avg' not in frames['passing'].columns
+
+
+def test_to_long_parses_text_cells():
+    """Every stat becomes one (entity, stat, value) row; NFL.com text is parsed."""
+    long = to_long(unify_frames([PASSING, PUNTING]))
+    assert long.select('entity', 'category', 'stat', 'value').sort('stat').rows() == [
+        ('Logan Cooke', 'punting', 'Net Avg', 43.1),
+        ('Joe Burrow', 'passing', 'Pass Yds', 4918.0),
+        ('Joe Burrow', 'passing', 'TD', 43.0),
+    ]
+    assert long.schema['year'] == pl.Int16
+
+
+def test_scrape_layouts(mock_client, espn_html, monkeypatch):
+    """layout='categories' and 'long' group unit frames without a wide union."""
+    clients = iter([
+        mock_client(lambda request: httpx.Response(200, text=espn_html())) for _ in range(2)
+    ])
+    monkeypatch.setattr(api.httpx, 'AsyncClient', lambda: next(clients))
+    options = dict(sites='espn.com', categories=['passing'], weeks=[1, 2],
+                   season_types=['regular'])
+
+    frames = api.get_all_player_stats([2024], **options, layout='categories')
+    assert list(frames) == ['passing']
+    assert frames['passing'].shape[0] == 4
+    long = api.get_all_player_stats([2024], **options, layout='long')
+    yards = long.filter(pl.col('stat') == 'yards', pl.col('entity') == 'Josh Allen')
+    assert yards.select('week', 'team', 'value').sort('week').rows() == [
+        (1, 'BUF', 250.0), (2, 'BUF', 250.0)
+    ]
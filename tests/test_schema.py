@@ -0,0 +1,63 @@
+import asyncio
+
+import httpx
+import polars as pl
+
+from nfl_webscraper.schema import SEASON_TYPE, SOURCE, unify_frames
+from nfl_webscraper.sites.espn_com import ESPNScraper
+from nfl_webscraper.store import Dataset
+
+
+def test_espn_frames_use_registry_types(mock_client, espn_html):
+    """ESPN rows are built with declared dtypes instead of inferred ones."""
+    client = mock_client(lambda request: httpx.Response(200, text=espn_html()))
+    df = asyncio.run(ESPNScraper().get_player_stats(client, [2024], categories=['passing'], weeks=[1, 2]))
+    assert df.schema['source'] == SOURCE
+    assert df.schema['season_type'] == SEASON_TYPE
+    assert df.schema['category'] == pl.Categorical()
+    assert df.schema['team'] == pl.Categorical()
+    assert df.schema['yards'] == pl.Int16
+    assert df.schema['year'] == pl.Int16
+    assert df.schema['rating'] == pl.Float32
+
+
+def test_espn_half_sacks_survive_the_registry_types(mock_client, espn_html):
+    """Defensive sacks are fractional, so they are declared and parsed as floats."""
+    rows = [['1', 'Micah Parsons, LB', 'DAL', 'W 30-10', '5', '2', '7', '1.5', '1', '0', '0', '1',
+             '3']]
+    page = espn_html(rows, category='defensive')
+    client = mock_client(lambda request: httpx.Response(200, text=page))
+    df = asyncio.run(ESPNScraper().get_player_stats(
+        client, [2024], categories=['defensive'], weeks=[1], season_types=['regular']
+    ))
+    assert df.schema['sacks'] == pl.Float32
+    assert df['sacks'].to_list() == [1.5]
+
+
+def test_unify_casts_to_registry_regardless_of_frame_order():
+    """The first frame no longer decides a column's type; unknown columns keep theirs."""
+    nfl = pl.DataFrame({'Player': ['Joe Burrow'], 'Pass Yds': ['4,183'], 'year': [2023],
+                        'category': ['passing'], 'source': ['NFL.com']})
+    espn = pl.DataFrame({'player': ['Josh Allen'], 'yards': [250], 'week': [None], 'year': [2024],
+                         'category': ['passing'], 'source': ['ESPN.com']})
+    for frames in ([nfl, espn], [espn, nfl]):
+        df = unify_frames(frames)
+        assert df.schema['year'] == pl.Int16
+        assert df.schema['week'] == pl.Int8
+        assert df.schema['source'] == SOURCE
+        assert df.schema['Pass Yds'] == pl.Utf8
+        assert df['source'].to_list() == [f['source'][0] for f in frames]
+
+
+def test_encoded_columns_round_trip_through_the_store(tmp_path):
+    """Enum/Categorical columns keep stable row hashes and Parquet types."""
+    df = unify_frames([pl.DataFrame({
+        'player': ['Patrick Mahomes'], 'team': ['KC'], 'yards': [300], 'year': [2024],
+        'week': [1], 'season_type': ['regular'], 'category': ['passing'], 'source': ['ESPN.com'],
+    })])
+    ds = Dataset(tmp_path)
+    assert ds.upsert(df).inserted.shape[0] == 1
+    assert ds.upsert(df).unchanged == 1
+    stored = ds.scan().collect()
+    assert stored.schema['team'] == pl.Categorical()
+    assert stored.schema['season_type'] == SEASON_TYPE
@@ -0,0 +1,73 @@
+import polars as pl
+import pytest
+
+from nfl_webscraper.scoring import HALF_PPR, PPR, STANDARD, Bonus, score, total_points
+
+
+def _espn_week():
+    return pl.DataFrame({
+        'player': ['Josh Allen', 'Josh Allen', 'Stefon Diggs'],
+        'category': ['passing', 'rushing', 'receiving'],
+        'yards': [300, 20, 100],
+        'touchdowns': [3, 1, 1],
+        'interceptions': [1, None, None],
+        'receptions': [None, None, 8],
+        'year': [2024] * 3,
+        'week': [1] * 3,
+        'season_type': ['regular'] * 3,
+        'source': ['ESPN.com'] * 3,
+    })
+
+
+def test_presets_score_every_row_in_one_pass():
+    """Standard/half-PPR/PPR columns differ only by receptions; totals sum categories."""
+    scored = score(_espn_week())
+    assert scored['points_standard'].to_list() == pytest.approx([22.0, 8.0, 16.0])
+    assert scored['points_half_ppr'].to_list() == pytest.approx([22.0, 8.0, 20.0])
+    assert scored['points_ppr'].to_list() == pytest.approx([22.0, 8.0, 24.0])
+
+    totals = total_points(scored)
+    assert totals['player'].to_list() == ['Josh Allen', 'Stefon Diggs']
+    assert totals['points_standard'].to_list() == pytest.approx([30.0, 16.0])
+
+
+def test_totals_keep_same_named_players_on_different_teams_apart():
+    """Two players sharing a name in one week are totalled per team."""
+    week = pl.DataFrame({
+        'player': ['Josh Allen', 'Josh Allen', 'Josh Allen'],
+        'team': ['BUF', 'BUF', 'JAX'],
+        'category': ['passing', 'rushing', 'defensive'],
+        'yards': [300, 20, None],
+        'touchdowns': [3, 1, None],
+        'year': [2024] * 3,
+        'week': [1] * 3,
+        'source': ['ESPN.com'] * 3,
+    })
+    totals = total_points(score(week, STANDARD))
+    assert totals['team'].to_list() == ['BUF', 'JAX']
+    assert totals['points_standard'].to_list() == pytest.approx([32.0, 0.0])
+
+
+def test_nfl_string_columns_and_custom_bonus_score_lazily():
+    """NFL.com string cells are parsed; bonuses apply past their threshold."""
+    nfl = pl.LazyFrame({
+        'Player': ['Joe Burrow', 'Backup QB'],
+        'category': ['passing', 'passing'],
+        'Pass Yds': ['4,183', '512'],
+        'TD': ['35', '2'],
+        'INT': ['11', '--'],
+    })
+    custom = PPR.extend('bonus', bonuses=[Bonus('passing', 'Pass Yds', 4000, 10)])
+    scored = score(nfl, [STANDARD, custom])
+    assert isinstance(scored, pl.LazyFrame)
+    out = scored.collect()
+    assert out['points_standard'].to_list() == pytest.approx([285.32, 28.48])
+    assert out['points_bonus'].to_list() == pytest.approx([295.32, 28.48])
+
+
+def test_extend_overrides_weights_without_touching_base():
+    """Deriving a ruleset leaves the preset it came from unchanged."""
+    six_point_passing = STANDARD.extend('six', {'passing': {'touchdowns': 6}})
+    assert six_point_passing.weights['passing']['touchdowns'] == 6
+    assert STANDARD.weights['passing']['touchdowns'] == 4
+    assert 'receptions' in HALF_PPR.weights['receiving']
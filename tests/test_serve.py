@@ -0,0 +1,75 @@
+import asyncio
+import io
+import json
+from datetime import date
+from urllib.request import urlopen
+
+import httpx
+import polars as pl
+
+from nfl_webscraper import api
+from nfl_webscraper.serve import HotTable, StatsServer, current_week, refresh
+
+
+def test_current_week_follows_the_calendar():
+    """Weeks count from the Thursday after Labor Day; January belongs to last season."""
+    assert current_week(date(2024, 9, 5)) == (2024, 'regular', 1)
+    assert current_week(date(2024, 9, 16)) == (2024, 'regular', 2)
+    assert current_week(date(2025, 1, 12)) == (2024, 'postseason', 1)
+    assert current_week(date(2025, 6, 1)) == (2025, 'regular', 1)
+
+
+def test_refresh_replaces_only_the_current_week(mock_client, espn_html, monkeypatch):
+    """A refresh fetches one week and swaps that slice; older weeks stay hot."""
+    clients = iter([
+        mock_client(lambda request: httpx.Response(200, text=espn_html())) for _ in range(2)
+    ])
+    monkeypatch.setattr(api.httpx, 'AsyncClient', lambda: next(clients))
+    old = api.get_all_player_stats(
+        [2024], sites='espn.com', categories=['passing'], weeks=[1, 2], season_types=['regular']
+    )
+    hot = HotTable(old.with_columns(pl.col('yards') - 1))
+
+    rows = asyncio.run(refresh(hot, ['espn.com'], categories=['passing'],
+                               today=date(2024, 9, 16)))
+    assert rows == 2
+    assert hot.version == 1
+    yards = hot.frame.sort('week', 'player').select('week', 'yards').rows()
+    assert yards == [(1, 249), (1, 299), (2, 250), (2, 300)]
+
+
+def test_partial_refresh_keeps_categories_it_did_not_fetch(mock_client, espn_html, monkeypatch):
+    """Refreshing one category of the current week leaves its other categories hot."""
+    clients = iter([
+        mock_client(lambda request: httpx.Response(200, text=espn_html())) for _ in range(2)
+    ])
+    monkeypatch.setattr(api.httpx, 'AsyncClient', lambda: next(clients))
+    old = api.get_all_player_stats(
+        [2024], sites='espn.com', categories=['passing', 'rushing'], weeks=[2],
+        season_types=['regular'],
+    )
+    hot = HotTable(old.with_columns(pl.col('yards') - 1))
+
+    asyncio.run(refresh(hot, ['espn.com'], categories=['passing'], today=date(2024, 9, 16)))
+    yards = hot.frame.sort('category', 'player').select('category', 'yards').rows()
+    assert yards == [('passing', 250), ('passing', 300), ('rushing', 249), ('rushing', 299)]
+    assert hot.read({'player': 'Josh Allen', 'category': 'rushing'})['yards'].to_list() == [249]
+
+
+def test_server_answers_json_and_arrow():
+    """Filtered reads come back as JSON rows or an Arrow IPC stream."""
+    hot = HotTable()
+    hot.update(pl.DataFrame({
+        'source': ['ESPN.com', 'ESPN.com'], 'year': [2024, 2024], 'week': [1, 1],
+        'season_type': ['regular', 'regular'], 'player': ['Josh Allen', 'Patrick Mahomes'],
+        'yards': [250, 300],
+    }))
+    with StatsServer(hot, port=0) as server:
+        base = 'http://{}:{}'.format(*server.address)
+        with urlopen(f'{base}/stats?player=Josh%20Allen') as resp:
+            assert [row['yards'] for row in json.loads(resp.read())] == [250]
+        with urlopen(f'{base}/stats?week=1&format=arrow') as resp:
+            frame = pl.read_ipc_stream(io.BytesIO(resp.read()))
+        assert frame.shape == (2, 6)
+        with urlopen(f'{base}/health') as resp:
+            assert json.loads(resp.read())['rows'] == 2
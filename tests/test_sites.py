@@ -0,0 +1,158 @@
+import asyncio
+
+import httpx
+import polars as pl
+
+from nfl_webscraper import api
+from nfl_webscraper.aggregates import team_season
+from nfl_webscraper.failures import FailureManifest
+from nfl_webscraper.sites import ESPNScraper, NFLComScraper
+
+
+def test_espn_plan_is_deterministic():
+    """ESPN units are enumerated without any requests when years are given."""
+    units = asyncio.run(ESPNScraper().plan_units(None, [2023, 2024], player=True))
+    assert len(units) == 2 * 4 * (18 + 5)
+    assert len({u.key for u in units}) == len(units)
+    assert units[0].url == 'https://www.espn.com/nfl/weekly/leaders/_/week/1/seasontype/2/type/passing/year/2023'
+
+
+def test_nfl_plan_and_fetch(mock_client, nfl_site):
+    """NFL.com units come from discovery and fetch with context columns attached."""
+    client = mock_client(nfl_site)
+    scraper = NFLComScraper()
+    units = asyncio.run(scraper.plan_units(client, [2024], player=True, categories=['Passing']))
+    assert [(u.year, u.category) for u in units] == [(2024, 'passing')]
+    df = asyncio.run(scraper.get_player_stats(client, [2024]))
+    assert sorted(df['category'].to_list()) == ['passing', 'rushing']
+    assert set(df['source'].to_list()) == {'NFL.com'}
+    assert df.filter(df['category'] == 'passing')['Player'].to_list() == ['Joe Burrow']
+
+
+def test_nfl_plan_skips_requested_categories_without_links(mock_client, nfl_site, caplog):
+    """A requested category missing from the year page is skipped, not filled with passing."""
+    client = mock_client(nfl_site)
+    options = dict(player=True, categories=['punting', 'rushing'])
+    units = asyncio.run(NFLComScraper().plan_units(client, [2024], **options))
+    assert [u.category for u in units] == ['rushing']
+    assert 'no link for punting' in caplog.text
+
+    manifest = FailureManifest()
+    asyncio.run(NFLComScraper().plan_units(client, [2024], failures=manifest, **options))
+    assert manifest.frame.select('category', 'stage').rows() == [('punting', 'discovery')]
+
+
+def test_query_pushdown_prunes_requests(mock_client, espn_html):
+    """A week-7 receiving query makes one request and keeps only projected columns."""
+    client = mock_client(lambda request: httpx.Response(200, text=espn_html()))
+    df = asyncio.run(ESPNScraper().get_player_stats(
+        client, [2024], categories=['receiving'], weeks=[7], columns=['player', 'yards']
+    ))
+    assert client.requested == [
+        'https://www.espn.com/nfl/weekly/leaders/_/week/7/seasontype/2/type/receiving/year/2024'
+    ]
+    assert set(df.columns) == {'player', 'yards', 'year', 'week', 'season_type', 'category', 'source'}
+    assert df['yards'].to_list() == [300, 250]
+
+
+def test_nfl_plan_is_empty_for_weekly_queries(mock_client, nfl_site):
+    """NFL.com only has season totals, so weekly or postseason queries cost nothing."""
+    client = mock_client(nfl_site)
+    scraper = NFLComScraper()
+    assert asyncio.run(scraper.plan_units(client, [2024], player=True, weeks=[7])) == []
+    assert asyncio.run(scraper.plan_units(
+        client, [2024], player=True, season_types=['postseason']
+    )) == []
+    assert client.requested == []
+    df = asyncio.run(scraper.get_player_stats(client, [2024], columns=['Player', 'TD']))
+    assert set(df.columns) == {'Player', 'TD', 'year', 'category', 'source'}
+
+
+def test_espn_keeps_player_position(mock_client, espn_html):
+    """The "Name, POS" player cell is split into player and position columns."""
+    client = mock_client(lambda request: httpx.Response(200, text=espn_html()))
+    df = asyncio.run(ESPNScraper().get_player_stats(
+        client, [2024], categories=['passing'], weeks=[1], season_types=['regular']
+    ))
+    assert df['player'].to_list() == ['Patrick Mahomes', 'Josh Allen']
+    assert df['position'].to_list() == ['QB', 'QB']
+
+
+def test_espn_json_strategy_matches_html(mock_client, espn_html, espn_json):
+    """The JSON strategy reads a stand-in endpoint and yields the HTML strategy's schema."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == 'stand-in.test':
+            return httpx.Response(200, json=espn_json())
+        return httpx.Response(200, text=espn_html())
+
+    options = dict(categories=['passing'], weeks=[1], season_types=['regular'])
+    client = mock_client(handler)
+    html = asyncio.run(ESPNScraper().get_player_stats(client, [2024], **options))
+    scraper = ESPNScraper(strategy='json', json_url='http://stand-in.test/byathlete')
+    decoded = asyncio.run(scraper.get_player_stats(client, [2024], **options))
+
+    json_url = client.requested[-1]
+    assert json_url.startswith('http://stand-in.test/byathlete?')
+    assert 'category=passing' in json_url and 'season=2024' in json_url
+    shared = [c for c in html.columns if c != 'result']
+    assert decoded.columns == shared
+    assert decoded.equals(html.select(shared))
+
+
+def test_espn_json_strategy_matches_html_for_defense(mock_client, espn_html, espn_json):
+    """Defensive leaders decode alike too: half sacks, and undeclared columns (STUFFS) as text."""
+    rows = [
+        ['1', 'Micah Parsons, LB', 'DAL', 'W 30-10', '5', '2', '7', '1.5', '1', '0', '0', '1', '3'],
+        ['2', 'Fred Warner, LB', 'SF', 'L 10-30', '9', '4', '13', '0', '0', '1', '1', '2', '0'],
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == 'stand-in.test':
+            return httpx.Response(200, json=espn_json(rows, category='defensive'))
+        return httpx.Response(200, text=espn_html(rows, category='defensive'))
+
+    options = dict(categories=['defensive'], weeks=[1], season_types=['regular'])
+    client = mock_client(handler)
+    html = asyncio.run(ESPNScraper().get_player_stats(client, [2024], **options))
+    scraper = ESPNScraper(strategy='json', json_url='http://stand-in.test/byathlete')
+    decoded = asyncio.run(scraper.get_player_stats(client, [2024], **options))
+
+    shared = [c for c in html.columns if c != 'result']
+    assert decoded.equals(html.select(shared))
+    assert decoded.schema['tot'] == pl.Int16
+    assert decoded['sacks'].to_list() == [1.5, 0.0]
+    assert decoded.schema['stuffs'] == pl.Utf8
+    assert decoded['stuffs'].to_list() == ['3', '0']
+
+
+def test_espn_team_stats_group_player_rows(mock_client, espn_html, espn_passing_rows):
+    """Team rows sum the listed players per team and parse the game result."""
+    rows = [
+        *espn_passing_rows,
+        ['3', 'Carson Wentz, QB', 'KC', 'W 27-20', '2', '3', '20', '0', '0', '0', '0', '80.1'],
+    ]
+    client = mock_client(lambda request: httpx.Response(200, text=espn_html(rows)))
+    df = asyncio.run(ESPNScraper().get_team_stats(
+        client, [2024], categories=['passing'], weeks=[1], season_types=['regular']
+    ))
+    assert df.sort('team').select(
+        'team', 'players', 'yards', 'result', 'points_for', 'points_against'
+    ).rows() == [('BUF', 1, 250, 'L', 17, 24), ('KC', 2, 320, 'W', 27, 20)]
+
+
+def test_get_all_stats_derives_espn_teams_from_player_pages(mock_client, espn_html, monkeypatch):
+    """Requesting players and teams together fetches each ESPN page once."""
+    client = mock_client(lambda request: httpx.Response(200, text=espn_html()))
+    monkeypatch.setattr(api.httpx, 'AsyncClient', lambda: client)
+    players, teams = api.get_all_stats(
+        [2024], sites='espn.com', categories=['passing'], weeks=[1, 2], season_types=['regular']
+    )
+    assert len(client.requested) == 2
+    assert players.shape[0] == 4
+    assert sorted(teams.select('week', 'team').rows()) == [
+        (1, 'BUF'), (1, 'KC'), (2, 'BUF'), (2, 'KC')
+    ]
+    season = team_season(players).filter(pl.col('team') == 'KC')
+    assert season.select('games', 'wins', 'losses', 'points_for', 'yards').rows() == [
+        (2, 2, 0, 54, 600)
+    ]
@@ -0,0 +1,52 @@
+import httpx
+import polars as pl
+import pytest
+
+from nfl_webscraper import api
+from nfl_webscraper.spill import Spill
+
+
+def test_spill_scan_unifies_files(tmp_path):
+    """Frames with different columns spill to separate files and scan back unified."""
+    spill = Spill(tmp_path / 'spill', budget=0)
+    spill.add(pl.DataFrame({'year': [2024], 'category': ['passing'], 'YDS': [300]}))
+    spill.add(pl.DataFrame({'year': [2024], 'category': ['rushing'], 'CAR': [20]}))
+    spill.add(pl.DataFrame([]))
+    assert len(spill.files) == 2
+    out = spill.scan().collect()
+    assert out.columns == ['year', 'category', 'CAR', 'YDS']
+    assert out.schema['year'] == pl.Int16
+    assert out.select('CAR', 'YDS').rows() == [(None, 300), (20, None)]
+
+
+def test_spilled_scrape_streams_the_export(tmp_path, mock_client, espn_html, monkeypatch):
+    """spill=True returns a lazy scan of the streamed export matching the in-memory result."""
+    clients = iter([
+        mock_client(lambda request: httpx.Response(200, text=espn_html())) for _ in range(2)
+    ])
+    monkeypatch.setattr(api.httpx, 'AsyncClient', lambda: next(clients))
+    options = dict(sites='espn.com', categories=['passing'], weeks=[1, 2, 3],
+                   season_types=['regular'])
+    eager = api.get_all_player_stats([2024], **options)
+
+    out = tmp_path / 'players.parquet'
+    lazy = api.get_all_player_stats(
+        [2024], **options, spill=True, memory_budget=0, export='parquet', filename=str(out)
+    )
+    assert isinstance(lazy, pl.LazyFrame)
+    streamed = lazy.collect()
+    assert streamed.schema == eager.schema
+    assert streamed.sort('week', 'player').equals(eager.sort('week', 'player'))
+
+
+def test_temporary_spill_needs_an_export(tmp_path, mock_client, espn_html, monkeypatch):
+    """spill=True without an export is rejected; a spill directory is scanned and kept."""
+    client = mock_client(lambda request: httpx.Response(200, text=espn_html()))
+    monkeypatch.setattr(api.httpx, 'AsyncClient', lambda: client)
+    options = dict(sites='espn.com', categories=['passing'], weeks=[1], season_types=['regular'])
+    with pytest.raises(ValueError, match='spill=True needs export'):
+        api.get_all_player_stats([2024], **options, spill=True)
+
+    lazy = api.get_all_player_stats([2024], **options, spill=tmp_path / 'spill')
+    assert lazy.collect()['player'].to_list() == ['Patrick Mahomes', 'Josh Allen']
+    assert list((tmp_path / 'spill').iterdir())
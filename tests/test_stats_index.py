@@ -0,0 +1,68 @@
+import polars as pl
+
+from nfl_webscraper.schema import conform
+from nfl_webscraper.stats_index import StatsIndex
+
+
+def _week(week, yards, category='passing'):
+    return conform(pl.DataFrame({
+        'source': ['ESPN.com'] * 3, 'year': [2024] * 3, 'season_type': ['regular'] * 3,
+        'week': [week] * 3, 'category': [category] * 3,
+        'player': ['Travis Kelce', 'Josh Allen', 'Patrick Mahomes'],
+        'team': ['KC', 'BUF', 'KC'], 'yards': yards,
+    }))
+
+
+def test_lookups_by_player_team_and_week_range():
+    """Point lookups, team lookups and week ranges come from the indexes."""
+    index = StatsIndex(pl.concat([_week(1, [80, 250, 300]), _week(2, [60, 200, 280])]))
+    assert len(index) == 6
+    block = index._blocks[('ESPN.com', 2024, 'regular', 1, 'passing')]
+    assert block['player'].to_list() == ['Josh Allen', 'Patrick Mahomes', 'Travis Kelce']
+    assert block['player'].flags['SORTED_ASC']
+
+    one = index.get('Josh Allen', source='ESPN.com', year=2024, season_type='regular', week=2)
+    assert one['yards'].to_list() == [200]
+    assert index.get('Patrick Mahomes')['yards'].to_list() == [300, 280]
+    assert index.get('Patrick Mahomes', week=range(2, 3))['week'].to_list() == [2]
+    assert sorted(index.team('KC', week=1)['player'].to_list()) == [
+        'Patrick Mahomes', 'Travis Kelce'
+    ]
+    assert index.get('Nobody').shape[0] == 0
+
+
+def test_rows_without_a_player_name_leave_the_name_column_unflagged():
+    """A row keyed by its team instead of a name keeps `player` out of sorted order."""
+    frame = _week(1, [80, 250, 300]).with_columns(
+        pl.when(pl.col('player') == 'Josh Allen').then(None).otherwise(pl.col('player'))
+        .alias('player')
+    )
+    index = StatsIndex(frame)
+    block = index._blocks[('ESPN.com', 2024, 'regular', 1, 'passing')]
+    assert block['player'].to_list() == [None, 'Patrick Mahomes', 'Travis Kelce']
+    assert not block['player'].flags['SORTED_ASC']
+    assert index.get('BUF')['yards'].to_list() == [250]
+    assert index.get('Travis Kelce')['yards'].to_list() == [80]
+
+
+def test_update_reindexes_only_refreshed_blocks():
+    """Refreshing week 2 leaves week 1's block and index untouched."""
+    index = StatsIndex(pl.concat([_week(1, [80, 250, 300]), _week(2, [60, 200, 280])]))
+    week1 = index._blocks[('ESPN.com', 2024, 'regular', 1, 'passing')]
+    replaced = index.update(_week(2, [61, 201, 281]).head(2))
+    assert replaced == {('ESPN.com', 2024, 'regular', 2, 'passing')}
+    assert index._blocks[('ESPN.com', 2024, 'regular', 1, 'passing')] is week1
+    assert index.get('Josh Allen')['yards'].to_list() == [250, 201]
+    assert index.get('Patrick Mahomes')['week'].to_list() == [1]
+    assert index.frame.shape[0] == 5
+
+
+def test_partial_refresh_keeps_other_categories_of_the_week():
+    """Refreshing only passing for a week leaves that week's rushing rows in place."""
+    index = StatsIndex(pl.concat([_week(2, [60, 200, 280]), _week(2, [5, 40, 30], 'rushing')]))
+    index.update(_week(2, [61, 201, 281]))
+    allen = index.get('Josh Allen', week=2)
+    assert sorted(allen.select('category', 'yards').rows()) == [
+        ('passing', 201), ('rushing', 40)
+    ]
+    assert index.get('Josh Allen', week=2, category='rushing')['yards'].to_list() == [40]
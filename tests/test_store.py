@@ -0,0 +1,117 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import polars as pl
+
+import nfl_webscraper
+from nfl_webscraper.store import Dataset, with_row_hash
+
+
+def _espn(yards):
+    return pl.DataFrame({
+        'player': ['Patrick Mahomes', 'Josh Allen'],
+        'team': ['KC', 'BUF'],
+        'yards': yards,
+        'year': [2024, 2024],
+        'week': [3, 3],
+        'season_type': ['regular', 'regular'],
+        'category': ['passing', 'passing'],
+        'source': ['ESPN.com', 'ESPN.com'],
+    })
+
+
+def test_upsert_reports_inserted_updated_unchanged(tmp_path):
+    """A stat correction shows up as a single updated row."""
+    ds = Dataset(tmp_path)
+    first = ds.upsert(_espn([300, 250]))
+    assert first.inserted.shape[0] == 2 and first.unchanged == 0
+
+    again = ds.upsert(_espn([300, 250]))
+    assert not again and again.unchanged == 2
+
+    corrected = ds.upsert(_espn([300, 262]))
+    assert corrected.inserted.shape[0] == 0
+    assert corrected.updated['player'].to_list() == ['Josh Allen']
+    assert corrected.updated['yards'].to_list() == [262]
+    assert sorted(ds.read()['yards'].to_list()) == [262, 300]
+
+
+def test_row_hash_ignores_width_encoding_and_column_order():
+    """Row hashes depend on the values, not their declared width, encoding or column order."""
+    frame = pl.DataFrame({'player': ['A', 'B'], 'yards': [12, None], 'avg': [1.5, 2.0],
+                          'pos': ['QB', 'RB']})
+    narrow = frame.select(
+        'pos', pl.col('avg').cast(pl.Float32), pl.col('yards').cast(pl.Int16), 'player'
+    ).with_columns(pl.col('pos').cast(pl.Categorical))
+    hashes = with_row_hash(frame, ['player'])['_row_hash']
+    assert hashes.equals(with_row_hash(narrow, ['player'])['_row_hash'])
+    assert hashes[0] != hashes[1]
+    wider = frame.with_columns(pl.lit(None, dtype=pl.Utf8).alias('note'))
+    assert not hashes.equals(with_row_hash(wider, ['player'])['_row_hash'])
+
+
+def test_row_hash_is_the_same_in_another_process():
+    """Hashes stored by one run match the ones the next run computes."""
+    code = (
+        'import polars as pl\n'
+        'from nfl_webscraper.store import with_row_hash\n'
+        "frame = pl.DataFrame({'player': ['A'], 'yards': [12], 'avg': [1.5], 'pos': ['QB']})\n"
+        "print(with_row_hash(frame, ['player'])['_row_hash'][0])\n"
+    )
+    env = {**os.environ, 'PYTHONPATH': str(Path(nfl_webscraper.__file__).parents[1])}
+    run = subprocess.run(
+        [sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True
+    )
+    frame = pl.DataFrame({'player': ['A'], 'yards': [12], 'avg': [1.5], 'pos': ['QB']})
+    assert int(run.stdout) == with_row_hash(frame, ['player'])['_row_hash'][0]
+
+
+def test_upsert_only_rewrites_changed_partitions(tmp_path):
+    """Partitions without changes keep their files; scans restore partition columns."""
+    ds = Dataset(tmp_path)
+    nfl = pl.DataFrame({
+        'Player': ['Justin Tucker'], 'FGM': ['30'],
+        'year': [2024], 'category': ['field goals'], 'source': ['NFL.com'],
+    })
+    ds.upsert(pl.concat([_espn([300, 250]), nfl], how='diagonal_relaxed'))
+    nfl_part = ds.partition_path('NFL.com', 2024, 'field goals')
+    mtime = nfl_part.stat().st_mtime_ns
+    ds.upsert(_espn([301, 250]))
+    assert nfl_part.stat().st_mtime_ns == mtime
+    kickers = ds.scan().filter(pl.col('category') == 'field goals').collect()
+    assert kickers['Player'].to_list() == ['Justin Tucker']
+    assert kickers['source'].to_list() == ['NFL.com']
+    assert 'week' not in ds.read_partition(nfl_part).columns
+
+
+def test_plain_upsert_after_compacting_one_widens_recorded_types(tmp_path):
+    """A wider value written without compact widens the record, so scans still work."""
+    ds = Dataset(tmp_path)
+    ds.upsert(_espn([1, 2]), compact=True)
+    assert ds.recorded_dtypes()['yards'] == pl.Int8
+    ds.upsert(_espn([1000, 2]).with_columns(category=pl.lit('rushing')))
+    assert ds.recorded_dtypes()['yards'] == pl.Int64
+    stored = ds.scan().collect()
+    assert sorted(stored['yards'].to_list()) == [1, 2, 2, 1000]
+
+
+def test_scan_reads_the_cached_schema_not_every_footer(tmp_path, monkeypatch):
+    """scan() opens only _schema.parquet; columns added by later upserts are cached too."""
+    ds = Dataset(tmp_path)
+    ds.upsert(_espn([300, 250]))
+    ds.upsert(_espn([90, 80]).with_columns(category=pl.lit('rushing'), carries=pl.lit(20)))
+    opened = []
+    read_schema = pl.read_parquet_schema
+
+    def counted(path):
+        opened.append(path)
+        return read_schema(path)
+
+    monkeypatch.setattr(pl, 'read_parquet_schema', counted)
+    lazy = ds.scan()
+    assert [p.name for p in opened] == ['_schema.parquet']
+    assert 'carries' in lazy.collect_schema()
+    rushing = lazy.filter(pl.col('category') == 'rushing').collect()
+    assert rushing['carries'].to_list() == [20, 20]
@@ -0,0 +1,61 @@
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from nfl_webscraper.schema import conform
+from nfl_webscraper.trends import Trends, add_trends, update_trends
+
+TRENDS = Trends(('yards',), windows=(2,), half_life=1.0)
+
+
+def _weeks(yards_by_week, season_type='regular'):
+    rows = [
+        {
+            'source': 'ESPN.com', 'year': 2024, 'season_type': season_type, 'week': week,
+            'category': 'passing', 'player': player, 'position': 'QB', 'yards': yards,
+        }
+        for week, players in yards_by_week.items()
+        for player, yards in players.items()
+    ]
+    return conform(pl.DataFrame(rows))
+
+
+WEEKS = {1: {'A': 100, 'B': 300}, 2: {'A': 200, 'B': 100}, 3: {'A': 300}}
+
+
+def _sorted(frame):
+    return frame.sort('season_type', 'week', 'player')
+
+
+def test_rolling_ewm_season_and_rank_columns():
+    """Windows follow each player in week order; ranks are per week."""
+    out = _sorted(add_trends(_weeks(WEEKS), TRENDS)).filter(pl.col('player') == 'A')
+    assert out['yards_mean_2'].to_list() == [100, 150, 250]
+    assert out['yards_sum_2'].to_list() == [100, 300, 500]
+    assert out['yards_season'].to_list() == [100, 300, 600]
+    assert out['yards_rank'].to_list() == [2, 1, 1]
+    # alpha = 0.5 for a half-life of one week
+    assert out['yards_ewm'].to_list() == [100, 150, 225]
+
+
+def test_lazy_frame_stays_lazy():
+    """A LazyFrame gets the same columns without being collected."""
+    lazy = add_trends(_weeks(WEEKS).lazy(), TRENDS)
+    assert isinstance(lazy, pl.LazyFrame)
+    assert_frame_equal(lazy.collect(), add_trends(_weeks(WEEKS), TRENDS))
+
+
+def test_update_matches_full_recompute():
+    """Adding a week or correcting an old one equals recomputing everything."""
+    previous = add_trends(_weeks({1: WEEKS[1], 2: WEEKS[2]}), TRENDS)
+    updated = update_trends(previous, _weeks({3: WEEKS[3]}), TRENDS)
+    assert_frame_equal(_sorted(updated), _sorted(add_trends(_weeks(WEEKS), TRENDS)))
+
+    corrected = {**WEEKS, 1: {'A': 150, 'B': 300}}
+    updated = update_trends(updated, _weeks({1: corrected[1]}), TRENDS)
+    assert_frame_equal(_sorted(updated), _sorted(add_trends(_weeks(corrected), TRENDS)))
+
+    playoffs = update_trends(updated, _weeks({1: {'A': 50}}, 'postseason'), TRENDS)
+    last = _sorted(playoffs).row(-1, named=True)
+    assert (last['season_type'], last['yards_mean_2'], last['yards_season']) == (
+        'postseason', 175, 700
+    )
@@ -0,0 +1,65 @@
+import asyncio
+
+import httpx
+import polars as pl
+
+from nfl_webscraper.sites import ESPNScraper
+from nfl_webscraper.workqueue import WorkQueue, run_worker
+
+
+def _units(n=3):
+    plan = ESPNScraper().plan_units(None, [2024], player=True, categories=['passing'])
+    return asyncio.run(plan)[:n]
+
+
+def test_enqueue_is_idempotent(tmp_path):
+    """Re-enqueueing the same units does not duplicate work."""
+    with WorkQueue(tmp_path / 'q.db') as queue:
+        assert queue.enqueue(_units()) == 3
+        assert queue.enqueue(_units()) == 0
+        assert queue.counts() == {'pending': 3}
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    """A unit whose lease is not renewed is handed to another worker."""
+    now = [1000.0]
+    with WorkQueue(tmp_path / 'q.db', lease_seconds=60, clock=lambda: now[0]) as queue:
+        queue.enqueue(_units(1))
+        (lease,) = queue.lease('dead-node')
+        assert queue.lease('live-node') == []
+        now[0] += 30
+        assert queue.heartbeat(lease)
+        now[0] += 61
+        (reclaimed,) = queue.lease('live-node')
+        assert reclaimed.unit == lease.unit
+        # The original owner lost its lease and cannot commit anymore
+        assert not queue.complete(lease, pl.DataFrame({'a': [1]}))
+        assert not queue.heartbeat(lease)
+
+
+def test_expired_leases_count_as_attempts(tmp_path):
+    """A unit whose worker keeps dying is parked once its attempts are used up."""
+    now = [1000.0]
+    with WorkQueue(
+        tmp_path / 'q.db', lease_seconds=60, max_attempts=2, clock=lambda: now[0]
+    ) as queue:
+        assert queue._conn.execute('PRAGMA journal_mode').fetchone() == ('delete',)
+        queue.enqueue(_units(1))
+        for _ in range(2):
+            assert len(queue.lease('crashing-node')) == 1
+            now[0] += 61
+        assert queue.lease('live-node') == []
+        assert queue.counts() == {'failed': 1}
+
+
+def test_worker_drains_queue(tmp_path, mock_client, espn_html):
+    """Workers fetch every unit and results merge into one frame."""
+    client = mock_client(lambda request: httpx.Response(200, text=espn_html()))
+    with WorkQueue(tmp_path / 'q.db') as queue:
+        queue.enqueue(_units(3))
+        assert asyncio.run(run_worker(queue, owner='w1', client=client)) == 3
+        assert queue.counts() == {'done': 3}
+        frame = queue.results()
+    assert frame.shape[0] == 6
+    assert sorted(frame['week'].unique().to_list()) == [1, 2, 3]
+    assert frame['player'].to_list()[:2] == ['Patrick Mahomes', 'Josh Allen']